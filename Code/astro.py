@@ -1,6 +1,8 @@
 import math
 from typing import Optional
 
+import numpy as np
+
 import location
 import times
 import tools
@@ -8,26 +10,50 @@ from calendars.gregorian_date import GregorianDate
 from location import Location
 
 EARTH_RADIUS = 6.372e6
+SUN_SEMI_DIAMETER = 16 / 60
 EVENING = False
+MORNING = True
+
+# Depression angles of the sun below the horizon at the ends of the twilights, degrees.
+CIVIL_TWILIGHT = 6
+NAUTICAL_TWILIGHT = 12
+ASTRONOMICAL_TWILIGHT = 18
+
+# The columns of the almanac: name, depression angle (None for sunrise and sunset, which take refraction into account),
+# and whether the event is in the morning.
+ALMANAC_EVENTS = [("astronomical_dawn", ASTRONOMICAL_TWILIGHT, MORNING),
+                  ("nautical_dawn", NAUTICAL_TWILIGHT, MORNING),
+                  ("civil_dawn", CIVIL_TWILIGHT, MORNING),
+                  ("sunrise", None, MORNING),
+                  ("sunset", None, EVENING),
+                  ("civil_dusk", CIVIL_TWILIGHT, EVENING),
+                  ("nautical_dusk", NAUTICAL_TWILIGHT, EVENING),
+                  ("astronomical_dusk", ASTRONOMICAL_TWILIGHT, EVENING)]
 
 def sunset(date: float, location: Location) -> float:
     '''
     UE (14.77)
     '''
-    # The extra 16' (0.0111111111111111d)  is needed because we	want the time when the upper
-    # limb of the sun first becomes visible.
-    alpha = refraction(date + 0.75, location) + 0.0111111111111111
-    return dusk(date, location, alpha)
+    return dusk(date, location, sunrise_depression(date + 0.75, location))
 
 def refraction(t: float, location: Location) -> float:
     '''
     The standard value of refraction, taking elevation into	account UE (14.75)
-    0.0236111111111111 = 34', 2.199074074074074e-4 = 19''.
+    34' of refraction, the dip of the horizon and 19'' per square root of a meter of elevation, in degrees.
+    The elevation of the location may be an array (see location.location_arrays): the result is then an array.
     '''
-    h = max(0.0, location.elevation)
-    dip = math.acos(EARTH_RADIUS / (EARTH_RADIUS + h))
+    h = np.maximum(0.0, location.elevation)
+    dip = np.arccos(EARTH_RADIUS / (EARTH_RADIUS + h)) / tools.DEGREE
+
+    return 34 / 60 + dip + 19 / 3600 * np.sqrt(h)
 
-    return 0.0236111111111111 + dip + 2.199074074074074e-4 * math.sqrt(h)
+def sunrise_depression(t: float, location: Location) -> float:
+    '''
+    The depression angle of sunrise and sunset, in degrees: refraction plus the sun's semi-diameter (16'),
+    because we want the time when the upper limb of the sun first becomes visible. UE (14.77)
+    The elevation of the location may be an array, as for refraction.
+    '''
+    return refraction(t, location) + SUN_SEMI_DIAMETER
 
 def dusk(date: float, location: Location, alpha: float) -> float:
     '''
@@ -35,6 +61,8 @@ def dusk(date: float, location: Location, alpha: float) -> float:
     '''
     result = moment_of_depression(date + 0.75, location, alpha, EVENING)
 
+    return None if result is None else times.local_to_standard(result, location)
+
 def moment_of_depression(approx: float, locale: Location, alpha: float, early: bool) -> Optional[float]:
     t = approx_moment_of_depression(approx, locale, alpha, early)
 
@@ -50,18 +78,12 @@ def approx_moment_of_depression(t: float, locale: Location, alpha: float, early:
     date = math.floor(t)
     try1 = sine_offset(t, locale, alpha)
     alt = date if alpha >= 0.0 and early else date + 1 if alpha >= 0 else date + 0.5
-    value = sine_offset(t, locale, alpha) if abs(try1) > 1 else try1
+    value = sine_offset(alt, locale, alpha) if abs(try1) > 1 else try1
 
     if abs(value) <= 1:
-        arg = date + 0.5 + tools.fmod(0.5 + math.asin(value) / (2 * math.pi), 1)
-        if early:
-            arg -=1
-        else:
-            arg += 1
+        offset = tools.fmod(0.5 + math.asin(value) / (2 * math.pi), 1) - 0.25
 
-        arg -= 0.25
-
-        return times.apparent_to_local(arg)
+        return times.apparent_to_local(date + 0.5 + (-offset if early else offset))
 
     else:
         return None
@@ -70,7 +92,129 @@ def sine_offset(t: float, locale: Location, alpha: float) -> float:
     t1 = times.local_to_universal(t, locale)
     delta = times.declination(t1, 0, times.solar_longitude(t1))
 
-    return tools.tand(locale.latitude) * math.tan(delta) + math.sin(alpha) / (math.cos(delta) * math.cos(locale.latitude))
+    return tools.tand(locale.latitude) * tools.tand(delta) + \
+        tools.sind(alpha) / (tools.cosd(delta) * tools.cosd(locale.latitude))
+
+def almanac(days, locations, iterations: int = 3):
+    '''
+    Daily almanac: the standard times of dawns, sunrise, sunset and dusks (the columns of ALMANAC_EVENTS)
+    for each of the days, by the sine offset of UE (14.72) solved for all days and events at once.
+    The solar state (declination and equation of time) is computed once per day, at universal noons,
+    for all the events and all the locations, and interpolated at the moments of the events.
+    :param days: Array of RD days.
+    :param locations: A location, or a sequence of locations.
+    :param iterations: The number of refinements of the moments of the events (each one in seconds of the previous).
+    :return: For a location, a structured array with a row per day: the RD day ("rd") and the standard times
+    of the events (NaN if the sun does not reach the depression angle that day); a list of these for a sequence.
+    '''
+    days = np.asarray(days, dtype=np.int64)
+    dtype = [("rd", np.int64)] + [(name, np.float64) for name, _, _ in ALMANAC_EVENTS]
+
+    single = isinstance(locations, Location)
+    locations = [locations] if single else list(locations)
+
+    noons, state = daily_solar_state(days) if days.size else (None, None)
+
+    early = np.array([morning for _, _, morning in ALMANAC_EVENTS])[:, np.newaxis]
+    result = []
+
+    for locale in locations:
+        table = np.empty(days.shape, dtype=dtype)
+        table["rd"] = days
+
+        if days.size:
+            sunrise_alpha = sunrise_depression(0, locale)
+            alpha = np.array([sunrise_alpha if depression is None else depression
+                              for _, depression, _ in ALMANAC_EVENTS])[:, np.newaxis]
+
+            moments = depression_moments(days, locale.latitude, locale.longitude, locale.zone, alpha, early,
+                                         noons, state, iterations)
+
+            for i, (name, _, _) in enumerate(ALMANAC_EVENTS):
+                table[name] = moments[i]
+
+        result.append(table)
+
+    return result[0] if single else result
+
+
+def depression_moments(days, latitude, longitude, zone, alpha, early, noons: np.ndarray,
+                       state: times.SolarState, iterations: int) -> np.ndarray:
+    '''
+    Vectorized moment_of_depression, broadcasting days, coordinates, depression angles and morning flags,
+    with the declinations and equations of time interpolated from the daily solar state.
+    UE (14.73).
+    :param days: Array of RD days.
+    :param latitude: Array of latitudes, degrees.
+    :param longitude: Array of longitudes, degrees.
+    :param zone: Array of time zones, hours.
+    :param alpha: Array of depression angles, degrees (negative for altitudes above the horizon).
+    :param early: Array of morning flags.
+    :param noons: The universal noons of the daily solar state (consecutive days around the days).
+    :param state: The solar state at the noons.
+    :param iterations: The number of refinements of the moments.
+    :return: Array of the standard times of the events, NaN where the sun does not reach the depression.
+    '''
+    tan_latitude = np.tan(tools.DEGREE * latitude)
+    sin_alpha = np.sin(tools.DEGREE * alpha) / np.cos(tools.DEGREE * latitude)
+    sign = np.where(early, -1 / (2 * math.pi), 1 / (2 * math.pi))
+    quarter = np.where(early, -0.25, 0.25)
+
+    # Within a day, the declination and the equation of time are linear in the time from noon (to 0.001°):
+    # they are interpolated once per day (and location), at the local noon.
+    days = np.asarray(days)
+    local_noon = days + 0.5 - np.asarray(longitude) / 360
+    declination = tools.DEGREE * interpolate_daily(local_noon, noons, state.declination)
+    declination_rate = tools.DEGREE * interpolate_daily(local_noon, noons, np.gradient(state.declination))
+
+    index = days - int(math.floor(noons[0]))
+    equation_of_time = state.equation_of_time[index]
+    mean_rate = 1 - np.gradient(state.equation_of_time)[index]
+
+    # The times of the events from noon, in local time.
+    shape = np.broadcast(days, latitude, longitude, zone, alpha, early).shape
+    u = np.broadcast_to(quarter, shape)
+
+    for _ in range(iterations + 1):
+        delta = declination + declination_rate * u
+        value = tan_latitude * np.tan(delta) + sin_alpha / np.cos(delta)
+
+        # NaN where the sun does not reach the depression (|value| > 1): the previous moment is kept.
+        with np.errstate(invalid="ignore"):
+            apparent = sign * np.arcsin(value) + quarter
+
+        valid = ~np.isnan(apparent)
+        u = np.where(valid, mean_rate * apparent - equation_of_time, u)
+
+    return np.where(valid, local_noon + u + zone / 24, np.nan)
+
+
+def daily_solar_state(days) -> (np.ndarray, times.SolarState):
+    '''
+    The solar state at the universal noons of the days (and of the days before and after them), computed once
+    to be interpolated at the moments of all the events of these days.
+    :param days: Array of RD days (not empty).
+    :return: The universal noons and the solar state at them.
+    '''
+    noons = np.arange(np.min(days) - 1, np.max(days) + 2) + 0.5
+
+    return noons, times.SolarState.at(noons)
+
+
+def interpolate_daily(t, noons: np.ndarray, values: np.ndarray) -> np.ndarray:
+    '''
+    Linear interpolation in a daily table (such as that of daily_solar_state): as np.interp, but indexing
+    the consecutive days directly instead of searching them.
+    :param t: Array of moments, within the table.
+    :param noons: The moments of the table, one per day.
+    :param values: The values at these moments.
+    :return: Array of the interpolated values.
+    '''
+    position = np.asarray(t, dtype=np.float64) - noons[0]
+    index = np.minimum(position.astype(np.int64), len(noons) - 2)
+
+    return values[index] + (position - index) * np.diff(values)[index]
+
 
 if __name__ == '__main__':
    gregorian = GregorianDate(1945, 11, 12)
@@ -0,0 +1,26 @@
+"""
+Benchmark: Arithmetic Persian bulk conversion (2820-year cycle table) versus the scalar from_rd path.
+Run from the Code directory: python -m benchmarks.bench_arithmetic_persian [count] [scalar_count]
+The scalar path is timed on the first scalar_count dates only (default 200,000) and compared by throughput.
+"""
+import sys
+
+from benchmarks.benchmark_tools import random_moments, timed, scalar_loop, report
+from calendars.arithmetic_persian import ArithmeticPersianDate
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    scalar_count = min(count, int(sys.argv[2]) if len(sys.argv) > 2 else 200000)
+
+    t = random_moments(count)
+
+    seconds = timed(scalar_loop, ArithmeticPersianDate, t[:scalar_count])
+    reference = scalar_count / seconds
+    report("ArithmeticPersianDate.from_rd", scalar_count, seconds)
+
+    seconds = timed(ArithmeticPersianDate.from_moments, t)
+    report("ArithmeticPersianDate.from_moments", count, seconds, reference)
+
+    years, months, days = ArithmeticPersianDate.from_moments(t)
+    seconds = timed(ArithmeticPersianDate.to_moments, years, months, days)
+    report("ArithmeticPersianDate.to_moments", count, seconds)
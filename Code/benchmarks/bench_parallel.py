@@ -0,0 +1,29 @@
+"""
+Benchmark: scaling of convert_parallel with the number of worker processes, on the astronomical Persian calendar.
+Run from the Code directory: python -m benchmarks.bench_parallel [count] [max_workers]
+Each run converts the same count dates (default 20,000) with 1, 2, 4, ... up to max_workers (default 8) workers;
+the speedup is relative to a single process. Scaling is bounded by the number of CPUs of the machine.
+"""
+import os
+import sys
+
+from benchmarks.benchmark_tools import random_moments, timed, report
+from calendars.persian_date import PersianDate
+from conversion import convert_parallel
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    print(f"CPUs: {os.cpu_count()}")
+    t = random_moments(count, 0, 1000000)
+
+    seconds = timed(convert_parallel, t, PersianDate, 1)
+    reference = count / seconds
+    report("convert_parallel, 1 worker", count, seconds)
+
+    workers = 2
+    while workers <= max_workers:
+        seconds = timed(convert_parallel, t, PersianDate, workers)
+        report(f"convert_parallel, {workers} workers", count, seconds, reference)
+        workers *= 2
@@ -0,0 +1,26 @@
+"""
+Benchmark: prayer times of random locations over consecutive days, in location-days per second.
+Run from the Code directory: python -m benchmarks.bench_prayer_times [locations] [days]
+"""
+import sys
+
+import numpy as np
+
+import prayer_times
+from benchmarks.benchmark_tools import timed, report
+from location import Location
+
+if __name__ == '__main__':
+    location_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    day_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    rng = np.random.default_rng(0)
+    locations = [Location("", latitude, longitude, elevation, round(longitude / 15))
+                 for latitude, longitude, elevation in zip(rng.uniform(-55, 55, location_count),
+                                                           rng.uniform(-180, 180, location_count),
+                                                           rng.uniform(0, 2000, location_count))]
+    days = np.arange(738886, 738886 + day_count)
+
+    for iterations in [1, 2]:
+        seconds = timed(prayer_times.prayer_times, days, locations, prayer_times.MUSLIM_WORLD_LEAGUE, iterations)
+        report(f"prayer_times (iterations={iterations})", location_count * day_count, seconds)
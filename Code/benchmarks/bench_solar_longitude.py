@@ -0,0 +1,44 @@
+"""
+Benchmark: solar longitudes by the Chebyshev table versus the 49-term series, evaluated directly and inside
+the batched equinox search (times.solar_longitude_after), with the maximum difference between the two backends.
+Run from the Code directory: python -m benchmarks.bench_solar_longitude [count]
+The table is loaded from solar_longitude_table.DEFAULT_PATH, or built and saved there on the first run.
+"""
+import sys
+
+import numpy as np
+
+import times
+from benchmarks.benchmark_tools import timed, report
+from solar_longitude_table import FIRST_YEAR, LAST_YEAR
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    rng = np.random.default_rng(0)
+    start, end = 365.2425 * (FIRST_YEAR - 1), 365.2425 * LAST_YEAR
+    t = rng.uniform(start, end, count)
+
+    years = np.arange(FIRST_YEAR, LAST_YEAR, max(1, (LAST_YEAR - FIRST_YEAR) // 2000))
+    mean = times.MEAN_TROPICAL_YEAR * (years - 1) + 264
+    equinoxes = {}
+
+    for backend in ["series", "chebyshev"]:
+        times.set_solar_longitude_backend(backend)
+
+        seconds = timed(times.solar_longitudes, t)
+        report(f"solar_longitudes ({backend})", count, seconds)
+
+        seconds = timed(times.solar_longitude_after, times.AUTUMN, mean - 10, mean + 10)
+        report(f"solar_longitude_after ({backend})", len(years), seconds)
+
+        equinoxes[backend] = times.solar_longitude_after(times.AUTUMN, mean - 10, mean + 10)
+
+    times.set_solar_longitude_backend("chebyshev")
+    table = times.solar_longitudes(t)
+    times.set_solar_longitude_backend("series")
+    series = times.solar_longitudes(t)
+
+    difference = np.abs(np.mod(table - series + 180, 360) - 180)
+    print(f"Maximum difference: {difference.max():.3g} degrees, "
+          f"equinoxes: {np.abs(equinoxes['chebyshev'] - equinoxes['series']).max() * 86400:.3g} s")
@@ -0,0 +1,55 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+
+def random_moments(count: int, low: int = -1000000, high: int = 1000000, seed: int = 0) -> np.ndarray:
+    """
+    Generates random RD days to benchmark conversions with.
+    :param count: The number of RD days.
+    :param low: The lowest RD day (inclusive).
+    :param high: The highest RD day (exclusive).
+    :param seed: The seed of the random generator, so that runs are comparable.
+    :return: Array of RD days (int64).
+    """
+    return np.random.default_rng(seed).integers(low, high, count, dtype=np.int64)
+
+
+def timed(f: Callable, *args) -> float:
+    """
+    Measures the wall time of a single call.
+    :param f: The function to call.
+    :param args: The arguments to call it with.
+    :return: The time the call took, in seconds.
+    """
+    start = time.perf_counter()
+    f(*args)
+    return time.perf_counter() - start
+
+
+def scalar_loop(calendar: type, t: np.ndarray) -> None:
+    """
+    The reference scalar path: one from_rd call (and one date object) per RD day.
+    :param calendar: The calendar class.
+    :param t: Array of RD days.
+    """
+    for rd in t.tolist():
+        calendar.from_rd(rd)
+
+
+def report(name: str, count: int, seconds: float, reference: float = None) -> None:
+    """
+    Prints the throughput of a benchmarked call, and optionally its speedup versus a reference throughput.
+    :param name: The name of the benchmarked call.
+    :param count: The number of dates converted.
+    :param seconds: The time the conversion took.
+    :param reference: The reference throughput, dates per second.
+    """
+    rate = count / seconds
+    line = f"{name:<40} {count:>12,} dates {seconds:>10.3f} s {rate:>16,.0f} dates/s"
+
+    if reference:
+        line += f"  x{rate / reference:,.1f}"
+
+    print(line)
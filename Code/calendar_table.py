@@ -0,0 +1,200 @@
+"""
+Precomputed table of the fields of many calendars for a range of RD days, stored as a fixed-width binary file
+(NumPy .npy, one record per day) and read through numpy.memmap. Worker processes opening the same file share
+its pages through the operating system's page cache, and reading the date of a day in range is a row read.
+
+Build (from the Code directory):
+    python calendar_table.py table.npy 600000 800000 [--calendars gregorian hebrew ...]
+"""
+import argparse
+import math
+
+import numpy as np
+
+from calendars.abstract_date import AbstractDate
+from conversion import CALENDARS, EXPENSIVE_CALENDARS, calendar_class, calendar_name
+
+DEFAULT_CHUNK_SIZE = 65536
+
+# The calendars of a table by default: all but the expensive ones (which are opt-in).
+DEFAULT_CALENDARS = [name for name in CALENDARS if name not in EXPENSIVE_CALENDARS]
+
+# Values of the fields which do not grow with the years (months, days, weeks, ...) all fit into this range.
+SMALL_FIELD_RANGE = [-128, 127]
+
+
+def table_dtype(first_rd: int, last_rd: int, calendars: list[str]) -> np.dtype:
+    """
+    Record type of a table: the RD day, followed by the fields of the calendars, named "<calendar>.<field>".
+    Every field gets the smallest integer type holding its values at both ends of the RD range
+    (only fields such as years grow with the RD) and SMALL_FIELD_RANGE.
+    :param first_rd: The first RD day of the table.
+    :param last_rd: The last RD day of the table.
+    :param calendars: The names of the calendars.
+    :return: The record type.
+    """
+    columns = [("rd", _smallest_int_type([first_rd, last_rd]))]
+
+    for name in calendars:
+        cls = calendar_class(name)
+        ends = cls.from_moments(np.array([first_rd, last_rd]))
+
+        for field, values in zip(cls.field_names(), ends):
+            if values.dtype == bool:
+                columns.append((f"{name}.{field}", np.bool_))
+            else:
+                columns.append((f"{name}.{field}", _smallest_int_type(values.tolist() + SMALL_FIELD_RANGE)))
+
+    return np.dtype(columns)
+
+
+def build_table(file_name: str, first_rd: int, last_rd: int, calendars: list[str] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+    Computes the fields of the calendars for every day of an RD range and writes them to a table file.
+    The days are converted in chunks with each calendar's bulk conversion, so that memory use does not
+    depend on the size of the range.
+    :param file_name: The name of the table file to write (.npy).
+    :param first_rd: The first RD day of the table.
+    :param last_rd: The last RD day of the table (inclusive).
+    :param calendars: The names of the calendars to include. Default: DEFAULT_CALENDARS (the expensive calendars
+    of conversion.EXPENSIVE_CALENDARS must be named).
+    :param chunk_size: The number of days to convert at once.
+    :exception ValueError: Raised if a field's value does not fit into the type chosen for it.
+    """
+    calendars = list(DEFAULT_CALENDARS) if calendars is None else [calendar_name(calendar) for calendar in calendars]
+    dtype = table_dtype(first_rd, last_rd, calendars)
+
+    table = np.lib.format.open_memmap(file_name, mode="w+", dtype=dtype, shape=(last_rd - first_rd + 1,))
+
+    for start in range(first_rd, last_rd + 1, chunk_size):
+        t = np.arange(start, min(start + chunk_size, last_rd + 1), dtype=np.int64)
+        rows = table[start - first_rd: start - first_rd + len(t)]
+        rows["rd"] = t
+
+        for name in calendars:
+            cls = calendar_class(name)
+
+            for field, values in zip(cls.field_names(), cls.from_moments(t)):
+                column = f"{name}.{field}"
+
+                if values.dtype != bool:
+                    info = np.iinfo(dtype[column])
+                    if values.min() < info.min or values.max() > info.max:
+                        raise ValueError(f"Values of {column} do not fit into {dtype[column]}")
+
+                rows[column] = values
+
+    table.flush()
+
+
+class CalendarTable:
+    """
+    Read access to a table file written by build_table.
+    """
+    def __init__(self, file_name: str):
+        """
+        Opens a table file as a read-only memory map.
+        :param file_name: The name of the table file.
+        """
+        self.table = np.load(file_name, mmap_mode="r")
+        self.first_rd = int(self.table["rd"][0])
+        self.last_rd = self.first_rd + len(self.table) - 1
+
+        # Field names per calendar, in the order of the table's columns.
+        self.fields = {}
+        for column in self.table.dtype.names[1:]:
+            name, field = column.split(".")
+            self.fields.setdefault(name, []).append(field)
+
+    def __contains__(self, t: float) -> bool:
+        """
+        Checks whether the day of an RD moment is in the table.
+        :param t: The RD moment.
+        :return: True if the table contains the day.
+        """
+        return self.first_rd <= math.floor(t) <= self.last_rd
+
+    def row(self, t: float) -> np.void:
+        """
+        The record of the day of an RD moment (a view into the memory map, no copy).
+        :param t: The RD moment; its day must be in the table.
+        :return: The record.
+        """
+        return self.table[math.floor(t) - self.first_rd]
+
+    def from_rd(self, calendar, t: float) -> AbstractDate:
+        """
+        The date of the day of an RD moment: read from the table if the day and the calendar are in it,
+        else calculated with the calendar's own from_rd.
+        :param calendar: The name of the calendar, or its class.
+        :param t: The RD moment.
+        :return: The date.
+        """
+        cls = calendar_class(calendar)
+        name = calendar_name(cls)
+
+        if name not in self.fields or t not in self:
+            return cls.from_rd(t)
+
+        row = self.row(t)
+
+        return cls(*[row[f"{name}.{field}"].item() for field in self.fields[name]])
+
+    def from_moments(self, calendar, t) -> tuple:
+        """
+        Bulk conversion of RD values to dates of a calendar: the days in the table are read from it,
+        the rest (if any) is calculated with the calendar's from_moments.
+        :param calendar: The name of the calendar, or its class.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Tuple of arrays, one per data field of the calendar.
+        """
+        cls = calendar_class(calendar)
+        name = calendar_name(cls)
+        t = np.floor(np.asarray(t)).astype(np.int64)
+
+        if name not in self.fields:
+            return cls.from_moments(t)
+
+        inside = (self.first_rd <= t) & (t <= self.last_rd)
+        rows = self.table[np.where(inside, t - self.first_rd, 0)]
+
+        result = []
+        for field in self.fields[name]:
+            values = rows[f"{name}.{field}"]
+            result.append(values if values.dtype == bool else values.astype(np.int64))
+
+        if not inside.all():
+            for values, computed in zip(result, cls.from_moments(t[~inside])):
+                values[~inside] = computed
+
+        return tuple(result)
+
+
+# region Protected Auxiliary
+def _smallest_int_type(values: list[int]) -> type:
+    """
+    The smallest signed integer type holding a list of values.
+    :param values: The values.
+    :return: The integer type.
+    """
+    for int_type in [np.int8, np.int16, np.int32]:
+        info = np.iinfo(int_type)
+        if info.min <= min(values) and max(values) <= info.max:
+            return int_type
+
+    return np.int64
+# endregion
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Builds a table of calendar fields for a range of RD days.")
+    parser.add_argument("file_name", help="The table file to write (.npy)")
+    parser.add_argument("first_rd", type=int, help="The first RD day")
+    parser.add_argument("last_rd", type=int, help="The last RD day (inclusive)")
+    parser.add_argument("--calendars", nargs="+", choices=list(CALENDARS),
+                        help=f"The calendars (default: all but {', '.join(EXPENSIVE_CALENDARS)})")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Days converted at once")
+
+    arguments = parser.parse_args()
+    build_table(arguments.file_name, arguments.first_rd, arguments.last_rd, arguments.calendars, arguments.chunk_size)
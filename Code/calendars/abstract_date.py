@@ -1,3 +1,10 @@
+import dataclasses
+
+import numpy as np
+
+import tools
+
+
 class AbstractDate:
     """
     Basis for all classes representing calendars.
@@ -13,7 +20,17 @@ class AbstractDate:
         Cambridge; New York: Cambridge University Press, 2018, 662 p. ISBN 978-1-107-68316-7. doi 10.1017/9781107415058.
 
     Uses the RDM's RD (rata die) value as the basis for all time measuring calendrical systems.
+
+    Concrete calendar classes are frozen, slotted dataclasses: dates are immutable and hashable values
+    (usable as dictionary keys), created either from their fields or from an RD with from_rd.
+    Dates of any calendars are ordered by their RD values.
+
+    The RD value of a date is computed on first use of the rd property and cached in the instance
+    (a slot outside the dataclass fields, so it takes no part in equality or hashing): comparing, sorting,
+    subtracting and shifting dates call to_moment at most once per date.
     """
+    __slots__ = ("_rd",)
+
     def to_moment(self) -> float:
         """
         Converts the date expressed in terms of the calendar class, into the RD time moment.
@@ -22,11 +39,12 @@ class AbstractDate:
         """
         pass
 
-    def from_moment(self, t: float) -> None:
+    @classmethod
+    def from_rd(cls, t: float) -> "AbstractDate":
         """
         Converts an RD time moment to an instance of a calendrical date in a specific system, e.g. Gregorian date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of the specific calendrical class will be generated instead.
+        :return: The date.
         """
         pass
 
@@ -38,3 +56,143 @@ class AbstractDate:
         :return: Formatted string representation.
         """
         return self.__repr__()
+
+    @property
+    def rd(self) -> float:
+        """
+        The RD time moment of the date, computed with to_moment on first use and cached.
+        :return: The RD time moment.
+        """
+        try:
+            return self._rd
+        except AttributeError:
+            self._cache_rd(self.to_moment())
+            return self._rd
+
+    def add_days(self, days: int) -> "AbstractDate":
+        """
+        The date a number of days after (or, if negative, before) this date, in the same calendar.
+        :param days: The number of days to add (a whole number: a date has no time of day).
+        :return: The new date, with its RD already cached.
+        :exception TypeError: Raised for a calendar-round date, which has no RD value.
+        :exception ValueError: Raised if the number of days is not a whole number.
+        """
+        if not float(days).is_integer():
+            raise ValueError(f"Dates can only be shifted by whole days, not {days}")
+
+        t = self._required_rd() + days
+
+        return type(self).from_rd(t)._cache_rd(t)
+
+    # region Ordering and arithmetic
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, AbstractDate) or self.rd is None or other.rd is None:
+            return NotImplemented
+        return self.rd < other.rd
+
+    def __le__(self, other) -> bool:
+        if not isinstance(other, AbstractDate) or self.rd is None or other.rd is None:
+            return NotImplemented
+        return self.rd <= other.rd
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, AbstractDate) or self.rd is None or other.rd is None:
+            return NotImplemented
+        return self.rd > other.rd
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, AbstractDate) or self.rd is None or other.rd is None:
+            return NotImplemented
+        return self.rd >= other.rd
+
+    def __add__(self, days) -> "AbstractDate":
+        """
+        date + days: see add_days.
+        """
+        if isinstance(days, AbstractDate):
+            return NotImplemented
+        return self.add_days(days)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        date - date: the difference in days between two dates, of the same or of different calendars.
+        date - days: the date a number of days earlier.
+        :exception TypeError: Raised for calendar-round dates, which have no RD value.
+        """
+        if isinstance(other, AbstractDate):
+            return self._required_rd() - other._required_rd()
+        return self.add_days(-other)
+    # endregion
+
+    # region Protected Auxiliary
+    def _required_rd(self) -> float:
+        """
+        The RD time moment of the date, for the operations which need one.
+        :return: The RD time moment.
+        :exception TypeError: Raised if the date has none: the dates of calendar rounds (such as the Mayan haab
+        and tzolkin) repeat, so to_moment returns None.
+        """
+        t = self.rd
+
+        if t is None:
+            raise TypeError(f"{type(self).__name__} dates have no RD value (they repeat with the calendar round): "
+                            f"they cannot be ordered, subtracted or shifted by days")
+
+        return t
+
+    def _cache_rd(self, t: float) -> "AbstractDate":
+        """
+        Stores the RD value of the date; the fields are frozen, so it never changes.
+        :param t: The RD time moment of the date.
+        :return: The date itself.
+        """
+        object.__setattr__(self, "_rd", t)
+        return self
+    # endregion
+
+    # region Bulk conversion
+    @classmethod
+    def field_names(cls) -> list[str]:
+        """
+        Names of the data fields of the calendar class, in the order of the initialization parameters.
+        :return: List of the field names.
+        """
+        return [field.name for field in dataclasses.fields(cls)]
+
+    @classmethod
+    def to_moments(cls, *fields) -> np.ndarray:
+        """
+        Converts arrays of dates to RD values.
+        This default implementation calls to_moment for each date; calendars override it with vectorized arithmetic.
+        :param fields: One array per data field, in the order of field_names().
+        :return: Array of RD values.
+        """
+        fields = np.broadcast_arrays(*fields)
+        result = [cls(*values).to_moment() for values in zip(*[field.tolist() for field in fields])]
+
+        return np.array(result).reshape(fields[0].shape)
+
+    @classmethod
+    def from_moments(cls, t) -> tuple:
+        """
+        Converts an array of RD values to dates, returned as one array per data field.
+        This default implementation calls from_rd for each value; calendars override it with vectorized arithmetic.
+        :param t: Array of RD values (or of datetime64 values, taken by their dates).
+        :return: Tuple of arrays, one per data field in the order of field_names().
+        """
+        t = np.asarray(t)
+        if np.issubdtype(t.dtype, np.datetime64):
+            t = tools.to_rata_die_array(t)
+        fields = dataclasses.fields(cls)
+        result = [np.empty(t.shape, dtype=bool if field.type is bool else np.int64) for field in fields]
+
+        for i, moment in enumerate(t.flat):
+            date = cls.from_rd(moment.item())
+
+            for field, values in zip(fields, result):
+                values.flat[i] = getattr(date, field.name)
+
+        return tuple(result)
+    # endregion
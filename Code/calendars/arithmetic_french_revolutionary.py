@@ -0,0 +1,110 @@
+from calendars.abstract_date import AbstractDate
+from dataclasses import dataclass
+import math
+import numpy as np
+import tools
+
+
+class ArithmeticFrenchRevolutionaryDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ArithmeticFrenchRevolutionaryDate(AbstractDate):
+    """
+    Implements conversion to and from RD time moment for the Arithmetic French Revolutionary calendar (RDM 16, p. 236):
+    the modified calendar proposed by Gilbert Romme, with the leap year rule of the Gregorian calendar
+    plus the exclusion of years divisible by 4000.
+    """
+    # region Data Fields
+    year: int = 0   # Arithmetic French Revolutionary year.
+    month: int = 0  # Arithmetic French Revolutionary month (13 for the sansculottides).
+    day: int = 0    # Arithmetic French Revolutionary day.
+    # endregion
+
+    EPOCH = tools.FRENCH_REVOLUTIONARY_EPOCH
+
+    # Average length of the year: 1460969 days in 4000 years.
+    CYCLE_YEARS = 4000
+    CYCLE_DAYS = 1460969
+
+    def to_moment(self) -> float:
+        """
+        Converts an Arithmetic French Revolutionary date to an RD time moment.
+        RDM (16.7).
+        :return: The RD time moment.
+        """
+        return self._new_year(self.year) - 1 + 30 * (self.month - 1) + self.day
+
+    @classmethod
+    def from_rd(cls, t: float) -> ArithmeticFrenchRevolutionaryDate:
+        """
+        Converts an RD time moment to an Arithmetic French Revolutionary date.
+        RDM (16.8).
+        :param t: The RD time moment to convert.
+        :return: The Arithmetic French Revolutionary date.
+        """
+        approx = math.floor((t - cls.EPOCH + 2) * cls.CYCLE_YEARS / cls.CYCLE_DAYS) + 1
+        year = approx - 1 if t < cls._new_year(approx) else approx
+
+        month = 1 + math.floor((t - cls._new_year(year)) / 30)
+        day = int(t - cls._new_year(year) - 30 * (month - 1)) + 1
+
+        return cls(year, month, day)
+
+    @staticmethod
+    def is_leap_year(year: int) -> bool:
+        """
+        Leap years: divisible by 4, except for those divisible by 100 but not 400, and for those divisible by 4000.
+        RDM (16.6).
+        :param year: The Arithmetic French Revolutionary year.
+        :return: True if the year has 366 days.
+        """
+        return year % 4 == 0 and year % 400 not in [100, 200, 300] and year % 4000 != 0
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of Arithmetic French Revolutionary dates to RD days.
+        :param year: Array of years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :return: Array of RD days (int64).
+        """
+        return cls._new_year(np.asarray(year, dtype=np.int64)) - 1 + \
+            30 * (np.asarray(month, dtype=np.int64) - 1) + np.asarray(day, dtype=np.int64)
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Arithmetic French Revolutionary dates.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months and days (int64).
+        """
+        t = tools.to_rata_die_array(t)
+
+        year = (t - cls.EPOCH + 2) * cls.CYCLE_YEARS // cls.CYCLE_DAYS + 1
+        year -= t < cls._new_year(year)
+
+        month, day = np.divmod(t - cls._new_year(year), 30)
+
+        return year, month + 1, day + 1
+    # endregion
+
+    # region Protected Auxiliary
+    @classmethod
+    def _new_year(cls, year):
+        """
+        The RD day of the first day of a year (scalar or array).
+        RDM (16.7) with month = day = 1.
+        :param year: The Arithmetic French Revolutionary year(s).
+        :return: The RD day(s).
+        """
+        y = year - 1
+
+        return cls.EPOCH + 365 * y + y // 4 - y // 100 + y // 400 - y // 4000
+    # endregion
@@ -1,33 +1,41 @@
 from calendars.abstract_date import AbstractDate
 from dataclasses import dataclass
 import math
+import numpy as np
 import tools
 
 
-@dataclass
+class ArithmeticPersianDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class ArithmeticPersianDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Arithmetic Persian calendar (RDM 13.3, p. 215).
     """
 
     # region Data Fields
-    year: int
-    month: int
-    day: int
+    year: int = 0   # Arithmetic Persian year.
+    month: int = 0  # Arithmetic Persian month.
+    day: int = 0    # Arithmetic Persian day.
     # endregion
 
     EPOCH = tools.PERSIAN_EPOCH
 
-    def __init__(self, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Initialization.
-        :param year: Arithmetic Persian year.
-        :param month: Arithmetic Persian month
-        :param day: Arithmetic Persian day.
-        """
-        self.year = year
-        self.month = month
-        self.day = day
+    # The calendar repeats itself every 2820 years, i.e. every 1029983 days (RDM 13.3).
+    CYCLE_YEARS = 2820
+    CYCLE_DAYS = 1029983
+
+    # RD of 1 Farvardin 475, the first year of the cycle used by RDM (13.9): EPOCH + 365 * 474 + 115.
+    NEW_YEAR_475 = EPOCH + 365 * 474 + (682 * 475 - 110) // 2816
+
+    # Days elapsed from 1 Farvardin 475 to the new years of 475, 476, ..., 3294, i.e. of the whole 2820-year cycle.
+    CYCLE_NEW_YEARS = 365 * np.arange(2820, dtype=np.int64) + \
+        (682 * np.arange(475, 3295, dtype=np.int64) - 110) // 2816 - (682 * 475 - 110) // 2816
 
     def to_moment(self) -> float:
         """
@@ -35,51 +43,85 @@ class ArithmeticPersianDate(AbstractDate):
         :return: The RD time moment.
         RDM (13.8)
         """
-        y = self.year - 473
-        if self.year > 0:
-            y -= 1
-
-        year = tools.fmod(y, 2820) + 474
-
-        result = ArithmeticPersianDate.EPOCH - 1 + 1029983 * math.floor(y / 2820) + 365 * (year - 1)
-        result += math.floor((682 * year - 110) / 2816)
+        return self._new_year(self.year) + self._days_before_month(self.month) + self.day - 1
 
-        if self.month <= 7:
-            result += 31 * (self.month - 1)
-        else:
-            result += 30 * (self.month - 1) + 6
-
-        result += self.day
-
-        return result
-
-    def from_moment(self, t: float):
+    @classmethod
+    def from_rd(cls, t: float) -> ArithmeticPersianDate:
         """
         Converts an RD time moment to a Arithmetic Persian date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of ArithmeticPersianDate is generated instead.
+        :return: The Arithmetic Persian date.
         RDM (13.9, 10)
         """
-        self.year = self._year_from_fixed(t)
-        day_of_year = 1 + t - ArithmeticPersianDate(self.year, 1, 1).to_moment()
+        year = cls._year_from_fixed(t)
+        day_of_year = 1 + t - cls._new_year(year)
         if day_of_year < 186:
-            self.month = int(math.ceil(day_of_year / 31))
+            month = int(math.ceil(day_of_year / 31))
         else:
-            self.month = int(math.ceil((day_of_year - 6) / 30))
+            month = int(math.ceil((day_of_year - 6) / 30))
+
+        return cls(year, month, int(day_of_year - cls._days_before_month(month)))
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of Arithmetic Persian dates to RD days,
+        reading the new years from the 2820-year cycle table.
+        :param year: Array of Arithmetic Persian years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :return: Array of RD days (int64).
+        """
+        year = np.asarray(year, dtype=np.int64)
+        month = np.asarray(month, dtype=np.int64)
+        day = np.asarray(day, dtype=np.int64)
+
+        # Years since 475 (there is no year 0).
+        y = year - 475 + (year < 0)
+        n2820, y2820 = np.divmod(y, cls.CYCLE_YEARS)
+
+        result = cls.NEW_YEAR_475 + cls.CYCLE_DAYS * n2820 + cls.CYCLE_NEW_YEARS[y2820]
+        result += np.where(month <= 7, 31 * (month - 1), 30 * (month - 1) + 6)
 
-        self.day = int(t - ArithmeticPersianDate(self.year, self.month, 1).to_moment() + 1)
+        return result + day - 1
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Arithmetic Persian dates
+        by a binary search in the 2820-year cycle table.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months and days (int64).
+        """
+        t = tools.to_rata_die_array(t)
+
+        n2820, d1 = np.divmod(t - cls.NEW_YEAR_475, cls.CYCLE_DAYS)
+        y2820 = np.searchsorted(cls.CYCLE_NEW_YEARS, d1, side="right") - 1
+
+        day_of_year = d1 - cls.CYCLE_NEW_YEARS[y2820] + 1
+
+        month = np.where(day_of_year < 186, (day_of_year + 30) // 31, (day_of_year + 23) // 30)
+        day = day_of_year - np.where(month <= 7, 31 * (month - 1), 30 * (month - 1) + 6)
+
+        year = 475 + cls.CYCLE_YEARS * n2820 + y2820
+        year -= year <= 0
+
+        return year, month, day
+    # endregion
 
     # region Protected Auxiliary
-    def _year_from_fixed(self, t: float) -> int:
+    @staticmethod
+    def _year_from_fixed(t: float) -> int:
         """
         Converts an RD time moment to an Arithmetic Persian date.
         :param t: The RD time moment to convert.
         :return: None. The instance of ArithmeticPersianDate will be generated instead.
         RDM (1.41)
         """
-        l0 = t - ArithmeticPersianDate(475, 1, 1).to_moment()
-        n2820 = math.floor(l0 / 1029983)
-        d1 = tools.fmod(l0, 1029983)
+        l0 = t - ArithmeticPersianDate.NEW_YEAR_475
+        n2820 = math.floor(l0 / ArithmeticPersianDate.CYCLE_DAYS)
+        d1 = tools.fmod(l0, ArithmeticPersianDate.CYCLE_DAYS)
         if d1 == 1029982:
             y2820 = 2820
         else:
@@ -91,4 +133,33 @@ class ArithmeticPersianDate(AbstractDate):
             return year
         else:
             return year - 1
+
+    @staticmethod
+    def _new_year(year: int) -> float:
+        """
+        RD of the first day (1 Farvardin) of an Arithmetic Persian year.
+        :param year: The Arithmetic Persian year.
+        :return: The RD of its new year.
+        RDM (13.8) with month = day = 1.
+        """
+        y = year - 473
+        if year > 0:
+            y -= 1
+
+        year = tools.fmod(y, ArithmeticPersianDate.CYCLE_YEARS) + 474
+
+        return ArithmeticPersianDate.EPOCH + ArithmeticPersianDate.CYCLE_DAYS * math.floor(y / 2820) + \
+            365 * (year - 1) + math.floor((682 * year - 110) / 2816)
+
+    @staticmethod
+    def _days_before_month(month: int) -> int:
+        """
+        Number of days in the year before the first day of a month (months 1-6 have 31 days, months 7-11 have 30).
+        :param month: The month.
+        :return: The number of days.
+        """
+        if month <= 7:
+            return 31 * (month - 1)
+        else:
+            return 30 * (month - 1) + 6
     # endregion
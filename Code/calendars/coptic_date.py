@@ -1,6 +1,4 @@
-from calendars.abstract_date import AbstractDate
-from dataclasses import dataclass
-import math
+from calendars.thirty_day_month_date import ThirtyDayMonthDate
 import tools
 
 # region Month and Weekdays names
@@ -50,50 +48,11 @@ DAYS_OF_WEEK_TRANSLIT = ["Tkyriakê", "Pesnau", "Pshoment", "Peftoou", "Ptiou",
 
 # endregion
 
-@dataclass
-class CopticDate(AbstractDate):
+class CopticDate(ThirtyDayMonthDate):
     """
     Implements conversion to and from RD time moment for Coptic calendar.
     """
-    # region Data Fields
-    year: int
-    month: int
-    day: int
-    # endregion
+    __slots__ = ()
 
     EPOCH = tools.COPTIC_EPOCH
-
-    # region Initialization
-    def __init__(self, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Initialization
-        :param year: Coptic year.
-        :param month: Coptic month
-        :param day: Coptic day.
-        """
-        self.year = year
-        self.month = month
-        self.day = day
-
-    # endregion
-
-    def to_moment(self) -> float:
-        """
-        Converts the Coptic date to an RD time moment.
-        RDM (4.3).
-        :return: The RD time moment.
-        """
-        result = CopticDate.EPOCH - 1 + 365 * (self.year - 1) + math.floor(self.year / 4) + \
-                 30 * (self.month - 1) + self.day
-        return result
-
-    def from_moment(self, t: float):
-        """
-        Converts an RD time moment to a Coptic date.
-        RDM (4.4).
-        :param t: The RD time moment to convert.
-        :return: None. The instance of CopticDate is generated instead.
-        """
-        self.year = math.floor((4 * (t - CopticDate.EPOCH) + 1463) / 1461)
-        self.month = int(math.floor((t - CopticDate(self.year, 1, 1).to_moment()) / 30)) + 1
-        self.day = int(t + 1 - CopticDate(self.year, self.month, 1).to_moment())
+    LEAP_CYCLE = 4
@@ -1,52 +1,12 @@
-from calendars.abstract_date import AbstractDate
-from dataclasses import dataclass
-import math
+from calendars.thirty_day_month_date import ThirtyDayMonthDate
 import tools
 
 
-@dataclass
-class EgyptianDate(AbstractDate):
+class EgyptianDate(ThirtyDayMonthDate):
     """
     Implements conversion to and from RD time moment for Egyptian calendar.
     """
-
-    # region Data Fields
-    year: int
-    month: int
-    day: int
-    # endregion
+    __slots__ = ()
 
     EPOCH = tools.EGYPTIAN_EPOCH
-
-    # region Initialization
-    def __init__(self, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Initialization
-        :param year: Egyptian year.
-        :param month: Egyptian month
-        :param day: Egyptian day.
-        """
-        self.year = year
-        self.month = month
-        self.day = day
-    # endregion
-
-    def to_moment(self) -> float:
-        """
-        Converts the Egyptian date to an RD time moment.
-        :return: The RD time moment.
-        RDM (1.40)
-        """
-        return EgyptianDate.EPOCH + 365 * (self.year - 1) + 30 * (self.month - 1) + self.day - 1
-
-    def from_moment(self, t: float):
-        """
-        Converts an RD time moment to a Egyptian date.
-        :param t: The RD time moment to convert.
-        :return: None. The instance of EgyptianDate will be generated instead.
-        RDM (1.41)
-        """
-        days = t - EgyptianDate.EPOCH
-        self.year = math.floor(days / 365) + 1
-        self.month = math.floor((days % 365) / 30) + 1
-        self.day = days - 365 * (self.year - 1) - 30 * (self.month - 1) + 1
+    LEAP_CYCLE = 0
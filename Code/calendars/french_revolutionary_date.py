@@ -0,0 +1,218 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+import location
+import times
+import tools
+from calendars.abstract_date import AbstractDate
+
+# region Month names
+# Source: RDM p. 231.
+MONTHS = ["Vendémiaire",
+          "Brumaire",
+          "Frimaire",
+          "Nivôse",
+          "Pluviôse",
+          "Ventôse",
+          "Germinal",
+          "Floréal",
+          "Prairial",
+          "Messidor",
+          "Thermidor",
+          "Fructidor",
+          "Sansculottides"]
+# endregion
+
+
+class FrenchRevolutionaryDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class FrenchRevolutionaryDate(AbstractDate):
+    """
+    Implements conversion to and from RD time moment for the (original, astronomical) French Revolutionary calendar
+    (RDM 16): twelve months of 30 days followed by 5 or 6 sansculottides (month 13); the year starts on the day
+    of the autumnal equinox in Paris, i.e. the day in whose closing midnight the sun's longitude is at least 180°.
+
+    The new years are read from a table, built on first use for blocks of TABLE_BLOCK years at once by a batched
+    root finding on the solar longitude (times.solar_longitude_after), and kept for the lifetime of the process.
+    A conversion is then a table lookup, instead of the solar longitude searches of RDM (16.3).
+    """
+    # region Data Fields
+    year: int = 0   # French Revolutionary year (year 1 began on 1792-09-22).
+    month: int = 0  # French Revolutionary month (13 for the sansculottides).
+    day: int = 0    # French Revolutionary day.
+    # endregion
+
+    EPOCH = tools.FRENCH_REVOLUTIONARY_EPOCH
+
+    # The new year table is extended by blocks of this many years, aligned to multiples of it.
+    TABLE_BLOCK = 256
+
+    # The table: the RD days of the new years of the years _table_first_year, _table_first_year + 1, ...
+    _table_first_year = 1
+    _table = np.empty(0, dtype=np.int64)
+
+    def to_moment(self) -> float:
+        """
+        Converts the French Revolutionary date to an RD time moment.
+        RDM (16.4).
+        :return: The RD time moment.
+        """
+        return self.new_year(self.year) - 1 + 30 * (self.month - 1) + self.day
+
+    @classmethod
+    def from_rd(cls, t: float) -> FrenchRevolutionaryDate:
+        """
+        Converts an RD time moment to a French Revolutionary date.
+        RDM (16.5).
+        :param t: The RD time moment to convert.
+        :return: The French Revolutionary date.
+        """
+        year, month, day = cls.from_moments(np.array([t]))
+
+        return cls(int(year[0]), int(month[0]), int(day[0]))
+
+    @classmethod
+    def new_year(cls, year: int) -> int:
+        """
+        The RD day of the first day of a year (1 Vendémiaire).
+        :param year: The French Revolutionary year.
+        :return: The RD day.
+        """
+        return int(cls.new_years(np.array([year]))[0])
+
+    @classmethod
+    def new_years(cls, years) -> np.ndarray:
+        """
+        The RD days of the first days of years, read from the new year table (extended as needed).
+        :param years: Array of French Revolutionary years.
+        :return: Array of RD days (int64).
+        """
+        years = np.asarray(years, dtype=np.int64)
+
+        if years.size:
+            cls._extend_table(int(years.min()), int(years.max()))
+
+        return FrenchRevolutionaryDate._table[years - FrenchRevolutionaryDate._table_first_year]
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of French Revolutionary dates to RD days.
+        :param year: Array of years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :return: Array of RD days (int64).
+        """
+        return cls.new_years(year) - 1 + 30 * (np.asarray(month, dtype=np.int64) - 1) + \
+            np.asarray(day, dtype=np.int64)
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to French Revolutionary dates
+        by a binary search in the new year table.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months and days (int64).
+        """
+        t = tools.to_rata_die_array(t)
+
+        if t.size:
+            approx = np.floor((t - cls.EPOCH) / times.MEAN_TROPICAL_YEAR).astype(np.int64) + 1
+            cls._extend_table(int(approx.min()) - 1, int(approx.max()) + 1)
+
+        table = FrenchRevolutionaryDate._table
+        index = np.searchsorted(table, t, side="right") - 1
+
+        month, day = np.divmod(t - table[index], 30)
+
+        return FrenchRevolutionaryDate._table_first_year + index, month + 1, day + 1
+    # endregion
+
+    # region Protected Auxiliary
+    @classmethod
+    def _extend_table(cls, first_year: int, last_year: int) -> None:
+        """
+        Makes the new year table cover a range of years, computing the missing blocks.
+        :param first_year: The first year needed.
+        :param last_year: The last year needed.
+        """
+        table = FrenchRevolutionaryDate._table
+        table_first = FrenchRevolutionaryDate._table_first_year
+        table_last = table_first + len(table) - 1
+
+        if len(table) and table_first <= first_year and last_year <= table_last:
+            return
+
+        if len(table):
+            first_year = min(first_year, table_first)
+            last_year = max(last_year, table_last)
+
+        block = cls.TABLE_BLOCK
+        first_year = first_year // block * block
+        last_year = (last_year // block + 1) * block - 1
+
+        if len(table):
+            parts = [cls._compute_new_years(np.arange(first_year, table_first)),
+                     table,
+                     cls._compute_new_years(np.arange(table_last + 1, last_year + 1))]
+        else:
+            parts = [cls._compute_new_years(np.arange(first_year, last_year + 1))]
+
+        FrenchRevolutionaryDate._table = np.concatenate(parts)
+        FrenchRevolutionaryDate._table_first_year = first_year
+
+    @classmethod
+    def _compute_new_years(cls, years: np.ndarray) -> np.ndarray:
+        """
+        Computes the new years of a range of years: the moments of the autumnal equinoxes are found for all years
+        at once, each then gives the first day whose closing midnight in Paris is at or after it (RDM 16.3).
+        :param years: Array of French Revolutionary years.
+        :return: Array of RD days (int64).
+        """
+        if not years.size:
+            return np.empty(0, dtype=np.int64)
+
+        mean = cls.EPOCH + times.MEAN_TROPICAL_YEAR * (years - 1)
+        equinoxes = times.solar_longitude_after(times.AUTUMN, mean - 10, mean + 10)
+
+        result = np.empty(years.shape, dtype=np.int64)
+
+        for i, equinox in enumerate(equinoxes.tolist()):
+            day = math.floor(equinox)
+
+            while cls._midnight_in_paris(day) < equinox:
+                day += 1
+            while cls._midnight_in_paris(day - 1) >= equinox:
+                day -= 1
+
+            # Within the precision of the equinox moment, decide by the solar longitude itself, as RDM (16.3) does.
+            if abs(cls._midnight_in_paris(day - 1) - equinox) < 1e-6 and \
+                    times.solar_longitude(cls._midnight_in_paris(day - 1)) >= times.AUTUMN:
+                day -= 1
+            elif abs(cls._midnight_in_paris(day) - equinox) < 1e-6 and \
+                    times.solar_longitude(cls._midnight_in_paris(day)) < times.AUTUMN:
+                day += 1
+
+            result[i] = day
+
+        return result
+
+    @staticmethod
+    def _midnight_in_paris(t: float) -> float:
+        """
+        Universal time of true midnight at the end of a day in Paris.
+        RDM (16.2).
+        :param t: The RD day.
+        :return: The universal time of the midnight.
+        """
+        return times.standard_to_universal(times.midnight(t + 1, location.PARIS), location.PARIS)
+    # endregion
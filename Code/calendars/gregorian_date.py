@@ -2,6 +2,8 @@ import math
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
 import tools
 from calendars.abstract_date import AbstractDate
 
@@ -13,15 +15,15 @@ class GregorianDate:
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GregorianDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Gregorian calendar.
     """
     # region Data Fields
-    year: int
-    month: int
-    day: int
+    year: int = 0   # Gregorian year.
+    month: int = 0  # Gregorian month (January = 1).
+    day: int = 0    # Gregorian day.
     # endregion
 
     DAYS_IN_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
@@ -46,17 +48,6 @@ class GregorianDate(AbstractDate):
               "November",
               "December"]
 
-    def __init__(self, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Initialization
-        :param year: Gregorian year.
-        :param month: Gregorian month (January = 1)
-        :param day: Gregorian day.
-        """
-        self.year = year
-        self.month = month
-        self.day = day
-
     # region AbstractDate
     def to_moment(self) -> float:
         """
@@ -65,33 +56,71 @@ class GregorianDate(AbstractDate):
         """
         return tools.datetime_data_to_moment([self.year, self.month, self.day])
 
-    def from_moment(self, t: float) -> None:
+    @classmethod
+    def from_rd(cls, t: float) -> GregorianDate:
         """
         Converts an RD time moment to a Gregorian date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of GregorianDate will be generated instead.
+        :return: The Gregorian date.
         """
-        year = tools.gregorian_year_from_rata_die(t)
-        self.year = int(year)
+        year = int(tools.gregorian_year_from_rata_die(t))
 
-        new_year = GregorianDate(self.year, 1, 1)
+        new_year = GregorianDate(year, 1, 1)
         days_prior = t - new_year.to_moment()
         correction = 0
 
-        march1 = GregorianDate(self.year, 3, 1)
+        march1 = GregorianDate(year, 3, 1)
         if t >= march1.to_moment():
-            if tools.is_gregorian_leap_year(self.year):
+            if tools.is_gregorian_leap_year(year):
                 correction = 1
             else:
                 correction = 2
 
         d = (12.0 * (days_prior + correction) + 373) / 367
 
-        self.month = int(math.floor(d))
+        month = int(math.floor(d))
+
+        d = t - GregorianDate(year, month, 1).to_moment()
+
+        return cls(year, month, int(d) + 1)
+
+    # endregion
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of Gregorian dates to RD days.
+        RDM (2.17).
+        :param year: Array of years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :return: Array of RD days (int64).
+        """
+        year = np.asarray(year, dtype=np.int64)
+        month = np.asarray(month, dtype=np.int64)
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+        return tools.gregorian_new_years(year) - 1 + (367 * month - 362) // 12 + \
+            np.where(month <= 2, 0, np.where(leap, -1, -2)) + np.asarray(day, dtype=np.int64)
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Gregorian dates.
+        RDM (2.23).
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months and days (int64).
+        """
+        t = tools.to_rata_die_array(t)
+        year = tools.gregorian_years_from_rata_die(t)
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
 
-        d = t - GregorianDate(self.year, self.month, 1).to_moment()
-        self.day = int(d) + 1
+        prior_days = t - tools.gregorian_new_years(year)
+        correction = np.where(t < cls.to_moments(year, 3, 1), 0, np.where(leap, 1, 2))
+        month = (12 * (prior_days + correction) + 373) // 367
 
+        return year, month, t - cls.to_moments(year, month, 1) + 1
     # endregion
 
     def is_valid(self) -> bool:
@@ -199,5 +228,5 @@ class GregorianDate(AbstractDate):
             case "wdmy":
                 return f"{self.day_of_week}, {self.year} {GregorianDate.MONTHS[self.month - 1]} {self.day}"
             case _:
-                return super().to_string()
+                return AbstractDate.to_string(self)
     # endregion
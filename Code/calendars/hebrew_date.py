@@ -4,15 +4,22 @@ import math
 import tools
 
 
-@dataclass
+class HebrewDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class HebrewDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Hebrew calendar.
     """
     # region Data Fields
-    year: int
-    month: int
-    day: int
+    year: int = 0   # Hebrew year.
+    month: int = 0  # Hebrew month (Nisan = 1).
+    day: int = 0    # Hebrew day.
     # endregion
 
     NISAN = 1
@@ -20,17 +27,6 @@ class HebrewDate(AbstractDate):
     CRITICAL_MONTHS = [2, 4, 6, 10, 13]
     AVERAGE_YEAR_LENGTH = 35975351 / 98496
 
-    def __init__(self, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Initialization
-        :param year: Hebrew year.
-        :param month: Hebrew month
-        :param day: Hebrew day.
-        """
-        self.year = year
-        self.month = month
-        self.day = day
-
     def to_moment(self) -> float:
         """
         Converts the Hebrew date to an RD time moment.
@@ -56,17 +52,18 @@ class HebrewDate(AbstractDate):
 
         return t
 
-    def from_moment(self, t: float):
+    @classmethod
+    def from_rd(cls, t: float) -> HebrewDate:
         """
         Converts an RD time moment to a Hebrew date.
         RDM (7.16).
         :param t: The RD time moment to convert.
-        :return: None. The instance of HebrewDate will be generated instead.
+        :return: The Hebrew date.
         """
         approx = 1 + math.floor((t - tools.HEBREW_EPOCH) / HebrewDate.AVERAGE_YEAR_LENGTH)
         year = int(approx - 1)
 
-        while self.hebrew_new_year(year) <= t:
+        while cls.hebrew_new_year(year) <= t:
             year += 1
 
         year -= 1
@@ -78,25 +75,25 @@ class HebrewDate(AbstractDate):
 
         month = start
 
-        while not t <= HebrewDate(year, month, self.last_day_of_hebrew_month(year, month)).to_moment():
+        while not t <= HebrewDate(year, month, cls.last_day_of_hebrew_month(year, month)).to_moment():
             month += 1
 
         day = int(1 + t - HebrewDate(year, month, 1).to_moment())
 
-        self.year = year
-        self.month = month
-        self.day = day
+        return cls(year, month, day)
 
     # region Protected Auxiliary
-    def hebrew_new_year(self, year: int) -> int:
+    @classmethod
+    def hebrew_new_year(cls, year: int) -> int:
         """
         RDM (7.10)
         :param year:
         :return:
         """
-        return tools.HEBREW_EPOCH + self.hebrew_calendar_elapsed_days(year) + self.hebrew_new_year_delay(year)
+        return tools.HEBREW_EPOCH + cls.hebrew_calendar_elapsed_days(year) + cls.hebrew_new_year_delay(year)
 
-    def hebrew_calendar_elapsed_days(self, year) -> float:
+    @classmethod
+    def hebrew_calendar_elapsed_days(cls, year) -> float:
         """
         RDM (7.8)
         :param year:
@@ -111,15 +108,16 @@ class HebrewDate(AbstractDate):
         else:
             return day
 
-    def hebrew_new_year_delay(self, year):
+    @classmethod
+    def hebrew_new_year_delay(cls, year):
         """
         RDM (7.9)
         :param year:
         :return:
         """
-        ny0 = int(self.hebrew_calendar_elapsed_days(year - 1))
-        ny1 = int(self.hebrew_calendar_elapsed_days(year))
-        ny2 = int(self.hebrew_calendar_elapsed_days(year + 1))
+        ny0 = int(cls.hebrew_calendar_elapsed_days(year - 1))
+        ny1 = int(cls.hebrew_calendar_elapsed_days(year))
+        ny2 = int(cls.hebrew_calendar_elapsed_days(year + 1))
 
         if ny2 - ny1 == 356:
             return 2
@@ -128,7 +126,8 @@ class HebrewDate(AbstractDate):
         else:
             return 0
 
-    def last_month_of_hebrew_year(self, year: int) -> int:
+    @classmethod
+    def last_month_of_hebrew_year(cls, year: int) -> int:
         """
         RDM (7.4)
         :param year:
@@ -139,7 +138,8 @@ class HebrewDate(AbstractDate):
         else:
             return 12
 
-    def last_day_of_hebrew_month(self, year: int, month: int) -> int:
+    @classmethod
+    def last_day_of_hebrew_month(cls, year: int, month: int) -> int:
         """
         RDM (7.11)
         :param year:
@@ -148,38 +148,41 @@ class HebrewDate(AbstractDate):
         """
         if month in HebrewDate.CRITICAL_MONTHS or \
                 (month == 12 and not tools.is_hebrew_leap_year(year)) or \
-                (month == 8 and not self.is_long_mareshvan(year)) or \
-                (month == 9 and self.is_short_kislev(year)):
+                (month == 8 and not cls.is_long_mareshvan(year)) or \
+                (month == 9 and cls.is_short_kislev(year)):
             return 29
         else:
             return 30
 
-    def is_long_mareshvan(self, year) -> bool:
+    @classmethod
+    def is_long_mareshvan(cls, year) -> bool:
         """
         RDM (7.12)
         :param year:
         :return:
         """
-        days_in_hebrew_year = self._days_in_hebrew_year(year)
+        days_in_hebrew_year = cls._days_in_hebrew_year(year)
 
         if days_in_hebrew_year == 355 or days_in_hebrew_year == 385:
             return True
         else:
             return False
 
-    def is_short_kislev(self, year) -> bool:
+    @classmethod
+    def is_short_kislev(cls, year) -> bool:
         """
         RDM (7.13)
         :param year:
         :return:
         """
-        days_in_hebrew_year = self._days_in_hebrew_year(year)
+        days_in_hebrew_year = cls._days_in_hebrew_year(year)
         if days_in_hebrew_year == 353 or days_in_hebrew_year == 383:
             return True
         else:
             return False
 
-    def _days_in_hebrew_year(self, year):
-        return self.hebrew_new_year(year + 1) - self.hebrew_new_year(year)
+    @classmethod
+    def _days_in_hebrew_year(cls, year):
+        return cls.hebrew_new_year(year + 1) - cls.hebrew_new_year(year)
     # endregion
 
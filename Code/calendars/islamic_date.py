@@ -1,34 +1,41 @@
 from calendars.abstract_date import AbstractDate
 from dataclasses import dataclass
 import math
+import numpy as np
 import tools
 
 MONTHS_TRANSLIT = ["Muharram", "Safar", "Rabı‘ I", "Rabı‘ II", "Jumada I", "Jumada II", "Rajab", "Sha‘ban", "Ramadan",
                    "Shawwal", "Dhu al-Qa‘da", "Dhu al-Hijja"]
 
 
-@dataclass
+class IslamicDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class IslamicDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Islamic calendar.
     """
 
     # region Data Fields
-    year: int
-    month: int
-    day: int
+    year: int = 0   # Islamic year.
+    month: int = 0  # Islamic month.
+    day: int = 0    # Islamic day.
     # endregion
 
-    def __init__(self, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Initialization.
-        :param year: Islamic year.
-        :param month: Islamic month
-        :param day: Islamic day.
-        """
-        self.year = year
-        self.month = month
-        self.day = day
+    # The arithmetic calendar repeats itself every 30 years, i.e. every 10631 days (RDM 6.1).
+    CYCLE_YEARS = 30
+    CYCLE_DAYS = 10631
+
+    # Days elapsed from the new year of the first year of a 30-year cycle to the new years of its 30 years.
+    CYCLE_NEW_YEARS = 354 * np.arange(30, dtype=np.int64) + (3 + 11 * np.arange(1, 31, dtype=np.int64)) // 30
+
+    # Days elapsed from the new year to the first days of the 12 months (30 and 29 days alternately).
+    MONTH_STARTS = 29 * np.arange(12, dtype=np.int64) + (6 * np.arange(1, 13, dtype=np.int64) - 1) // 11
 
     def to_moment(self) -> float:
         """
@@ -36,23 +43,87 @@ class IslamicDate(AbstractDate):
         :return: The RD time moment.
         RDM (6.3)
         """
-        result = self.day + 29 * (self.month - 1) + math.floor((6 * self.month - 1) / 11) + (self.year - 1) * 354
-        result += math.floor((3 + 11 * self.year) / 30) + tools.ISLAMIC_EPOCH - 1
+        return self._to_fixed(self.year, self.month, self.day)
 
-        return result
-
-    def from_moment(self, t: float):
+    @classmethod
+    def from_rd(cls, t: float) -> IslamicDate:
         """
         Converts an RD time moment to an Islamic date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of IslamicDate is generated instead.
+        :return: The Islamic date.
         RDM (6.4)
         """
         year = math.floor((30 * (t - tools.ISLAMIC_EPOCH) + 10646) / 10631)
-        prior_days = t - IslamicDate(year, 1, 1).to_moment()
+        prior_days = t - cls._to_fixed(year, 1, 1)
         month = math.floor((11 * prior_days + 330) / 325)
-        day = t - IslamicDate(year, month, 1).to_moment() + 1
+        day = t - cls._to_fixed(year, month, 1) + 1
+
+        return cls(int(year), int(month), int(day))
 
-        self.year = int(year)
-        self.month = int(month)
-        self.day = int(day)
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of Islamic dates to RD days using the 30-year cycle and month tables.
+        :param year: Array of Islamic years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :return: Array of RD days (int64).
+        """
+        month = np.asarray(month, dtype=np.int64)
+        day = np.asarray(day, dtype=np.int64)
+        n30, y30 = np.divmod(np.asarray(year, dtype=np.int64) - 1, cls.CYCLE_YEARS)
+
+        return tools.ISLAMIC_EPOCH + cls.CYCLE_DAYS * n30 + cls.CYCLE_NEW_YEARS[y30] + cls.MONTH_STARTS[month - 1] + \
+            day - 1
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Islamic dates
+        by binary searches in the 30-year cycle and month tables.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months and days (int64).
+        """
+        t = tools.to_rata_die_array(t)
+
+        n30, d30 = np.divmod(t - tools.ISLAMIC_EPOCH, cls.CYCLE_DAYS)
+        y30 = np.searchsorted(cls.CYCLE_NEW_YEARS, d30, side="right") - 1
+        day_of_year = d30 - cls.CYCLE_NEW_YEARS[y30]
+        month = np.searchsorted(cls.MONTH_STARTS, day_of_year, side="right")
+
+        return cls.CYCLE_YEARS * n30 + y30 + 1, month, day_of_year - cls.MONTH_STARTS[month - 1] + 1
+
+    @classmethod
+    def month_ranges(cls, first_year: int, last_year: int) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        """
+        All months of the Islamic years first_year..last_year (inclusive), in chronological order.
+        :param first_year: The first Islamic year.
+        :param last_year: The last Islamic year.
+        :return: Arrays of years, months, RD days of the months' first days and RD days of the months' last days.
+        """
+        years = np.repeat(np.arange(first_year, last_year + 1, dtype=np.int64), 12)
+        months = np.tile(np.arange(1, 13, dtype=np.int64), last_year - first_year + 1)
+
+        starts = cls.to_moments(years, months, 1)
+        ends = np.append(starts[1:], cls.to_moments(last_year + 1, 1, 1)) - 1
+
+        return years, months, starts, ends
+    # endregion
+
+    # region Protected Auxiliary
+    @staticmethod
+    def _to_fixed(year: int, month: int, day: int) -> float:
+        """
+        Converts Islamic date values to an RD time moment without creating an instance.
+        :param year: Islamic year.
+        :param month: Islamic month.
+        :param day: Islamic day.
+        :return: The RD time moment.
+        RDM (6.3)
+        """
+        result = day + 29 * (month - 1) + math.floor((6 * month - 1) / 11) + (year - 1) * 354
+        result += math.floor((3 + 11 * year) / 30) + tools.ISLAMIC_EPOCH - 1
+
+        return result
+    # endregion
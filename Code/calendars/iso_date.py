@@ -2,6 +2,7 @@ from calendars.abstract_date import AbstractDate
 from calendars.gregorian_date import GregorianDate
 from dataclasses import dataclass
 import math
+import numpy as np
 import tools
 
 
@@ -11,29 +12,18 @@ class IsoDate:
     """
     pass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IsoDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for ISO date (ISO_8601).
     Sources: https://en.wikipedia.org/wiki/ISO_8601, RDM, RDU.
     """
     # region Data Fields
-    year: int
-    week: int
-    day: int
+    year: int = 0   # (Gregorian) year.
+    week: int = 0   # Week number.
+    day: int = 0    # Day of week.
     # endregion
 
-    def __init__(self, year: int = 0, week: int = 0, day: int = 0):
-        """
-        Initialization.
-        :param year: (Gregorian) year.
-        :param week: Week number.
-        :param day: Day of week.
-        """
-        self.year = year
-        self.week = week
-        self.day = day
-
     # region AbstractDate
     def to_moment(self) -> float:
         """
@@ -43,26 +33,88 @@ class IsoDate(AbstractDate):
         """
         return tools.n_th_k_day(self.week, 0, GregorianDate(self.year - 1, 12, 28).to_moment()) + self.day
 
-    def from_moment(self, t: float) -> None:
+    @classmethod
+    def from_rd(cls, t: float) -> IsoDate:
         """
         Converts an RD time moment to an ISO date.
         RDM (5.2).
         :param t: The RD time moment to convert.
-        :return: None. The instance of IsoDate will be generated instead.
+        :return: The ISO date.
         """
         # TODO: hier bug!
-        gd = GregorianDate()
-        gd.from_moment(t -3)
-        self.year = gd.year
+        year = GregorianDate.from_rd(t - 3).year
 
-        if t >= IsoDate(self.year + 1, 1, 1).to_moment():
-            self.year += 1
+        if t >= IsoDate(year + 1, 1, 1).to_moment():
+            year += 1
+
+        excess = (t - IsoDate(year, 1, 1).to_moment()) / 7
+
+        return cls(year, int(math.floor(excess)) + 1, int(tools.amod(t, 7)))
+    # endregion
+
+    # region Bulk conversion
+    @classmethod
+    def new_years(cls, years) -> np.ndarray:
+        """
+        RD days of the first day (Monday of week 1) of an array of ISO years.
+        Integer form of RDM (5.1) with week = day = 1: the Sunday before December 28 of the preceding year plus 8 days.
+        :param years: Array of ISO years.
+        :return: Array of RD days (int64).
+        """
+        d = tools.gregorian_new_years(years) - 5
+        return d - d % 7 + 8
+
+    @classmethod
+    def to_moments(cls, year, week, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of ISO dates to RD days.
+        :param year: Array of ISO years.
+        :param week: Array of week numbers.
+        :param day: Array of days of week (1 == Monday,..., 7 == Sunday).
+        :return: Array of RD days (int64).
+        """
+        week = np.asarray(week, dtype=np.int64)
+        day = np.asarray(day, dtype=np.int64)
+        return cls.new_years(year) + 7 * (week - 1) + day - 1
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to ISO dates using integer arithmetic only.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, weeks and days of week (int64).
+        """
+        t = tools.to_rata_die_array(t)
+
+        year = tools.gregorian_years_from_rata_die(t - 3)
+        year += t >= cls.new_years(year + 1)
+
+        week = (t - cls.new_years(year)) // 7 + 1
+        day = (t - 1) % 7 + 1
+
+        return year, week, day
+
+    @classmethod
+    def week_ranges(cls, first_year: int, last_year: int) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        """
+        All ISO weeks of the years first_year..last_year (inclusive), in chronological order.
+        Since the starts are sorted, an array of RD values can be bucketed by week with
+        np.searchsorted(starts, t, side="right") - 1.
+        :param first_year: The first ISO year.
+        :param last_year: The last ISO year.
+        :return: Arrays of years, week numbers, RD days of the weeks' Mondays and RD days of the weeks' Sundays.
+        """
+        years = np.arange(first_year, last_year + 2, dtype=np.int64)
+        new_years = cls.new_years(years)
+        weeks_in_year = np.diff(new_years) // 7
 
-        excess = (t - IsoDate(self.year, 1, 1).to_moment()) / 7
+        year = np.repeat(years[:-1], weeks_in_year)
+        offsets = np.cumsum(weeks_in_year) - weeks_in_year
+        week = np.arange(len(year), dtype=np.int64) - np.repeat(offsets, weeks_in_year) + 1
 
-        self.week = int(math.floor(excess)) + 1
+        starts = np.repeat(new_years[:-1], weeks_in_year) + 7 * (week - 1)
 
-        self.day = int(tools.amod(t, 7))
+        return year, week, starts, starts + 6
     # endregion
 
     # region String representation
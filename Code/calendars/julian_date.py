@@ -2,33 +2,30 @@ from calendars.abstract_date import AbstractDate
 from calendars.gregorian_date import GregorianDate
 from dataclasses import dataclass
 import math
+import numpy as np
 import tools
 
 
-@dataclass
+class JulianDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class JulianDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Julian calendar.
     """
     # region Data Fields
-    year: int
-    month: int
-    day: int
+    year: int = 0   # Julian year.
+    month: int = 0  # Julian month.
+    day: int = 0    # Julian day.
     # endregion
 
     EPOCH = int(GregorianDate(0, 12, 30).to_moment())
 
-    def __init__(self, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Initialization.
-        :param year: Julian year.
-        :param month: Julian month
-        :param day: Julian day.
-        """
-        self.year = year
-        self.month = month
-        self.day = day
-
     def to_moment(self) -> float:
         """
         Converts the Julian date to an RD time moment.
@@ -44,30 +41,68 @@ class JulianDate(AbstractDate):
 
         return result
 
-    def from_moment(self, t: float):
+    @classmethod
+    def from_rd(cls, t: float) -> JulianDate:
         """
         Converts an RD time moment to a Julian date.
-        RDM (3.4).
-        :param t: The RD time moment to convert.
-        :return: None. The instance of JulianDate will be generated instead.
         RDM (3.4), p. 65.
+        :param t: The RD time moment to convert.
+        :return: The Julian date.
         """
         approx = math.floor((4 * (t - JulianDate.EPOCH) + 1464) / 1461)
         approx = int(approx)
-        self.year = approx if approx > 0 else approx - 1
-        julian_start = JulianDate(self.year, 1, 1)
+        year = approx if approx > 0 else approx - 1
+        julian_start = JulianDate(year, 1, 1)
         prior_days = t - julian_start.to_moment()
 
         correction = 2
-        if t < JulianDate(self.year, 3, 1).to_moment():
+        if t < JulianDate(year, 3, 1).to_moment():
             correction = 0
 
-        if t >= JulianDate(self.year, 3, 1).to_moment() and tools.is_julian_leap_year(self.year):
+        if t >= JulianDate(year, 3, 1).to_moment() and tools.is_julian_leap_year(year):
             correction = 1
 
-        self.month = int(math.floor((12 * (prior_days + correction) + 373) / 367))
+        month = int(math.floor((12 * (prior_days + correction) + 373) / 367))
+
+        return cls(year, month, int(t - JulianDate(year, month, 1).to_moment() + 1))
 
-        self.day = int(t - JulianDate(self.year, self.month, 1).to_moment() + 1)
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of Julian dates (without a year 0) to RD days.
+        RDM (3.3).
+        :param year: Array of years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :return: Array of RD days (int64).
+        """
+        year = np.asarray(year, dtype=np.int64)
+        month = np.asarray(month, dtype=np.int64)
+        y = np.where(year < 0, year + 1, year)
+
+        return JulianDate.EPOCH - 1 + 365 * (y - 1) + (y - 1) // 4 + (367 * month - 362) // 12 + \
+            np.where(month <= 2, 0, np.where(y % 4 == 0, -1, -2)) + np.asarray(day, dtype=np.int64)
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Julian dates.
+        RDM (3.4).
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months and days (int64).
+        """
+        t = tools.to_rata_die_array(t)
+        approx = (4 * (t - JulianDate.EPOCH) + 1464) // 1461
+        year = np.where(approx > 0, approx, approx - 1)
+        y = np.where(year < 0, year + 1, year)
+
+        prior_days = t - cls.to_moments(year, 1, 1)
+        correction = np.where(t < cls.to_moments(year, 3, 1), 0, np.where(y % 4 == 0, 1, 2))
+        month = (12 * (prior_days + correction) + 373) // 367
+
+        return year, month, t - cls.to_moments(year, month, 1) + 1
+    # endregion
 
     # region String representation
     def to_string(self, format_string: str = None) -> str:
@@ -86,6 +121,6 @@ class JulianDate(AbstractDate):
             case "dmy":
                 return f"{self.day} {GregorianDate.MONTHS[self.month - 1]} {self.year}"
             case _ :
-                return super().to_string()
+                return AbstractDate.to_string(self)
     # endregion
 
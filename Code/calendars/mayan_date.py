@@ -0,0 +1,77 @@
+from calendars.abstract_date import AbstractDate
+from calendars.mayan_haab_date import MayanHaabDate
+from calendars.mayan_long_count import MayanLongCountDate
+from calendars.mayan_tzolkin_date import MayanTzolkinDate
+from dataclasses import dataclass, field
+import numpy as np
+import tools
+
+
+class MayanDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class MayanDate(AbstractDate):
+    """
+    Composite Mayan date: Long Count together with the calendar round (Haab and Tzolkin) of the same day,
+    as found in inscriptions (RDM 10).
+    """
+    # region Data Fields
+    long_count: MayanLongCountDate = field(default_factory=MayanLongCountDate)
+    haab: MayanHaabDate = field(default_factory=MayanHaabDate)
+    tzolkin: MayanTzolkinDate = field(default_factory=MayanTzolkinDate)
+    # endregion
+
+    # Record type of the bulk conversion: one record per RD day.
+    DTYPE = np.dtype([("rd", np.int64),
+                      ("baktun", np.int64),
+                      ("katun", np.int8),
+                      ("tun", np.int8),
+                      ("uinal", np.int8),
+                      ("kin", np.int8),
+                      ("haab_month", np.int8),
+                      ("haab_day", np.int8),
+                      ("tzolkin_number", np.int8),
+                      ("tzolkin_name", np.int8)])
+
+    def to_moment(self) -> float:
+        """
+        Converts the composite Mayan date to an RD time moment. Only the Long Count is needed for that,
+        the calendar round alone does not define a unique day.
+        :return: The RD time moment.
+        """
+        return self.long_count.to_moment()
+
+    @classmethod
+    def from_rd(cls, t: float) -> MayanDate:
+        """
+        Converts an RD time moment to a composite Mayan date.
+        :param t: The RD time moment to convert.
+        :return: The composite Mayan date.
+        """
+        return cls(MayanLongCountDate.from_rd(t), MayanHaabDate.from_rd(t), MayanTzolkinDate.from_rd(t))
+
+    # region Bulk conversion
+    @classmethod
+    def from_moments(cls, t) -> np.ndarray:
+        """
+        Converts an array of RD values to composite Mayan dates in one call,
+        e.g. to scan a large range of candidate days for the dates of an inscription.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Structured array of dtype MayanDate.DTYPE, one record per RD value.
+        """
+        t = tools.to_rata_die_array(t)
+        result = np.empty(t.shape, dtype=cls.DTYPE)
+
+        result["rd"] = t
+        result["baktun"], result["katun"], result["tun"], result["uinal"], result["kin"] = \
+            MayanLongCountDate.from_moments(t)
+        result["haab_month"], result["haab_day"] = MayanHaabDate.from_moments(t)
+        result["tzolkin_number"], result["tzolkin_name"] = MayanTzolkinDate.from_moments(t)
+
+        return result
+    # endregion
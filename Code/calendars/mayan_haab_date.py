@@ -1,25 +1,29 @@
 from calendars.abstract_date import AbstractDate
 from dataclasses import dataclass
+import numpy as np
 import tools
 
 
-@dataclass
+class MayanHaabDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class MayanHaabDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Mayan Haab calendar.
     """
 
     # region Data Fields
-    month: int
-    day: int
+    month: int = 0
+    day: int = 0
     # endregion
 
     EPOCH = tools.MAYAN_HAAB_EPOCH
 
-    def __init__(self, month: int = 0, day: int = 0):
-        self.month = month
-        self.day = day
-
     def to_moment(self) -> float:
         """
         It is not possible to convert a haab date to an R.D. date because without a “year”
@@ -28,13 +32,26 @@ class MayanHaabDate(AbstractDate):
         """
         pass
 
-    def from_moment(self, t: float) -> None:
+    @classmethod
+    def from_rd(cls, t: float) -> MayanHaabDate:
         """
         Converts an RD time moment to a Mayan Haab date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of MayanHaabDate is generated instead.
+        :return: The Mayan Haab date.
         RDM (10.6)
         """
         count = tools.fmod(t - MayanHaabDate.EPOCH, 365)
-        self.day = int(tools.fmod(count, 20))
-        self.month = 1 + int(tools.quotient(count, 20))
+
+        return cls(1 + int(tools.quotient(count, 20)), int(tools.fmod(count, 20)))
+
+    # region Bulk conversion
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Mayan Haab dates.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of months and days (int64).
+        """
+        month, day = np.divmod((tools.to_rata_die_array(t) - cls.EPOCH) % 365, 20)
+        return month + 1, day
+    # endregion
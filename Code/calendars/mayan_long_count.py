@@ -1,40 +1,31 @@
 from calendars.abstract_date import AbstractDate
 from dataclasses import dataclass
+import numpy as np
 import tools
 
-@dataclass
+class MayanLongCountDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class MayanLongCountDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Mayan Long Count calendar.
     """
 
     # region Data Fields
-    baktun: int
-    katun: int
-    tun: int
-    uinal: int
-    kin: int
+    baktun: int = 0
+    katun: int = 0
+    tun: int = 0
+    uinal: int = 0
+    kin: int = 0
     # endregion
 
     EPOCH = tools.MAYAN_LONG_COUNT_EPOCH
 
-    # region Initialization
-    def __init__(self, baktun: int=0, katun: int=0, tun: int=0, uinal: int=0, kin: int=0):
-        """
-        Initialization from data.
-        :param baktun:
-        :param katun:
-        :param tun:
-        :param uinal:
-        :param kin:
-        """
-        self.baktun = baktun
-        self.katun = katun
-        self.tun = tun
-        self.uinal = uinal
-        self.kin = kin
-    # endregion
-
     def to_moment(self) -> float:
         """
         Converts a Mayan Long Count date to an RD time moment.
@@ -44,25 +35,53 @@ class MayanLongCountDate(AbstractDate):
         return MayanLongCountDate.EPOCH + self.baktun * 144000 + self.katun * 7200 + \
                self.tun * 360 + self.uinal * 20 + self.kin
 
-    def from_moment(self, t: float) -> None:
+    @classmethod
+    def from_rd(cls, t: float) -> MayanLongCountDate:
         """
         Converts an RD time moment to a Mayan Long Count date.
-        RDM (3.4).
-        :param t: The RD time moment to convert.
-        :return: None. The instance of MayanLongCountDate is generated instead.
         RDM (10.3).
-        :param t:
-        :return:
+        :param t: The RD time moment to convert.
+        :return: The Mayan Long Count date.
         """
         long_count = t - MayanLongCountDate.EPOCH
-        self.baktun = int(tools.quotient(long_count, 144000))
+        baktun = int(tools.quotient(long_count, 144000))
         day_of_baktun = tools.fmod(long_count, 144000)
-        self.katun = int(tools.quotient(day_of_baktun, 7200))
+        katun = int(tools.quotient(day_of_baktun, 7200))
         day_of_katun = tools.fmod(day_of_baktun, 7200)
-        self.tun = int(tools.quotient(day_of_katun, 360))
+        tun = int(tools.quotient(day_of_katun, 360))
         day_of_tun = tools.fmod(day_of_katun, 360)
-        self.uinal = int(tools.quotient(day_of_tun, 20))
-        self.kin = int(tools.fmod(day_of_tun, 20))
+        uinal = int(tools.quotient(day_of_tun, 20))
+        kin = int(tools.fmod(day_of_tun, 20))
 
+        return cls(baktun, katun, tun, uinal, kin)
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, baktun, katun, tun, uinal, kin) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of Mayan Long Count dates to RD days.
+        :param baktun: Array of baktuns.
+        :param katun: Array of katuns.
+        :param tun: Array of tuns.
+        :param uinal: Array of uinals.
+        :param kin: Array of kins.
+        :return: Array of RD days (int64).
+        """
+        return cls.EPOCH + 144000 * np.asarray(baktun, dtype=np.int64) + 7200 * np.asarray(katun, dtype=np.int64) + \
+            360 * np.asarray(tun, dtype=np.int64) + 20 * np.asarray(uinal, dtype=np.int64) + \
+            np.asarray(kin, dtype=np.int64)
 
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: decomposes an array of RD values into Long Count places with integer divmod.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of baktuns, katuns, tuns, uinals and kins (int64).
+        """
+        baktun, day_of_baktun = np.divmod(tools.to_rata_die_array(t) - cls.EPOCH, 144000)
+        katun, day_of_katun = np.divmod(day_of_baktun, 7200)
+        tun, day_of_tun = np.divmod(day_of_katun, 360)
+        uinal, kin = np.divmod(day_of_tun, 20)
 
+        return baktun, katun, tun, uinal, kin
+    # endregion
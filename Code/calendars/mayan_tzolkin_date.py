@@ -1,5 +1,6 @@
 from calendars.abstract_date import AbstractDate
 from dataclasses import dataclass
+import numpy as np
 import tools
 
 
@@ -14,28 +15,26 @@ def ordinal(number: int, name: int):
     return tools.fmod(number - 1 + 39 * (number - name), 260)
 
 
-@dataclass
+class MayanTzolkinDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class MayanTzolkinDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Mayan Tzolkin calendar.
     """
 
     # region Data Fields
-    number: int
-    name: int
+    number: int = 0
+    name: int = 0
     # endregion
 
     EPOCH = tools.MAYAN_LONG_COUNT_EPOCH - ordinal(4, 20)
 
-    def __init__(self, number: int = 0, name: int = 0):
-        """
-        Initialization.
-        :param number:
-        :param name:
-        """
-        self.number = number
-        self.name = name
-
     def to_moment(self) -> float:
         """
         Just as with the Haab calendar, it is impossible to convert a tzolkin date to an R.D. date.  (RDM 10.2, p.148.)
@@ -43,13 +42,26 @@ class MayanTzolkinDate(AbstractDate):
         """
         pass
 
-    def from_moment(self, t: float) -> None:
+    @classmethod
+    def from_rd(cls, t: float) -> MayanTzolkinDate:
         """
         Converts an RD time moment to a Mayan Tzolkin date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of MayanTzolkinDate is generated instead.
+        :return: The Mayan Tzolkin date.
         RDM (10.9)
         """
         count = t - MayanTzolkinDate.EPOCH + 1
-        self.number = int(tools.amod(count, 13))
-        self.name = int(tools.amod(count, 20))
+
+        return cls(int(tools.amod(count, 13)), int(tools.amod(count, 20)))
+
+    # region Bulk conversion
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Mayan Tzolkin dates.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of numbers and names (int64).
+        """
+        count = tools.to_rata_die_array(t) - int(cls.EPOCH)
+        return count % 13 + 1, count % 20 + 1
+    # endregion
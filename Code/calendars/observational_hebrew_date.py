@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+import astro
+import location
+import moon
+import times
+import tools
+from calendars.abstract_date import AbstractDate
+from calendars.hebrew_date import HebrewDate
+from location import Location
+
+
+class ObservationalHebrewDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ObservationalHebrewDate(AbstractDate):
+    """
+    Implements conversion to and from RD time moment for the observational Hebrew calendar (RDU 18):
+    each month starts on the day after the evening on which the crescent of the new moon is first visible
+    at LOCATION (Haifa), by the criterion of moon.visible_crescents, and the year (counted from Nisan)
+    starts with the first month starting on or after the day 13 days before the vernal equinox
+    (14 if the equinox is before sunset), so that the 15th of Nisan is on or after the equinox.
+
+    The months are numbered as in HebrewDate (Nisan = 1, Tishri = 7, Adar II = 13), and the years change at Tishri.
+    The first days of the months are read from the store of first crescents (moon.first_crescents),
+    so visibility is computed once per lunation and location, whatever the conversions.
+    The bulk conversions take another location as an option.
+    """
+    # region Data Fields
+    year: int = 0   # Hebrew year.
+    month: int = 0  # Hebrew month (Nisan = 1).
+    day: int = 0    # Hebrew day.
+    # endregion
+
+    LOCATION = location.HAIFA
+
+    # Hebrew year of the Nisan in the spring of a Gregorian year, minus the Gregorian year.
+    YEAR_OFFSET = 3760
+
+    def to_moment(self) -> float:
+        """
+        Converts the observational Hebrew date to an RD time moment.
+        RDU 18.
+        :return: The RD time moment.
+        """
+        return int(self.to_moments(self.year, self.month, self.day)[()])
+
+    @classmethod
+    def from_rd(cls, t: float) -> ObservationalHebrewDate:
+        """
+        Converts an RD time moment to an observational Hebrew date.
+        RDU 18.
+        :param t: The RD time moment to convert.
+        :return: The observational Hebrew date.
+        """
+        year, month, day = cls.from_moments(np.array([t]))
+
+        return cls(int(year[0]), int(month[0]), int(day[0]))
+
+    @classmethod
+    def nisan_lunations(cls, gregorian_years, location: Location = None) -> np.ndarray:
+        """
+        The lunations of the first months (Nisan) of the years starting in the springs of Gregorian years.
+        RDU 18 (observational Hebrew first of Nisan).
+        :param gregorian_years: Array of Gregorian years.
+        :param location: The location of the observation (LOCATION by default).
+        :return: Array of lunation numbers (int64).
+        """
+        location = location or cls.LOCATION
+        years, inverse = np.unique(np.asarray(gregorian_years, dtype=np.int64), return_inverse=True)
+
+        if not years.size:
+            return np.zeros(np.shape(gregorian_years), dtype=np.int64)
+
+        # The vernal equinoxes fall between March 10 and 30 of the proleptic Gregorian calendar.
+        new_years = tools.gregorian_new_years(years)
+        equinox = times.solar_longitude_after(times.SPRING, new_years + 68, new_years + 89)
+        day = np.floor(equinox).astype(np.int64)
+
+        alpha = astro.sunrise_depression(0, location)
+        sunset = astro.depression_moments(day, location.latitude, location.longitude, location.zone, alpha,
+                                          astro.EVENING, *astro.daily_solar_state(day), 3) - location.zone / 24
+        start = day - np.where(equinox < sunset, 14, 13)
+
+        # The phasis on or after the start: the month of the day before starts before it, so Nisan is the next one,
+        # the first month starting on or after the start.
+        lunation, _ = moon.lunar_months(start - 1, location)
+        lunation = lunation + 1
+
+        return lunation[inverse.reshape(np.shape(gregorian_years))]
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day, location: Location = None) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of observational Hebrew dates to RD days.
+        :param year: Array of years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :param location: The location of the observation (LOCATION by default).
+        :return: Array of RD days (int64).
+        """
+        location = location or cls.LOCATION
+        year = np.asarray(year, dtype=np.int64)
+        month = np.asarray(month, dtype=np.int64)
+
+        gregorian_year = year - cls.YEAR_OFFSET - (month >= HebrewDate.TISHRI)
+        lunation = cls.nisan_lunations(gregorian_year, location) + month - 1
+
+        return moon.first_crescents(lunation, location) + np.asarray(day, dtype=np.int64) - 1
+
+    @classmethod
+    def from_moments(cls, t, location: Location = None) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to observational Hebrew dates.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :param location: The location of the observation (LOCATION by default).
+        :return: Arrays of years, months and days (int64).
+        """
+        location = location or cls.LOCATION
+        t = tools.to_rata_die_array(t)
+        lunation, start = moon.lunar_months(t, location)
+
+        # The year from Nisan containing the month: that of the Gregorian year of the month, or the one before.
+        gregorian_year = tools.gregorian_years_from_rata_die(start)
+        nisan = cls.nisan_lunations(gregorian_year, location)
+        before = lunation < nisan
+        gregorian_year = gregorian_year - before
+        nisan[before] = cls.nisan_lunations(gregorian_year[before], location)
+
+        month = lunation - nisan + 1
+
+        return gregorian_year + cls.YEAR_OFFSET + (month >= HebrewDate.TISHRI), month, t - start + 1
+    # endregion
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+import location
+import moon
+import tools
+from calendars.abstract_date import AbstractDate
+from location import Location
+
+
+class ObservationalIslamicDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ObservationalIslamicDate(AbstractDate):
+    """
+    Implements conversion to and from RD time moment for the observational Islamic calendar (RDU 18):
+    each month starts on the day after the evening on which the crescent of the new moon is first visible
+    at LOCATION (Cairo), by the criterion of moon.visible_crescents.
+
+    The Islamic months are the lunations counted from the epoch: the month (year, month) is the lunation
+    12 * (year - 1) + month - 1 + LUNATION_OFFSET. Their first days are read from the store of first crescents
+    (moon.first_crescents), so visibility is computed once per lunation and location, whatever the conversions.
+    The bulk conversions take another location as an option.
+    """
+    # region Data Fields
+    year: int = 0   # Islamic year.
+    month: int = 0  # Islamic month.
+    day: int = 0    # Islamic day.
+    # endregion
+
+    EPOCH = tools.ISLAMIC_EPOCH
+    LOCATION = location.CAIRO
+
+    # The lunation of the first month (1 Muharram 1 AH, RD 227015): the middles of the months, EPOCH + (k + 1/2)
+    # mean months, fall 57% into the mean lunations k + LUNATION_OFFSET.
+    LUNATION_OFFSET = -17037
+
+    def to_moment(self) -> float:
+        """
+        Converts the observational Islamic date to an RD time moment.
+        RDU 18.
+        :return: The RD time moment.
+        """
+        return int(self.to_moments(self.year, self.month, self.day)[()])
+
+    @classmethod
+    def from_rd(cls, t: float) -> ObservationalIslamicDate:
+        """
+        Converts an RD time moment to an observational Islamic date.
+        RDU 18.
+        :param t: The RD time moment to convert.
+        :return: The observational Islamic date.
+        """
+        year, month, day = cls.from_moments(np.array([t]))
+
+        return cls(int(year[0]), int(month[0]), int(day[0]))
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day, location: Location = None) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of observational Islamic dates to RD days.
+        :param year: Array of years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :param location: The location of the observation (LOCATION by default).
+        :return: Array of RD days (int64).
+        """
+        months = 12 * (np.asarray(year, dtype=np.int64) - 1) + np.asarray(month, dtype=np.int64) - 1
+
+        return moon.first_crescents(months + cls.LUNATION_OFFSET, location or cls.LOCATION) + \
+            np.asarray(day, dtype=np.int64) - 1
+
+    @classmethod
+    def from_moments(cls, t, location: Location = None) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to observational Islamic dates.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :param location: The location of the observation (LOCATION by default).
+        :return: Arrays of years, months and days (int64).
+        """
+        t = tools.to_rata_die_array(t)
+        lunation, start = moon.lunar_months(t, location or cls.LOCATION)
+        year, month = np.divmod(lunation - cls.LUNATION_OFFSET, 12)
+
+        return year + 1, month + 1, t - start + 1
+    # endregion
@@ -1,36 +1,37 @@
 from calendars.abstract_date import AbstractDate
 from calendars.old_hindu_solar_date import OldHinduSolarDate
 from dataclasses import dataclass
+from fractions import Fraction
 import math
+import numpy as np
 import tools
 
 
-@dataclass
+class OldHinduLunarDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class OldHinduLunarDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Old Hindu Lunar calendar.
     """
     # region Data Fields
-    year: int
-    month: int
-    is_leap_month: bool
-    day: int
+    year: int = 0                   # Old Hindu Lunar year.
+    month: int = 0                  # Old Hindu Lunar month.
+    is_leap_month: bool = False     # The leap month indicator.
+    day: int = 0                    # Old Hindu Lunar day.
     # endregion
 
     ARYA_LUNAR_MONTH = 1577917500 / 53433336
     ARYA_LUNAR_DAY = ARYA_LUNAR_MONTH / 30
 
-    def __init__(self, year: int = 0, month: int = 0, is_leap_lunar_month: bool = False, day: int = 0):
-        """
-        Initialization.
-        :param year: Old Hindu Solar year.
-        :param month: Old Hindu Solar month
-        :param day: Old Hindu Solar day.
-        """
-        self.year = year
-        self.month = month
-        self.is_leap_month = is_leap_lunar_month
-        self.day = day
+    # Exact (rational) values of the periods above, used by the bulk conversion.
+    ARYA_LUNAR_MONTH_EXACT = Fraction(1577917500, 53433336)
+    ARYA_LUNAR_DAY_EXACT = ARYA_LUNAR_MONTH_EXACT / 30
 
     def to_moment(self) -> float:
         """
@@ -59,21 +60,90 @@ class OldHinduLunarDate(AbstractDate):
 
         return result
 
-    def from_moment(self, t: float):
+    @classmethod
+    def from_rd(cls, t: float) -> OldHinduLunarDate:
         """
         Converts an RD time moment to an Old Hindu Lunar date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of OldHinduLunarDate will be generated instead.
+        :return: The Old Hindu Lunar date.
         RDM (9.13).
         """
         sun = t - OldHinduSolarDate.EPOCH + 0.25
         new_moon = sun - tools.fmod(sun, OldHinduLunarDate.ARYA_LUNAR_MONTH)
-        self.is_leap_month = OldHinduSolarDate.ARYA_SOLAR_MONTH - \
-                             OldHinduLunarDate.ARYA_LUNAR_MONTH >= tools.fmod(new_moon,
-                                                                              OldHinduSolarDate.ARYA_SOLAR_MONTH) \
-                             and tools.fmod(new_moon, OldHinduSolarDate.ARYA_SOLAR_MONTH) > 0
-
-        self.month = 1 + int(tools.fmod(math.ceil(new_moon / OldHinduSolarDate.ARYA_SOLAR_MONTH), 12))
-        self.day = 1 + int(tools.fmod(tools.quotient(sun, OldHinduLunarDate.ARYA_LUNAR_DAY), 30))
-        self.year = int(math.ceil((new_moon + OldHinduSolarDate.ARYA_SOLAR_MONTH) /
-                                  OldHinduSolarDate.ARYA_SOLAR_YEAR) - 1)
+        is_leap_month = OldHinduSolarDate.ARYA_SOLAR_MONTH - \
+                        OldHinduLunarDate.ARYA_LUNAR_MONTH >= tools.fmod(new_moon,
+                                                                         OldHinduSolarDate.ARYA_SOLAR_MONTH) \
+                        and tools.fmod(new_moon, OldHinduSolarDate.ARYA_SOLAR_MONTH) > 0
+
+        month = 1 + int(tools.fmod(math.ceil(new_moon / OldHinduSolarDate.ARYA_SOLAR_MONTH), 12))
+        day = 1 + int(tools.fmod(tools.quotient(sun, OldHinduLunarDate.ARYA_LUNAR_DAY), 30))
+        year = int(math.ceil((new_moon + OldHinduSolarDate.ARYA_SOLAR_MONTH) /
+                             OldHinduSolarDate.ARYA_SOLAR_YEAR) - 1)
+
+        return cls(year, month, is_leap_month, day)
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, is_leap_month, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of Old Hindu Lunar dates to RD days.
+        Uses exact rational arithmetic in int64 (periods as reduced fractions), hence is free of float rounding.
+        :param year: Array of Old Hindu Lunar years.
+        :param month: Array of months.
+        :param is_leap_month: Array of leap month flags.
+        :param day: Array of days.
+        :return: Array of RD days (int64).
+        """
+        year = np.asarray(year, dtype=np.int64)
+        month = np.asarray(month, dtype=np.int64)
+        is_leap_month = np.asarray(is_leap_month, dtype=bool)
+        day = np.asarray(day, dtype=np.int64)
+
+        # Lunar month / solar month.
+        ratio = cls.ARYA_LUNAR_MONTH_EXACT / OldHinduSolarDate.ARYA_SOLAR_MONTH_EXACT
+        a, b = ratio.numerator, ratio.denominator
+
+        # Mina (the solar month preceding the year), and the first new moon after it, in lunar months.
+        mina = 12 * year - 1
+        new_year = (b * mina) // a + 1
+
+        # ceil((lunar_new_year - mina) / (solar month - lunar month))
+        leap = -((b * mina - a * new_year) // (b - a))
+        lunar_months = new_year + np.where(~is_leap_month & (leap <= month), month, month - 1)
+
+        p, q = cls.ARYA_LUNAR_DAY_EXACT.numerator, cls.ARYA_LUNAR_DAY_EXACT.denominator
+
+        # floor(lunar_days * p / q + 3 / 4)
+        return OldHinduSolarDate.EPOCH + (4 * p * (30 * lunar_months + day - 1) + 3 * q) // (4 * q)
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Old Hindu Lunar dates
+        with exact rational arithmetic in int64.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months, leap month flags and days.
+        """
+        # The sunrise of the day, in quarters of a day since the epoch.
+        sun4 = 4 * (tools.to_rata_die_array(t) - OldHinduSolarDate.EPOCH) + 1
+
+        # The last new moon, in lunar months since the epoch.
+        p, q = cls.ARYA_LUNAR_MONTH_EXACT.numerator, cls.ARYA_LUNAR_MONTH_EXACT.denominator
+        new_moon = (q * sun4) // (4 * p)
+
+        # The new moon in solar months: whole months elapsed and the remainder, in units of 1 / b solar month.
+        ratio = cls.ARYA_LUNAR_MONTH_EXACT / OldHinduSolarDate.ARYA_SOLAR_MONTH_EXACT
+        a, b = ratio.numerator, ratio.denominator
+        solar_months, remainder = np.divmod(a * new_moon, b)
+
+        is_leap_month = (remainder > 0) & (remainder <= b - a)
+        month = 1 + (solar_months + (remainder > 0)) % 12
+
+        p, q = cls.ARYA_LUNAR_DAY_EXACT.numerator, cls.ARYA_LUNAR_DAY_EXACT.denominator
+        day = 1 + ((q * sun4) // (4 * p)) % 30
+
+        # ceil((new_moon + solar month) / solar year) - 1
+        year = -((-(a * new_moon + b)) // (12 * b)) - 1
+
+        return year, month, is_leap_month, day
+    # endregion
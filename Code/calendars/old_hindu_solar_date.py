@@ -1,18 +1,27 @@
 from calendars.abstract_date import AbstractDate
 from dataclasses import dataclass
+from fractions import Fraction
 import math
+import numpy as np
 import tools
 
 
-@dataclass
+class OldHinduSolarDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class OldHinduSolarDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Old Hindu Solar calendar.
     """
     # region Data Fields
-    year: int
-    month: int
-    day: int
+    year: int = 0   # Old Hindu Solar year.
+    month: int = 0  # Old Hindu Solar month.
+    day: int = 0    # Old Hindu Solar day.
     # endregion
 
     # Fixed date of start of the Hindu calendar (Kali Yuga).
@@ -21,16 +30,9 @@ class OldHinduSolarDate(AbstractDate):
     ARYA_SOLAR_MONTH = ARYA_SOLAR_YEAR / 12
     ARYA_JOVIAN_PERIOD = 1577917500 / 364224
 
-    def __init__(self, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Initialization.
-        :param year: Old Hindu Solar year.
-        :param month: Old Hindu Solar month
-        :param day: Old Hindu Solar day.
-        """
-        self.year = year
-        self.month = month
-        self.day = day
+    # Exact (rational) values of the periods above, used by the bulk conversion.
+    ARYA_SOLAR_YEAR_EXACT = Fraction(1577917500, 4320000)
+    ARYA_SOLAR_MONTH_EXACT = ARYA_SOLAR_YEAR_EXACT / 12
 
     def to_moment(self) -> float:
         """
@@ -39,15 +41,16 @@ class OldHinduSolarDate(AbstractDate):
         RDM (9.7).
         """
         result = OldHinduSolarDate.EPOCH + self.year * OldHinduSolarDate.ARYA_SOLAR_YEAR + \
-                 (self.month - 1) * OldHinduSolarDate.ARYA_SOLAR_MONTH + self.day - 0.25
+                 (self.month - 1) * OldHinduSolarDate.ARYA_SOLAR_MONTH + self.day - 1.25
 
-        return math.floor(result)
+        return math.ceil(result)
 
-    def from_moment(self, t: float):
+    @classmethod
+    def from_rd(cls, t: float) -> OldHinduSolarDate:
         """
         Converts an RD time moment to an Old Hindu Solar date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of OldHinduSolarDate will be generated instead.
+        :return: The Old Hindu Solar date.
         RDM (9.8).
         """
         sun = (t - OldHinduSolarDate.EPOCH) + 0.25
@@ -56,7 +59,42 @@ class OldHinduSolarDate(AbstractDate):
         month = 1 + int(tools.fmod(tools.quotient(sun,  OldHinduSolarDate.ARYA_SOLAR_MONTH), 12))
         day = 1 + int(math.floor(tools.fmod(sun, OldHinduSolarDate.ARYA_SOLAR_MONTH)))
 
-        self.year = year
-        self.month = month
-        self.day = day
+        return cls(year, month, day)
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of Old Hindu Solar dates to RD days.
+        Uses exact rational arithmetic in int64 (periods as reduced fractions), hence is free of float rounding.
+        :param year: Array of Old Hindu Solar years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :return: Array of RD days (int64).
+        """
+        months = 12 * np.asarray(year, dtype=np.int64) + np.asarray(month, dtype=np.int64) - 1
+        p, q = cls.ARYA_SOLAR_MONTH_EXACT.numerator, cls.ARYA_SOLAR_MONTH_EXACT.denominator
+
+        # ceil(months * p / q - 5 / 4)
+        return cls.EPOCH + np.asarray(day, dtype=np.int64) - (5 * q - 4 * p * months) // (4 * q)
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Old Hindu Solar dates
+        with exact rational arithmetic in int64.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months and days (int64).
+        """
+        # The sunrise of the day, in quarters of a day since the epoch.
+        sun4 = 4 * (tools.to_rata_die_array(t) - cls.EPOCH) + 1
+
+        p, q = cls.ARYA_SOLAR_YEAR_EXACT.numerator, cls.ARYA_SOLAR_YEAR_EXACT.denominator
+        year = (q * sun4) // (4 * p)
 
+        p, q = cls.ARYA_SOLAR_MONTH_EXACT.numerator, cls.ARYA_SOLAR_MONTH_EXACT.denominator
+        months = (q * sun4) // (4 * p)
+        day = 1 + (q * sun4 - 4 * p * months) // (4 * q)
+
+        return year, 1 + months % 12, day
+    # endregion
@@ -7,30 +7,26 @@ import tools
 from calendars.abstract_date import AbstractDate
 
 
-@dataclass
+class PersianDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class PersianDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Astronomical Persian calendar (RDM 13.2, p. 213).
     """
     # region Data Fields
-    year: int
-    month: int
-    day: int
+    year: int = 0   # Astronomical Persian year.
+    month: int = 0  # Astronomical Persian month.
+    day: int = 0    # Astronomical Persian day.
     # endregion
 
     EPOCH = tools.PERSIAN_EPOCH
 
-    def __init__(self, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Initialization.
-        :param year: Astronomical Persian year.
-        :param month: Astronomical Persian month
-        :param day: Astronomical Persian day.
-        """
-        self.year = year
-        self.month = month
-        self.day = day
-
     def to_moment(self) -> float:
         """
         Converts an Astronomical Persian date to an RD time moment.
@@ -49,48 +45,51 @@ class PersianDate(AbstractDate):
         if self.month <= 7:
             result += 31 * (self.month - 1)
         else:
-            result += 30 * (month - 1) + 6
+            result += 30 * (self.month - 1) + 6
 
         result += self.day
 
         return result
 
-    def from_moment(self, t: float):
+    @classmethod
+    def from_rd(cls, t: float) -> PersianDate:
         """
         Converts an RD time moment to a Astronomical Persian date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of PersianDate is generated instead.
+        :return: The Astronomical Persian date.
         RDM (13.6)
         """
-        new_year = self._new_year_on_or_before(t)
+        new_year = cls._new_year_on_or_before(t)
         y = 1 + round((new_year - PersianDate.EPOCH) / times.MEAN_TROPICAL_YEAR)
-        self.year = int(y) if 0 < y else int(y) - 1
-        day_of_year = 1 + t - self._to_fixed(self.year, 1, 1)
+        year = int(y) if 0 < y else int(y) - 1
+        day_of_year = 1 + t - cls._to_fixed(year, 1, 1)
 
         if day_of_year < 186:
-            self.month = int(math.ceil(day_of_year / 31))
+            month = int(math.ceil(day_of_year / 31))
         else:
-            self.month = int(math.ceil((day_of_year - 6) / 30))
+            month = int(math.ceil((day_of_year - 6) / 30))
 
-        self.day = int(t - self._to_fixed(self.year, self.month, 1) + 1)
+        return cls(year, month, int(t - cls._to_fixed(year, month, 1) + 1))
 
     # region Protected Auxiliary
-    def _new_year_on_or_before(self, rd: float) -> int:
+    @classmethod
+    def _new_year_on_or_before(cls, rd: float) -> int:
         """
         Fixed date of Astronomical Persian New Year on or before fixed date.
         :param rd: The fixed date (Rata Die).
         :return: The Rata Die value for the Persian new Year on or before the date.
         """
-        approx = times.estimate_prior_solar_longitude(self._midday_in_tehran(rd), times.SPRING)
+        approx = times.estimate_prior_solar_longitude(cls._midday_in_tehran(rd), times.SPRING)
 
         i = int(math.floor(approx)) - 1
 
-        while not times.solar_longitude(self._midday_in_tehran(i)) <= times.SPRING + 2:
+        while not times.solar_longitude(cls._midday_in_tehran(i)) <= times.SPRING + 2:
             i += 1
 
         return i
 
-    def _midday_in_tehran(self, rd: float) -> float:
+    @classmethod
+    def _midday_in_tehran(cls, rd: float) -> float:
         """
         Universal time of midday on fixed date in Tehran.
         :param rd: The Rate Die value of a date.
@@ -98,9 +97,10 @@ class PersianDate(AbstractDate):
         """
         return times.standard_to_universal(times.midday(rd, location.TEHRAN), location.TEHRAN)
 
-    def _to_fixed(self, year: int, month: int, day: int) -> float:
+    @classmethod
+    def _to_fixed(cls, year: int, month: int, day: int) -> float:
         year_factor = year - 1 if 0 < year else year
-        new_year = self._new_year_on_or_before(PersianDate.EPOCH + 180 + math.floor(times.MEAN_TROPICAL_YEAR * year_factor))
+        new_year = cls._new_year_on_or_before(PersianDate.EPOCH + 180 + math.floor(times.MEAN_TROPICAL_YEAR * year_factor))
 
         result = new_year - 1
 
@@ -127,7 +127,6 @@ if __name__ == '__main__':
 
     print(t)
 
-    persian1 = PersianDate()
-    persian1.from_moment(t)
+    persian1 = PersianDate.from_rd(t)
 
     print(persian1)
@@ -30,7 +30,14 @@ COUNT_NAMES = ["",
 EVENT_NAMES = ["Kalens", "Nones", "Ides"]
 
 
-@dataclass
+class RomanDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
 class RomanDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Roman calendar.
@@ -41,29 +48,13 @@ class RomanDate(AbstractDate):
     """
 
     # region Data Fields
-    year: int
-    month: int
-    event: int  # The next event (KALENDS / NONES / IDES)
-    count: int  # The inclusive count of days until the event
-    is_leap_day: bool  # The leap day indicator
-
+    year: int = 0               # The Julian year
+    month: int = 0              # The Julian month
+    event: int = 0              # The next event (KALENDS / NONES / IDES)
+    count: int = 0              # The inclusive count of days until the event
+    is_leap_day: bool = False   # The leap day indicator
     # endregion
 
-    def __init__(self, year: int = 0, month: int = 0, event: int = 0, count: int = 0, is_leap_day: bool = False):
-        """
-        Initialization.
-        :param year: The Julian year
-        :param month: The Julian month
-        :param event: The next event (KALENDS / NONES / IDES)
-        :param count: The inclusive count of days until the event
-        :param is_leap_day: The leap day indicator.
-        """
-        self.year = year
-        self.month = month
-        self.event = event
-        self.count = count
-        self.is_leap_day = is_leap_day
-
     def to_moment(self) -> float:
         """
         Converts the Roman date to an RD time moment.
@@ -92,15 +83,15 @@ class RomanDate(AbstractDate):
 
         return result
 
-    def from_moment(self, t: float):
+    @classmethod
+    def from_rd(cls, t: float) -> RomanDate:
         """
         Converts an RD time moment to a Roman date.
         :param t: The RD time moment to convert.
-        :return: None. The instance of RomanDate is generated instead.
+        :return: The Roman date.
         RDM (3.11)
         """
-        j = JulianDate()
-        j.from_moment(t)
+        j = JulianDate.from_rd(t)
 
         m = j.month
         d = j.day
@@ -116,49 +107,26 @@ class RomanDate(AbstractDate):
         kalends1 = RomanDate(year_prime, month_prime, KALENDS, 1, False).to_moment()
 
         if d == 1:
-            self.year = y
-            self.month = m
-            self.event = KALENDS
-            self.count = 1
-            self.is_leap_day = False
-
-        elif d <= self._nones_of_month(m):
-            self.year = y
-            self.month = m
-            self.event = NONES
-            self.count = self._nones_of_month(m) - d + 1
-            self.is_leap_day = False
-
-        elif d <= self._ides_of_month(m):
-            self.year = y
-            self.month = m
-            self.event = IDES
-            self.count = self._ides_of_month(m) - d + 1
-            self.is_leap_day = False
+            return cls(y, m, KALENDS, 1, False)
+
+        elif d <= cls._nones_of_month(m):
+            return cls(y, m, NONES, cls._nones_of_month(m) - d + 1, False)
+
+        elif d <= cls._ides_of_month(m):
+            return cls(y, m, IDES, cls._ides_of_month(m) - d + 1, False)
 
         elif m != 2 or not tools.is_julian_leap_year(y):
-            self.year = year_prime
-            self.month = month_prime
-            self.event = KALENDS
-            self.count = int(kalends1 - t + 1)
-            self.is_leap_day = False
+            return cls(year_prime, month_prime, KALENDS, int(kalends1 - t + 1), False)
 
         elif d < 25:
-            self.year = y
-            self.month = 3
-            self.event = KALENDS
-            self.count = 30 - d
-            self.is_leap_day = False
+            return cls(y, 3, KALENDS, 30 - d, False)
 
         else:
-            self.year = y
-            self.month = 3
-            self.event = KALENDS
-            self.count = 31 - d
-            self.is_leap_day = (d == 25)
+            return cls(y, 3, KALENDS, 31 - d, d == 25)
 
     # region Protected Auxiliary
-    def _ides_of_month(self, month: int):
+    @staticmethod
+    def _ides_of_month(month: int):
         """
         Calculates the ides of a Roman month.
         RDM (3.8).
@@ -170,12 +138,13 @@ class RomanDate(AbstractDate):
         else:
             return 13
 
-    def _nones_of_month(self, month: int):
+    @staticmethod
+    def _nones_of_month(month: int):
         """
         Calculates the nones of a Roman month.
         RDM (3.9).
         :param month: The Roman month.
         :return: The value of the nones.
         """
-        return self._ides_of_month(month) - 8
+        return RomanDate._ides_of_month(month) - 8
     # endregion
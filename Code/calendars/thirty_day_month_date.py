@@ -0,0 +1,108 @@
+from calendars.abstract_date import AbstractDate
+from dataclasses import dataclass
+import math
+import numpy as np
+import tools
+
+
+class ThirtyDayMonthDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ThirtyDayMonthDate(AbstractDate):
+    """
+    Common engine for the calendars with twelve 30-day months followed by 5 (or 6 in leap years) epagomenal days:
+    Egyptian, Armenian and Zoroastrian (no leap years, RDM 1.9), as well as Coptic and Ethiopic (RDM 4).
+    A concrete calendar is defined by its EPOCH and LEAP_CYCLE only:
+        LEAP_CYCLE == 0: every year has 365 days;
+        LEAP_CYCLE == n: the last year of every n-year cycle (year % n == n - 1) has 366 days.
+    Concrete calendars must declare empty __slots__ to stay slotted.
+    """
+    # region Data Fields
+    year: int = 0   # The year.
+    month: int = 0  # The month (13 for the epagomenal days).
+    day: int = 0    # The day.
+    # endregion
+
+    EPOCH = 0
+    LEAP_CYCLE = 0
+
+    def to_moment(self) -> float:
+        """
+        Converts the date to an RD time moment.
+        RDM (1.40), (4.3).
+        :return: The RD time moment.
+        """
+        result = self.EPOCH - 1 + 365 * (self.year - 1) + 30 * (self.month - 1) + self.day
+
+        if self.LEAP_CYCLE:
+            result += math.floor(self.year / self.LEAP_CYCLE)
+
+        return result
+
+    @classmethod
+    def from_rd(cls, t: float) -> ThirtyDayMonthDate:
+        """
+        Converts an RD time moment to a date.
+        RDM (1.41), (4.4).
+        :param t: The RD time moment to convert.
+        :return: The date.
+        """
+        days = t - cls.EPOCH
+
+        if cls.LEAP_CYCLE:
+            n = cls.LEAP_CYCLE
+            year = math.floor((n * days + 366 * n - 1) / (365 * n + 1))
+            days -= 365 * (year - 1) + math.floor(year / n)
+        else:
+            year = math.floor(days / 365) + 1
+            days -= 365 * (year - 1)
+
+        month = int(math.floor(days / 30)) + 1
+
+        return cls(year, month, int(days - 30 * (month - 1)) + 1)
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of dates to RD days.
+        :param year: Array of years.
+        :param month: Array of months.
+        :param day: Array of days.
+        :return: Array of RD days (int64).
+        """
+        year = np.asarray(year, dtype=np.int64)
+        result = cls.EPOCH - 1 + 365 * (year - 1) + 30 * (np.asarray(month, dtype=np.int64) - 1) + \
+            np.asarray(day, dtype=np.int64)
+
+        if cls.LEAP_CYCLE:
+            result += year // cls.LEAP_CYCLE
+
+        return result
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to dates.
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months and days (int64).
+        """
+        days = tools.to_rata_die_array(t) - cls.EPOCH
+
+        if cls.LEAP_CYCLE:
+            n = cls.LEAP_CYCLE
+            year = (n * days + 366 * n - 1) // (365 * n + 1)
+            days -= 365 * (year - 1) + year // n
+        else:
+            year, days = np.divmod(days, 365)
+            year += 1
+
+        month, day = np.divmod(days, 30)
+
+        return year, month + 1, day + 1
+    # endregion
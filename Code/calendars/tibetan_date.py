@@ -0,0 +1,293 @@
+import math
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Callable
+
+import numpy as np
+
+import tools
+from calendars.abstract_date import AbstractDate
+
+
+class TibetanDate:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class TibetanDate(AbstractDate):
+    """
+    Implements conversion to and from RD time moment for the Tibetan (Phugpa) calendar (RDU 21).
+    A lunisolar calendar counting lunar days (tithis): months can be doubled (leap months), and because the lengths
+    of the lunar days vary with the sun's and moon's anomalies, days can be skipped or doubled (leap days).
+
+    The RD day of every lunar day follows from exact integer arithmetic (all the quantities of RDU (21.4) are
+    rationals with the common denominator DENOMINATOR). For bulk conversion, these days are kept in a table,
+    built on first use by blocks of TABLE_BLOCK lunar days and cached for the lifetime of the process:
+    conversion from RD is then a searchsorted in that table. The table covers at most the lunar days TABLE_TITHIS;
+    the dates outside are converted on just the lunar days around them. Month labels (leap or not) are closed-form.
+    """
+    # region Data Fields
+    year: int = 0                   # Tibetan year (Gregorian year + 127).
+    month: int = 0                  # Tibetan month.
+    leap_month: bool = False        # True for the first of two months with the same number.
+    day: int = 0                    # Tibetan day (the number of the lunar day).
+    leap_day: bool = False          # True for the second of two days with the same number.
+    # endregion
+
+    EPOCH = tools.TIBETAN_EPOCH
+
+    # Sun's and moon's equations in sixtieths of a day at the integer anomalies 0, 1, ..., 12 and 0, 1, ..., 28.
+    # RDU (21.2, 3), with the symmetries expanded; between the integers they are interpolated linearly.
+    SUN_EQUATION = np.array([0, 6, 10, 11, 10, 6, 0, -6, -10, -11, -10, -6, 0], dtype=np.int64)
+    MOON_EQUATION = np.array([0, 5, 10, 15, 19, 22, 24, 25, 24, 22, 19, 15, 10, 5,
+                              0, -5, -10, -15, -19, -22, -24, -25, -24, -22, -19, -15, -10, -5, 0], dtype=np.int64)
+
+    # Least common denominator of the mean day (11312), the sun's (402 * 60) and the moon's (3780 * 60) equations.
+    DENOMINATOR = 1534755600
+
+    # Average length of the year (RDU 21.5).
+    YEAR_LENGTH = 365 + Fraction(4975, 18382)
+
+    # The table of lunar days is extended by blocks of this many lunar days (about 700 years).
+    TABLE_BLOCK = 1 << 18
+
+    # The lunar day counts the table may cover (first, last + 1): about 5600 years on each side of the epoch.
+    TABLE_TITHIS = (-8 * TABLE_BLOCK, 8 * TABLE_BLOCK)
+
+    # The largest difference between a lunar day count and its estimate from an RD day.
+    TITHI_MARGIN = 64
+
+    # The table: the RD days of the lunar days _table_first_tithi, _table_first_tithi + 1, ...
+    _table_first_tithi = 0
+    _table = np.empty(0, dtype=np.int64)
+
+    def to_moment(self) -> float:
+        """
+        Converts the Tibetan date to an RD time moment.
+        RDU (21.4).
+        :return: The RD time moment.
+        """
+        return self._to_fixed(self.year, self.month, self.leap_month, self.day, self.leap_day)
+
+    @classmethod
+    def from_rd(cls, t: float) -> TibetanDate:
+        """
+        Converts an RD time moment to a Tibetan date.
+        RDU (21.5).
+        :param t: The RD time moment to convert.
+        :return: The Tibetan date.
+        """
+        t = math.floor(t)
+
+        years = math.ceil((t - cls.EPOCH) / cls.YEAR_LENGTH)
+        year0 = _final(years, lambda y: t >= cls._to_fixed(y, 1, False, 1, False))
+        month0 = _final(1, lambda m: t >= cls._to_fixed(year0, m, False, 1, False))
+        estimate = t - cls._to_fixed(year0, month0, False, 1, False)
+        day0 = _final(estimate - 2, lambda d: t >= cls._to_fixed(year0, month0, False, d, False))
+
+        leap_month = day0 > 30
+        day = int(tools.amod(day0, 30))
+
+        if day > day0:
+            month = month0 - 1
+        elif leap_month:
+            month = month0 + 1
+        else:
+            month = month0
+        month = int(tools.amod(month, 12))
+
+        if day > day0 and month0 == 1:
+            year = year0 - 1
+        elif leap_month and month0 == 12:
+            year = year0 + 1
+        else:
+            year = year0
+
+        leap_day = t == cls._to_fixed(year, month, leap_month, day, True)
+
+        return cls(year, month, leap_month, day, leap_day)
+
+    @classmethod
+    def is_leap_month(cls, year, month):
+        """
+        Checks whether a month is preceded by a leap month with the same number (scalars or arrays).
+        RDU (21.6): equivalently, whether the month count jumps by two from the preceding month.
+        :param year: The Tibetan year(s).
+        :param month: The Tibetan month(s).
+        :return: True if the month has a leap month.
+        """
+        n = 12 * (year - 1) + month
+
+        return (67 * n + 64) // 65 - (67 * (n - 1) + 64) // 65 == 2
+
+    # region Bulk conversion
+    @classmethod
+    def to_moments(cls, year, month, leap_month, day, leap_day) -> np.ndarray:
+        """
+        Vectorized to_moment: converts arrays of Tibetan dates to RD days.
+        :param year: Array of years.
+        :param month: Array of months.
+        :param leap_month: Array of leap month flags.
+        :param day: Array of days.
+        :param leap_day: Array of leap day flags.
+        :return: Array of RD days (int64).
+        """
+        tithis = 30 * cls._months(np.asarray(year, dtype=np.int64), np.asarray(month, dtype=np.int64),
+                                  np.asarray(leap_month, dtype=np.int64)) + np.asarray(day, dtype=np.int64)
+        result = np.empty(tithis.shape, dtype=np.int64)
+
+        inside = (cls.TABLE_TITHIS[0] <= tithis) & (tithis < cls.TABLE_TITHIS[1])
+
+        if np.any(inside):
+            cls._extend_table(int(tithis[inside].min()), int(tithis[inside].max()))
+            result[inside] = TibetanDate._table[tithis[inside] - TibetanDate._table_first_tithi]
+
+        result[~inside] = cls._fixed_from_tithis(tithis[~inside])
+
+        return result + np.asarray(leap_day, dtype=np.int64)
+
+    @classmethod
+    def from_moments(cls, t) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        """
+        Vectorized from_rd: converts an array of RD values to Tibetan dates by a binary search in the table
+        of lunar days (or, outside it, in the lunar days around each value).
+        :param t: Array of RD values (fractional moments are floored to their day).
+        :return: Arrays of years, months (int64), leap month flags (bool), days (int64) and leap day flags (bool).
+        """
+        t = tools.to_rata_die_array(t)
+        tithi = np.empty(t.shape, dtype=np.int64)
+        start = np.empty(t.shape, dtype=np.int64)
+
+        # Lunar days are 11135/11312 days long on average, and the equations stay below a day.
+        approx = (t - cls.EPOCH + 31) * 11312 // 11135
+        inside = (cls.TABLE_TITHIS[0] <= approx - cls.TITHI_MARGIN) & (approx + cls.TITHI_MARGIN < cls.TABLE_TITHIS[1])
+
+        if np.any(inside):
+            cls._extend_table(int(approx[inside].min()) - cls.TITHI_MARGIN,
+                              int(approx[inside].max()) + cls.TITHI_MARGIN)
+
+            table = TibetanDate._table
+            index = np.searchsorted(table, t[inside], side="right") - 1
+            tithi[inside] = TibetanDate._table_first_tithi + index
+            start[inside] = table[index]
+
+        if not np.all(inside):
+            tithi[~inside], start[~inside] = cls._search_tithis(t[~inside], approx[~inside])
+
+        leap_day = t > start
+        months, day = np.divmod(tithi - 1, 30)
+
+        # The last non-leap month with a count not after the month count; if it is before, this is its leap month.
+        n = 65 * months // 67
+        leap_month = (67 * n + 64) // 65 != months
+        n += leap_month
+
+        year, month = np.divmod(n - 1, 12)
+
+        return year + 1, month + 1, leap_month, day + 1, leap_day
+    # endregion
+
+    # region Protected Auxiliary
+    @classmethod
+    def _to_fixed(cls, year: int, month: int, leap_month: bool, day: int, leap_day: bool) -> int:
+        """
+        The RD day of a Tibetan date.
+        RDU (21.4).
+        """
+        return int(cls._fixed_from_tithis(np.array([30 * cls._months(year, month, leap_month) + day]))[0]) + leap_day
+
+    @staticmethod
+    def _months(year, month, leap_month):
+        """
+        The number of months elapsed until a month, as counted by RDU (21.4) (scalars or arrays).
+        """
+        return (804 * (year - 1) + 67 * month - 65 * leap_month + 64) // 65
+
+    @classmethod
+    def _fixed_from_tithis(cls, tithis: np.ndarray) -> np.ndarray:
+        """
+        The RD days of (non-leap) lunar days, counted as 30 * months + day, in exact integer arithmetic.
+        RDU (21.4): floor(epoch + mean - sun's equation + moon's equation), with the anomalies
+        solar = frac((13 days + 2117) / 4824) and lunar = frac((3781 days + 2837 * 7) / 105840).
+        :param tithis: Array of lunar day counts (int64).
+        :return: Array of RD days (int64).
+        """
+        solar, sun_fraction = np.divmod((13 * tithis + 2117) % 4824, 402)
+        lunar, moon_fraction = np.divmod((3781 * tithis + 19859) % 105840, 3780)
+
+        # In sixtieths of 1/402 and of 1/3780 of a day.
+        sun = (402 - sun_fraction) * cls.SUN_EQUATION[solar] + sun_fraction * cls.SUN_EQUATION[solar + 1]
+        moon = (3780 - moon_fraction) * cls.MOON_EQUATION[lunar] + moon_fraction * cls.MOON_EQUATION[lunar + 1]
+
+        numerator = (11135 * tithis + 7497) * (cls.DENOMINATOR // 11312) - \
+            sun * (cls.DENOMINATOR // 24120) + moon * (cls.DENOMINATOR // 226800)
+
+        return cls.EPOCH - 31 + numerator // cls.DENOMINATOR
+
+    @classmethod
+    def _search_tithis(cls, t: np.ndarray, approx: np.ndarray) -> (np.ndarray, np.ndarray):
+        """
+        The last lunar days starting on or before RD days, searched in the lunar days around their estimates
+        (without the table).
+        :param t: Array of RD days (int64).
+        :param approx: Array of the estimated lunar day counts of the days.
+        :return: Arrays of the lunar day counts and of their RD days (int64).
+        """
+        candidates = approx[:, np.newaxis] + np.arange(-cls.TITHI_MARGIN, cls.TITHI_MARGIN + 1)
+        days = cls._fixed_from_tithis(candidates)
+        index = np.sum(days <= t[:, np.newaxis], axis=1) - 1
+        rows = np.arange(len(t))
+
+        return candidates[rows, index], days[rows, index]
+
+    @classmethod
+    def _extend_table(cls, first_tithi: int, last_tithi: int) -> None:
+        """
+        Makes the table of lunar days cover a range of lunar day counts, computing the missing blocks.
+        :param first_tithi: The first lunar day count needed.
+        :param last_tithi: The last lunar day count needed.
+        """
+        table = TibetanDate._table
+        table_first = TibetanDate._table_first_tithi
+        table_last = table_first + len(table) - 1
+
+        if len(table) and table_first <= first_tithi and last_tithi <= table_last:
+            return
+
+        if len(table):
+            first_tithi = min(first_tithi, table_first)
+            last_tithi = max(last_tithi, table_last)
+
+        block = cls.TABLE_BLOCK
+        first_tithi = first_tithi // block * block
+        last_tithi = (last_tithi // block + 1) * block - 1
+
+        if len(table):
+            parts = [cls._fixed_from_tithis(np.arange(first_tithi, table_first, dtype=np.int64)),
+                     table,
+                     cls._fixed_from_tithis(np.arange(table_last + 1, last_tithi + 1, dtype=np.int64))]
+        else:
+            parts = [cls._fixed_from_tithis(np.arange(first_tithi, last_tithi + 1, dtype=np.int64))]
+
+        TibetanDate._table = np.concatenate(parts)
+        TibetanDate._table_first_tithi = first_tithi
+    # endregion
+
+
+def _final(start: int, condition: Callable[[int], bool]) -> int:
+    """
+    The last integer of the sequence start, start + 1, ... for which a condition holds (RDU 1.36);
+    start - 1 if it does not hold for start.
+    :param start: The first integer.
+    :param condition: The condition.
+    :return: The last integer satisfying the condition.
+    """
+    i = start
+
+    while condition(i):
+        i += 1
+
+    return i - 1
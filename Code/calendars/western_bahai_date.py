@@ -73,39 +73,21 @@ YEARS_ARABIC = ["أ", "ب", "أب", "د", "باب", "و", "أبد", "جاد", "
 
 # endregion
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WesternBahaiDate(AbstractDate):
     """
     Implements conversion to and from RD time moment for Western (historical) Bahai calendar.
     """
     # region Data Fields
-    major: int
-    cycle: int
-    year: int
-    month: int
-    day: int
+    major: int = 0  # The number of the 361-year major cycle (Kull-i-Shay) [RDM 15.2, p. 231]
+    cycle: int = 0  # The number of the 19-year cycle (Vahid) [RDM 15.2, p. 230]
+    year: int = 0   # The number of the year within the Vahid cycle (1 = Alif, ..., 19 = Vahid).
+    month: int = 0  # The number of the month in the year (1 = Bahá, ..., 19 = Alá)
+    day: int = 0    # The number of the day in the month.
     # endregion
 
     MARCH = 3
 
-    # region Initialization
-    def __init__(self, major: int = 0, cycle: int = 0, year: int = 0, month: int = 0, day: int = 0):
-        """
-        Creates an instance of WesternBahaiDate from constituent values.
-        :param major:   The number of the 361-year major cycle (Kull-i-Shay) [RDM 15.2, p. 231]
-        :param cycle:   The number of the 19-year cycle (Vahid) [RDM 15.2, p. 230]
-        :param year:    The number of the year within the Vahid cycle (1 = Alif, ..., 19 = Vahid).
-        :param month:   The number of the month in the year (1 = Bahá, ..., 19 = Alá)
-        :param day:     The number of the day in the month.
-        """
-        self.major = major
-        self.cycle = cycle
-        self.year = year
-        self.month = month
-        self.day = day
-
-    # endregion
-
     # region AbstractDate
     def to_moment(self) -> float:
         """
@@ -113,9 +95,7 @@ class WesternBahaiDate(AbstractDate):
         RDM (14.3).
         :return: The RD time moment.
         """
-        gregorian_date_of_bahai_epoch = GregorianDate()
-        gregorian_date_of_bahai_epoch.from_moment(tools.WESTERN_BAHAI_EPOCH)
-        gregorian_year_of_bahai_epoch = gregorian_date_of_bahai_epoch.year
+        gregorian_year_of_bahai_epoch = GregorianDate.from_rd(tools.WESTERN_BAHAI_EPOCH).year
 
         # RDM (14.3): g-year
         gregorian_year = gregorian_year_of_bahai_epoch + 361 * (self.major - 1) + 19 * (self.cycle - 1) + self.year - 1
@@ -135,44 +115,42 @@ class WesternBahaiDate(AbstractDate):
 
         return t
 
-    def from_moment(self, t: float) -> None:
+    @classmethod
+    def from_rd(cls, t: float) -> WesternBahaiDate:
         """
         Converts an RD time moment to an instance of WesternBahaiDate.
         RDM (14.4).
         :param t: The RD time moment to convert.
-        :return: None. The instance of WesternBahaiDate will be generated instead.
+        :return: The Western Bahai date.
         """
-        gregorian_date = GregorianDate()
-        gregorian_date.from_moment(t)
-        gregorian_year = gregorian_date.year
-
-        start_gregorian_date = GregorianDate()
-        start_gregorian_date.from_moment(tools.WESTERN_BAHAI_EPOCH)
-        start_year = start_gregorian_date.year
+        gregorian_year = GregorianDate.from_rd(t).year
+        start_year = GregorianDate.from_rd(tools.WESTERN_BAHAI_EPOCH).year
 
         years = gregorian_year - start_year
         if t <= GregorianDate(gregorian_year, WesternBahaiDate.MARCH, 20).to_moment():
             years -= 1
 
-        self.major = int(math.floor(years / 361) + 1)
-        self.cycle = int(math.floor(years % 361 / 19) + 1)
-        self.year = years % 19 + 1
+        major = int(math.floor(years / 361) + 1)
+        cycle = int(math.floor(years % 361 / 19) + 1)
+        year = years % 19 + 1
 
-        days = t - WesternBahaiDate(self.major, self.cycle, self.year, 1, 1).to_moment()
+        days = t - WesternBahaiDate(major, cycle, year, 1, 1).to_moment()
 
-        start_ayyam_i_ha = WesternBahaiDate(self.major, self.cycle, self.year, 0, 1).to_moment()
+        start_ayyam_i_ha = WesternBahaiDate(major, cycle, year, 0, 1).to_moment()
         end_ayyam_i_ha = start_ayyam_i_ha + 4
         if tools.is_gregorian_leap_year(gregorian_year):
             end_ayyam_i_ha += 1
 
-        if t >= WesternBahaiDate(self.major, self.cycle, self.year, 19, 1).to_moment():
-            self.month = 19
+        if t >= WesternBahaiDate(major, cycle, year, 19, 1).to_moment():
+            month = 19
         elif start_ayyam_i_ha < t <= end_ayyam_i_ha:
-            self.month = 0
+            month = 0
         else:
-            self.month = int(days) // 19 + 1
+            month = int(days) // 19 + 1
+
+        day = int(t + 1 - WesternBahaiDate(major, cycle, year, month, 1).to_moment())
 
-        self.day = int(t + 1 - WesternBahaiDate(self.major, self.cycle, self.year, self.month, 1).to_moment())
+        return cls(major, cycle, year, month, day)
 
     # endregion
 
@@ -217,7 +195,7 @@ class WesternBahaiDate(AbstractDate):
                 return self._to_dmymj()
 
             case _:
-                return super().to_string()
+                return AbstractDate.to_string(self)
 
     # endregion
 
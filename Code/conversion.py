@@ -0,0 +1,127 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from calendars.abstract_date import AbstractDate
+from calendars.arithmetic_french_revolutionary import ArithmeticFrenchRevolutionaryDate
+from calendars.arithmetic_persian import ArithmeticPersianDate
+from calendars.armenian_date import ArmenianDate
+from calendars.balinese_date import BalineseDate
+from calendars.coptic_date import CopticDate
+from calendars.egyptian_date import EgyptianDate
+from calendars.ethiopic_date import EthiopicDate
+from calendars.french_revolutionary_date import FrenchRevolutionaryDate
+from calendars.gregorian_date import GregorianDate
+from calendars.hebrew_date import HebrewDate
+from calendars.islamic_date import IslamicDate
+from calendars.iso_date import IsoDate
+from calendars.julian_date import JulianDate
+from calendars.mayan_haab_date import MayanHaabDate
+from calendars.mayan_long_count import MayanLongCountDate
+from calendars.mayan_tzolkin_date import MayanTzolkinDate
+from calendars.observational_hebrew_date import ObservationalHebrewDate
+from calendars.observational_islamic_date import ObservationalIslamicDate
+from calendars.old_hindu_lunar_date import OldHinduLunarDate
+from calendars.old_hindu_solar_date import OldHinduSolarDate
+from calendars.persian_date import PersianDate
+from calendars.roman_date import RomanDate
+from calendars.tibetan_date import TibetanDate
+from calendars.western_bahai_date import WesternBahaiDate
+from calendars.zoroastrian_date import ZoroastrianDate
+
+# The implemented calendars by name (the names of their test data files).
+CALENDARS = {
+    "arithmetic_french_revolutionary": ArithmeticFrenchRevolutionaryDate,
+    "arithmetic_persian": ArithmeticPersianDate,
+    "armenian": ArmenianDate,
+    "balinese": BalineseDate,
+    "coptic": CopticDate,
+    "egyptian": EgyptianDate,
+    "ethiopic": EthiopicDate,
+    "french_revolutionary": FrenchRevolutionaryDate,
+    "gregorian": GregorianDate,
+    "hebrew": HebrewDate,
+    "islamic": IslamicDate,
+    "iso": IsoDate,
+    "julian": JulianDate,
+    "mayan_haab": MayanHaabDate,
+    "mayan_long_count": MayanLongCountDate,
+    "mayan_tzolkin": MayanTzolkinDate,
+    "observational_hebrew": ObservationalHebrewDate,
+    "observational_islamic": ObservationalIslamicDate,
+    "old_hindu_lunar": OldHinduLunarDate,
+    "old_hindu_solar": OldHinduSolarDate,
+    "persian": PersianDate,
+    "roman": RomanDate,
+    "tibetan": TibetanDate,
+    "western_bahai": WesternBahaiDate,
+    "zoroastrian": ZoroastrianDate
+}
+
+# The calendars whose conversions compute astronomical positions or build tables on first use (the first crescents
+# of the observational calendars are also written to their store): much slower than the arithmetic calendars,
+# so tools converting to many calendars at once include them only when asked.
+EXPENSIVE_CALENDARS = ["french_revolutionary", "observational_hebrew", "observational_islamic", "persian", "tibetan"]
+
+# The calendars of the calendar rounds, whose dates repeat and so have no RD value: they can be converted to,
+# not from.
+CALENDAR_ROUNDS = ["mayan_haab", "mayan_tzolkin"]
+
+
+def calendar_class(calendar) -> type[AbstractDate]:
+    """
+    Gets a calendar class by its name, or passes a calendar class through.
+    :param calendar: The name of the calendar (a key of CALENDARS), or the calendar class itself.
+    :return: The calendar class.
+    :exception ValueError: Raised if the calendar is unknown.
+    """
+    if isinstance(calendar, type) and issubclass(calendar, AbstractDate):
+        return calendar
+
+    if calendar not in CALENDARS:
+        raise ValueError(f"Unknown calendar '{calendar}'. Known calendars: {', '.join(CALENDARS)}")
+
+    return CALENDARS[calendar]
+
+
+def calendar_name(calendar) -> str:
+    """
+    Gets the name of a calendar class.
+    :param calendar: The calendar class, or its name.
+    :return: The name of the calendar (a key of CALENDARS).
+    :exception ValueError: Raised if the calendar is unknown.
+    """
+    calendar = calendar_class(calendar)
+
+    for name, cls in CALENDARS.items():
+        if cls is calendar:
+            return name
+
+    raise ValueError(f"Unknown calendar {calendar.__name__}")
+
+
+def convert_parallel(rds, calendar, workers: int = None, chunks_per_worker: int = 4) -> tuple:
+    """
+    Bulk conversion of RD values to dates of a calendar, split into chunks converted by a pool of worker processes.
+    Meant for the CPU-bound astronomical calendars (e.g. PersianDate), whose scalar conversions dominate the time:
+    the workers return their fields as NumPy arrays, so no date objects are pickled between the processes.
+    :param rds: Array of RD values.
+    :param calendar: The name of the calendar, or its class (which must be importable by the workers).
+    :param workers: The number of worker processes. Default: the number of CPUs.
+    :param chunks_per_worker: The number of chunks per worker, to balance unequal chunk costs.
+    :return: Tuple of arrays, one per data field of the calendar, shaped like rds (as from_moments).
+    """
+    cls = calendar_class(calendar)
+    t = np.asarray(rds)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or t.size < 2:
+        return cls.from_moments(t)
+
+    chunks = np.array_split(t.ravel(), min(t.size, workers * chunks_per_worker))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(cls.from_moments, chunks))
+
+    return tuple(np.concatenate(values).reshape(t.shape) for values in zip(*results))
@@ -0,0 +1,192 @@
+"""
+Streaming conversion of a date column of a CSV file from one calendar to others.
+The file is read and written in chunks of rows, each chunk converted with the calendars' bulk conversion,
+so that memory use does not depend on the size of the file.
+
+The source date is given by the columns holding the fields of the source calendar (in the order of its
+field_names()), or by a single column of RD values (source "rd"). For every target calendar, one column per field
+is appended, named "<calendar>.<field>". Boolean fields are read as t/f, true/false or 1/0 and written as t/f.
+
+Usage (from the Code directory):
+    python convert_csv.py input.csv output.csv --source gregorian --columns Year Month Day --to hebrew islamic
+    python convert_csv.py - - --source rd --columns Rd --to gregorian < input.csv > output.csv
+"""
+import argparse
+import contextlib
+import csv
+import dataclasses
+import itertools
+import sys
+import time
+from typing import Callable, TextIO
+
+import numpy as np
+
+from conversion import CALENDARS, CALENDAR_ROUNDS, calendar_class, calendar_name
+
+DEFAULT_CHUNK_SIZE = 65536
+
+# The pseudo-calendar of RD values.
+RD = "rd"
+
+TRUE_VALUES = {"t", "true", "1", "yes", "y"}
+FALSE_VALUES = {"f", "false", "0", "no", "n"}
+
+
+def convert_csv(input_file: TextIO, output_file: TextIO, source: str, columns: list[str], targets: list[str],
+                chunk_size: int = DEFAULT_CHUNK_SIZE, delimiter: str = ",",
+                progress: Callable[[int], None] = None) -> int:
+    """
+    Converts the dates of a CSV file to other calendars, appending their fields to every row.
+    :param input_file: The input CSV file, with a header row.
+    :param output_file: The output CSV file.
+    :param source: The name of the source calendar, or "rd".
+    :param columns: The names of the input columns holding the fields of the source date.
+    :param targets: The names of the target calendars (and/or "rd").
+    :param chunk_size: The number of rows converted at once.
+    :param delimiter: The field delimiter of both files.
+    :param progress: Called after every chunk with the number of rows converted so far.
+    :return: The number of rows converted.
+    :exception ValueError: Raised if the source calendar is a calendar round (its dates have no RD value),
+    a column is missing, the columns do not match the source calendar's fields, or a value cannot be read.
+    """
+    if source != RD and calendar_name(source) in CALENDAR_ROUNDS:
+        raise ValueError(f"Calendar '{source}' cannot be a source: its dates repeat and have no RD value")
+
+    reader = csv.reader(input_file, delimiter=delimiter)
+    writer = csv.writer(output_file, delimiter=delimiter, lineterminator="\n")
+
+    header = next(reader)
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError(f"Columns not found: {', '.join(missing)}")
+    indices = [header.index(column) for column in columns]
+
+    source_types = _field_types(source)
+    if len(source_types) != len(columns):
+        raise ValueError(f"Calendar '{source}' has {len(source_types)} fields, but {len(columns)} columns are given")
+
+    output_header = list(header)
+    for target in targets:
+        output_header += [RD] if target == RD else \
+            [f"{calendar_name(target)}.{field}" for field in calendar_class(target).field_names()]
+    writer.writerow(output_header)
+
+    count = 0
+    while chunk := list(itertools.islice(reader, chunk_size)):
+        t = _to_moments(source, source_types, [[row[i] for row in chunk] for i in indices], count + 2)
+
+        output_columns = []
+        for target in targets:
+            output_columns += [t] if target == RD else calendar_class(target).from_moments(t)
+
+        output_columns = [np.where(values, "t", "f") if values.dtype == bool else values
+                          for values in output_columns]
+
+        output_rows = zip(*[values.tolist() for values in output_columns])
+        writer.writerows(row + list(values) for row, values in zip(chunk, output_rows))
+
+        count += len(chunk)
+        if progress:
+            progress(count)
+
+    return count
+
+
+# region Protected Auxiliary
+def _field_types(calendar: str) -> list[type]:
+    """
+    The types of the data fields of a calendar.
+    :param calendar: The name of the calendar, or "rd".
+    :return: List of the field types.
+    """
+    if calendar == RD:
+        return [float]
+
+    return [field.type for field in dataclasses.fields(calendar_class(calendar))]
+
+
+def _to_moments(calendar: str, types: list[type], columns: list[list[str]], first_line: int) -> np.ndarray:
+    """
+    Reads the text values of the date columns of a chunk and converts them to RD values.
+    :param calendar: The name of the source calendar, or "rd".
+    :param types: The types of its fields.
+    :param columns: The text values, one list per field.
+    :param first_line: The line number of the first row of the chunk in the file, for error messages.
+    :return: Array of RD values (int64).
+    """
+    fields = []
+    for field_type, values in zip(types, columns):
+        try:
+            if field_type is bool:
+                fields.append(np.array([_parse_bool(value) for value in values]))
+            else:
+                fields.append(np.array(values, dtype=np.float64 if field_type is float else np.int64))
+        except ValueError:
+            for i, value in enumerate(values):
+                try:
+                    _parse_bool(value) if field_type is bool else field_type(value)
+                except ValueError:
+                    raise ValueError(f"Line {first_line + i}: cannot read '{value}' as {field_type.__name__}")
+            raise
+
+    if calendar == RD:
+        return np.floor(fields[0]).astype(np.int64)
+
+    return np.asarray(calendar_class(calendar).to_moments(*fields)).astype(np.int64)
+
+
+def _parse_bool(value: str) -> bool:
+    """
+    Reads a boolean CSV value.
+    :param value: The text value.
+    :return: The boolean value.
+    :exception ValueError: Raised if the value is not a known boolean text.
+    """
+    value = value.strip().lower()
+
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+
+    raise ValueError(f"'{value}' is not a boolean value")
+# endregion
+
+
+if __name__ == '__main__':
+    calendars = [RD] + list(CALENDARS)
+
+    parser = argparse.ArgumentParser(description="Converts a date column of a CSV file to other calendars.")
+    parser.add_argument("input", help="The input CSV file ('-' for standard input)")
+    parser.add_argument("output", help="The output CSV file ('-' for standard output)")
+    parser.add_argument("--source", required=True, choices=calendars, help="The calendar of the input dates")
+    parser.add_argument("--columns", required=True, nargs="+", help="The columns holding the source date fields")
+    parser.add_argument("--to", required=True, nargs="+", choices=calendars, dest="targets",
+                        help="The target calendars")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows converted at once")
+    parser.add_argument("--delimiter", default=",", help="The field delimiter")
+    parser.add_argument("--progress", action="store_true", help="Report the number of rows after every chunk")
+
+    arguments = parser.parse_args()
+
+    if arguments.source in CALENDAR_ROUNDS:
+        parser.error(f"calendar '{arguments.source}' cannot be a source: its dates repeat and have no RD value")
+
+    start = time.perf_counter()
+
+    def report(rows: int) -> None:
+        seconds = time.perf_counter() - start
+        print(f"{rows:,} rows in {seconds:.1f} s ({rows / max(seconds, 1e-9):,.0f} rows/s)", file=sys.stderr)
+
+    # Standard input and output are not closed: only the files opened here.
+    with contextlib.ExitStack() as files:
+        input_file = sys.stdin if arguments.input == "-" else \
+            files.enter_context(open(arguments.input, "r", newline=""))
+        output_file = sys.stdout if arguments.output == "-" else \
+            files.enter_context(open(arguments.output, "w", newline=""))
+
+        total = convert_csv(input_file, output_file, arguments.source, arguments.columns, arguments.targets,
+                            arguments.chunk_size, arguments.delimiter, report if arguments.progress else None)
+
+    report(total)
@@ -0,0 +1,96 @@
+"""
+Easter and the movable feasts of the Christian calendars, for arrays of years at once.
+
+Easter is the first Sunday after the paschal full moon, the 14th day of the ecclesiastical lunar month whose
+14th day is on or after March 21: the moon is given by the epact, the age of the moon on January 1 (RDM 8).
+The Orthodox computus counts in the Julian calendar, with the 19-year Metonic cycle; the Gregorian one corrects
+the epact for the century leap years dropped by the calendar (solar equation) and for the drift of the
+Metonic cycle (lunar equation). All the computations are integer array arithmetic, on top of the bulk conversions
+of GregorianDate and JulianDate.
+"""
+import numpy as np
+
+from calendars.gregorian_date import GregorianDate
+from calendars.julian_date import JulianDate
+
+APRIL = 4
+
+# The movable feasts: days from Easter Sunday (RDM 8).
+MOVABLE_FEASTS = {"septuagesima": -63,
+                  "sexagesima": -56,
+                  "shrove_sunday": -49,
+                  "shrove_monday": -48,
+                  "shrove_tuesday": -47,
+                  "ash_wednesday": -46,
+                  "passion_sunday": -14,
+                  "palm_sunday": -7,
+                  "maundy_thursday": -3,
+                  "good_friday": -2,
+                  "easter": 0,
+                  "rogation_sunday": 35,
+                  "ascension": 39,
+                  "pentecost": 49,
+                  "whit_monday": 50,
+                  "trinity_sunday": 56,
+                  "corpus_christi": 60}
+
+
+def easters(years) -> np.ndarray:
+    """
+    Vectorized Gregorian Easter: the RD days of Easter Sunday in Gregorian years.
+    RDM (8.3).
+    :param years: Array of Gregorian years.
+    :return: Array of RD days (int64).
+    """
+    years = np.asarray(years, dtype=np.int64)
+    century = years // 100 + 1
+
+    shifted_epact = (14 + 11 * (years % 19) - 3 * century // 4 + (5 + 8 * century) // 25) % 30
+    adjusted_epact = shifted_epact + ((shifted_epact == 0) | ((shifted_epact == 1) & (10 < years % 19)))
+    paschal_moon = GregorianDate.to_moments(years, APRIL, 19) - adjusted_epact
+
+    return _sundays_after(paschal_moon)
+
+
+def orthodox_easters(years) -> np.ndarray:
+    """
+    Vectorized Orthodox (Julian) Easter: the RD days of Easter Sunday in the Julian calendar, by the Gregorian
+    years in which they fall.
+    RDM (8.1).
+    :param years: Array of Gregorian years.
+    :return: Array of RD days (int64).
+    """
+    years = np.asarray(years, dtype=np.int64)
+
+    shifted_epact = (14 + 11 * (years % 19)) % 30
+    julian_years = np.where(years > 0, years, years - 1)
+    paschal_moon = JulianDate.to_moments(julian_years, APRIL, 19) - shifted_epact
+
+    return _sundays_after(paschal_moon)
+
+
+def movable_feasts(years, orthodox: bool = False) -> np.ndarray:
+    """
+    The movable feasts (MOVABLE_FEASTS) of Gregorian years, from a single computation of the Easters.
+    :param years: Array of Gregorian years.
+    :param orthodox: True for the feasts of the Orthodox Easter, False for those of the Gregorian one.
+    :return: Structured array, with a row per year: the Gregorian year ("year") and the RD days of the feasts.
+    """
+    years = np.asarray(years, dtype=np.int64)
+    easter = orthodox_easters(years) if orthodox else easters(years)
+
+    result = np.empty(years.shape, dtype=[("year", np.int64)] + [(name, np.int64) for name in MOVABLE_FEASTS])
+    result["year"] = years
+
+    for name, offset in MOVABLE_FEASTS.items():
+        result[name] = easter + offset
+
+    return result
+
+
+def _sundays_after(t: np.ndarray) -> np.ndarray:
+    """
+    Vectorized tools.k_day_after for Sunday: the first Sundays strictly after RD days.
+    RDM (1.49).
+    """
+    return t + 7 - t % 7
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class Location:
@@ -26,6 +28,28 @@ MECCA = Location("Mecca", 21.42664, 39.82563, 0, 2)
 JERUSALEM = Location("Jerusalem", 31.76904,	35.21633, 0, 2)
 TEHRAN = Location("Tehran", 35.69439, 51.42151, 1100, 3.5)
 HAIFA = Location("Haifa", 32.81841, 34.9885, 0, 2)
+PARIS = Location("Paris", 48.83639, 2.3375, 27, 1)
+CAIRO = Location("Cairo", 30.1, 31.3, 200, 2)
+
+
+def location_arrays(locations) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+    """
+    The coordinates of locations as arrays, for the vectorized calculations of times.
+    :param locations: A location, or a sequence (or array) of locations.
+    :return: Arrays (0-d for a single location) of the latitudes, longitudes (degrees), elevations (m) and zones (hours).
+    """
+    if isinstance(locations, Location):
+        locations = [locations]
+        shape = ()
+    else:
+        locations = np.asarray(locations, dtype=object)
+        shape = locations.shape
+        locations = locations.ravel()
+
+    coordinates = np.array([(location.latitude, location.longitude, location.elevation, location.zone)
+                            for location in locations], dtype=np.float64).reshape(shape + (4,))
+
+    return coordinates[..., 0], coordinates[..., 1], coordinates[..., 2], coordinates[..., 3]
 
 if __name__ == '__main__':
     print(URBANA)
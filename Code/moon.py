@@ -0,0 +1,448 @@
+"""
+The moon, vectorized: lunar longitude, latitude and phase, new moons, the altitude of the moon,
+and the visibility of the crescent that starts the months of the observational lunar calendars.
+
+The positions are those of RDU 14, after Meeus (47); all the functions take arrays of moments in universal time.
+The first days of visibility of the crescent (the month starts) are costly, and are kept per location and lunation
+in a store (a JSON file, see set_crescent_store): once computed, they are never computed again, by this process
+or by later ones.
+"""
+import contextlib
+import json
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows.
+    fcntl = None
+    import msvcrt
+
+import numpy as np
+from numpy.polynomial.polynomial import polyval
+
+import astro
+import times
+import tools
+from location import Location
+
+MEAN_SYNODIC_MONTH = 29.530588861
+
+# Lunar phases (the elongation of the moon from the sun), degrees.
+NEW = 0
+FIRST_QUARTER = 90
+FULL = 180
+LAST_QUARTER = 270
+
+# The mean new moon of lunation 0, 2000-01-06 (RD, dynamical time): RDU 14. Lunations are numbered from it.
+NEW_MOON_EPOCH = 730125.59765
+
+# region Lunar constants
+# Polynomials of the Julian centuries (dynamical time), degrees: RDU 14.
+MEAN_LUNAR_LONGITUDE = [218.3164477, 481267.88123421, -0.0015786, 1 / 538841, -1 / 65194000]
+LUNAR_ELONGATION = [297.8501921, 445267.1114034, -0.0018819, 1 / 545868, -1 / 113065000]
+SOLAR_ANOMALY = [357.5291092, 35999.0502909, -0.0001536, 1 / 24490000]
+LUNAR_ANOMALY = [134.9633964, 477198.8675055, 0.0087414, 1 / 69699, -1 / 14712000]
+MOON_NODE = [93.2720950, 483202.0175233, -0.0036539, -1 / 3526000, 1 / 863310000]
+
+# The eccentricity of the Earth's orbit, the factor of the terms in the solar anomaly.
+ECCENTRICITY = [1, -0.002516, -0.0000074]
+
+# The periodic terms of the lunar longitude and latitude: the multiples of the elongation, solar anomaly,
+# lunar anomaly and moon node in the argument, and the coefficient of its sine in millionths of degrees.
+# RDU 14, Meeus tables 47.A and 47.B.
+LONGITUDE_TERMS = np.array([
+    [0, 0, 1, 0, 6288774], [2, 0, -1, 0, 1274027], [2, 0, 0, 0, 658314], [0, 0, 2, 0, 213618],
+    [0, 1, 0, 0, -185116], [0, 0, 0, 2, -114332], [2, 0, -2, 0, 58793], [2, -1, -1, 0, 57066],
+    [2, 0, 1, 0, 53322], [2, -1, 0, 0, 45758], [0, 1, -1, 0, -40923], [1, 0, 0, 0, -34720],
+    [0, 1, 1, 0, -30383], [2, 0, 0, -2, 15327], [0, 0, 1, 2, -12528], [0, 0, 1, -2, 10980],
+    [4, 0, -1, 0, 10675], [0, 0, 3, 0, 10034], [4, 0, -2, 0, 8548], [2, 1, -1, 0, -7888],
+    [2, 1, 0, 0, -6766], [1, 0, -1, 0, -5163], [1, 1, 0, 0, 4987], [2, -1, 1, 0, 4036],
+    [2, 0, 2, 0, 3994], [4, 0, 0, 0, 3861], [2, 0, -3, 0, 3665], [0, 1, -2, 0, -2689],
+    [2, 0, -1, 2, -2602], [2, -1, -2, 0, 2390], [1, 0, 1, 0, -2348], [2, -2, 0, 0, 2236],
+    [0, 1, 2, 0, -2120], [0, 2, 0, 0, -2069], [2, -2, -1, 0, 2048], [2, 0, 1, -2, -1773],
+    [2, 0, 0, 2, -1595], [4, -1, -1, 0, 1215], [0, 0, 2, 2, -1110], [3, 0, -1, 0, -892],
+    [2, 1, 1, 0, -810], [4, -1, -2, 0, 759], [0, 2, -1, 0, -713], [2, 2, -1, 0, -700],
+    [2, 1, -2, 0, 691], [2, -1, 0, -2, 596], [4, 0, 1, 0, 549], [0, 0, 4, 0, 537],
+    [4, -1, 0, 0, 520], [1, 0, -2, 0, -487], [2, 1, 0, -2, -399], [0, 0, 2, -2, -381],
+    [1, 1, 1, 0, 351], [3, 0, -2, 0, -340], [4, 0, -3, 0, 330], [2, -1, 2, 0, 327],
+    [0, 2, 1, 0, -323], [1, 1, -1, 0, 299], [2, 0, 3, 0, 294]])
+
+LATITUDE_TERMS = np.array([
+    [0, 0, 0, 1, 5128122], [0, 0, 1, 1, 280602], [0, 0, 1, -1, 277693], [2, 0, 0, -1, 173237],
+    [2, 0, -1, 1, 55413], [2, 0, -1, -1, 46271], [2, 0, 0, 1, 32573], [0, 0, 2, 1, 17198],
+    [2, 0, 1, -1, 9266], [0, 0, 2, -1, 8822], [2, -1, 0, -1, 8216], [2, 0, -2, -1, 4324],
+    [2, 0, 1, 1, 4200], [2, 1, 0, -1, -3359], [2, -1, -1, 1, 2463], [2, -1, 0, 1, 2211],
+    [2, -1, -1, -1, 2065], [0, 1, -1, -1, -1870], [4, 0, -1, -1, 1828], [0, 1, 0, 1, -1794],
+    [0, 0, 0, 3, -1749], [0, 1, -1, 1, -1565], [1, 0, 0, 1, -1491], [0, 1, 1, 1, -1475],
+    [0, 1, 1, -1, -1410], [0, 1, 0, -1, -1344], [1, 0, 0, -1, -1335], [0, 0, 3, 1, 1107],
+    [4, 0, 0, -1, 1021], [4, 0, -1, 1, 833], [0, 0, 1, -3, 777], [4, 0, -2, 1, 671],
+    [2, 0, 0, -3, 607], [2, 0, 2, -1, 596], [2, -1, 1, -1, 491], [2, 0, -2, 1, -451],
+    [0, 0, 3, -1, 439], [2, 0, 2, 1, 422], [2, 0, -3, -1, 421], [2, 1, -1, 1, -366],
+    [2, 1, 0, 1, -351], [4, 0, 0, 1, 331], [2, -1, 1, 1, 315], [2, -2, 0, -1, 302],
+    [0, 0, 1, 3, -283], [2, 1, 1, -1, -229], [1, 1, 0, -1, 223], [1, 1, 0, 1, 223],
+    [0, 1, -2, -1, -220], [2, 1, -1, -1, -220], [1, 0, 1, 1, -185], [2, -1, -2, -1, 181],
+    [0, 1, 2, 1, -177], [4, 0, -2, -1, 176], [4, -1, -1, -1, 166], [1, 0, 1, -1, -164],
+    [4, 0, 1, -1, 132], [1, 0, -1, -1, -119], [4, -1, 0, -1, 115], [2, -2, 0, 1, 107]])
+# endregion
+
+# region Crescent visibility
+# The criterion of Shaukat (RDU 14): at dusk (the sun 4.5° below the horizon) on the evening before the day,
+# the moon is between new and first quarter, its arc of light is between 10.6° and 90°, and its altitude above 4.1°.
+CRESCENT_DEPRESSION = 4.5
+MIN_ARC_OF_LIGHT = 10.6
+MAX_ARC_OF_LIGHT = 90
+MIN_ALTITUDE = 4.1
+
+# The longest search for the first crescent after a new moon, in days.
+MAX_CRESCENT_DELAY = 29
+
+# The default store of first crescents, next to this module (not versioned: filled on use).
+DEFAULT_CRESCENT_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "first_crescents.json")
+# endregion
+
+# The store of first crescents: its file (None to keep it in memory only) and, once loaded, its content:
+# the RD days of the first crescents by location key and lunation.
+_crescent_store_path = DEFAULT_CRESCENT_STORE
+_crescent_store = None
+
+
+# region Positions
+def lunar_longitudes(t) -> np.ndarray:
+    """
+    Vectorized lunar longitude: the longitude of the moon, with nutation.
+    RDU 14.
+    :param t: Array of moments (RD, universal time).
+    :return: Array of lunar longitudes, in degrees, in [0, 360).
+    """
+    return _lunar_coordinates(_centuries(t))[0]
+
+
+def lunar_latitudes(t) -> np.ndarray:
+    """
+    Vectorized lunar latitude: the latitude of the moon.
+    RDU 14.
+    :param t: Array of moments (RD, universal time).
+    :return: Array of lunar latitudes, in degrees.
+    """
+    return _lunar_coordinates(_centuries(t))[1]
+
+
+def lunar_phases(t) -> np.ndarray:
+    """
+    Vectorized lunar phase: the elongation of the moon from the sun in longitude (NEW, FIRST_QUARTER, FULL...).
+    RDU 14.
+    :param t: Array of moments (RD, universal time).
+    :return: Array of lunar phases, in degrees, in [0, 360).
+    """
+    t = np.asarray(t, dtype=np.float64)
+
+    return np.mod(lunar_longitudes(t) - times.solar_longitudes(t), 360)
+
+
+def lunar_altitudes(t, latitude, longitude) -> np.ndarray:
+    """
+    Vectorized geocentric altitude of the moon above the horizon, broadcasting the moments against the coordinates
+    of the sites (see times.local_sidereal_times).
+    RDU 14.
+    :param t: Array of moments (RD, universal time).
+    :param latitude: Array of latitudes, in degrees.
+    :param longitude: Array of longitudes, in degrees (east positive).
+    :return: Array of altitudes, in degrees, in [-90, 90].
+    """
+    t = np.asarray(t, dtype=np.float64)
+    lambda1, beta = _lunar_coordinates(_centuries(t))
+    declination = tools.DEGREE * times.declinations(t, beta, lambda1)
+    hour_angle = tools.DEGREE * (times.local_sidereal_times(t, longitude) - times.right_ascensions(t, beta, lambda1))
+    phi = tools.DEGREE * np.asarray(latitude, dtype=np.float64)
+
+    return np.arcsin(np.sin(phi) * np.sin(declination) +
+                     np.cos(phi) * np.cos(declination) * np.cos(hour_angle)) / tools.DEGREE
+# endregion
+
+
+# region New moons
+def new_moons(lunations) -> np.ndarray:
+    """
+    The moments of new moons, by a Newton iteration on the lunar phase from the mean new moons, for all at once.
+    :param lunations: Array of lunation numbers (0 for the new moon of 2000-01-06).
+    :return: Array of the moments of the new moons (RD, universal time), to about a second.
+    """
+    lunations = np.asarray(lunations, dtype=np.float64)
+    t = NEW_MOON_EPOCH + MEAN_SYNODIC_MONTH * lunations
+    t = t - times.ephemeris_corrections(t)
+    rate = 360 / MEAN_SYNODIC_MONTH
+
+    for _ in range(tools.DEFAULT_MAX_ITERATIONS):
+        step = (np.mod(lunar_phases(t) + 180, 360) - 180) / rate
+        t = t - step
+
+        if not step.size or np.max(np.abs(step)) < 1e-6:
+            break
+
+    return t
+
+
+def lunations(t) -> np.ndarray:
+    """
+    The numbers of the lunations of moments: those of the last new moons at or before them.
+    :param t: Array of moments (RD, universal time).
+    :return: Array of lunation numbers (int64).
+    """
+    t = np.asarray(t, dtype=np.float64)
+    n = np.floor((t - NEW_MOON_EPOCH) / MEAN_SYNODIC_MONTH).astype(np.int64)
+
+    # The true new moons are within a day of the mean ones.
+    n += new_moons(n + 1) <= t
+    n -= new_moons(n) > t
+
+    return n
+# endregion
+
+
+# region Crescent
+def visible_crescents(days, location: Location) -> np.ndarray:
+    """
+    Vectorized visible crescent: whether the crescent of the new moon can be seen at a location on the evening
+    before days, and so whether an observational lunar month can start on these days.
+    RDU 14, with the dusks solved by astro.depression_moments.
+    :param days: Array of RD days.
+    :param location: The location of the observation.
+    :return: Array of flags.
+    """
+    days = np.asarray(days, dtype=np.int64)
+    result = np.zeros(days.shape, dtype=bool)
+
+    if not days.size:
+        return result
+
+    # The evenings are those of the previous days; dusks are computed for distinct days, by runs of near days
+    # (the daily solar state covers the days of a run).
+    evenings, inverse = np.unique(days - 1, return_inverse=True)
+    runs = np.split(evenings, np.flatnonzero(np.diff(evenings) > 64) + 1)
+    dusk = np.concatenate([
+        astro.depression_moments(run, location.latitude, location.longitude, location.zone, CRESCENT_DEPRESSION,
+                                 astro.EVENING, *astro.daily_solar_state(run), 1) for run in runs])
+    dusk = dusk[inverse.reshape(days.shape)] - location.zone / 24
+
+    valid = ~np.isnan(dusk)
+    t = dusk[valid]
+
+    lambda1, beta = _lunar_coordinates(_centuries(t))
+    phase = np.mod(lambda1 - times.solar_longitudes(t), 360)
+    arc_of_light = np.arccos(np.cos(tools.DEGREE * beta) * np.cos(tools.DEGREE * phase)) / tools.DEGREE
+    altitude = lunar_altitudes(t, location.latitude, location.longitude)
+
+    result[valid] = (NEW < phase) & (phase < FIRST_QUARTER) & (MIN_ARC_OF_LIGHT <= arc_of_light) & \
+        (arc_of_light <= MAX_ARC_OF_LIGHT) & (altitude > MIN_ALTITUDE)
+
+    return result
+
+
+def first_crescents(numbers, location: Location) -> np.ndarray:
+    """
+    The first days of visibility of the crescents of lunations at a location: the first days of the months
+    of the observational lunar calendars (the phasis of RDU 18). They are read from the store of first crescents;
+    those not found are computed, by a search on the days following the new moons, and added to it.
+    :param numbers: Array of lunation numbers.
+    :param location: The location of the observation.
+    :return: Array of RD days (int64).
+    :exception ValueError: Raised if the crescent of a lunation is not visible at the location.
+    """
+    numbers = np.asarray(numbers, dtype=np.int64)
+    store = _load_crescent_store().setdefault(_location_key(location), {})
+
+    distinct = np.unique(numbers)
+    missing = np.array([n for n in distinct.tolist() if n not in store], dtype=np.int64)
+
+    if missing.size:
+        store.update(zip(missing.tolist(), _search_first_crescents(missing, location).tolist()))
+        _save_crescent_store()
+
+    days = np.array([store[n] for n in distinct.tolist()], dtype=np.int64)
+
+    return days[np.searchsorted(distinct, numbers)]
+
+
+def lunar_months(days, location: Location) -> (np.ndarray, np.ndarray):
+    """
+    The observational lunar months of days: the last lunations whose first crescent at a location is at or before
+    the days (the phasis on or before of RDU 18).
+    :param days: Array of RD days.
+    :param location: The location of the observation.
+    :return: Arrays of the lunation numbers and of the first days of the months (int64).
+    """
+    days = np.asarray(days, dtype=np.int64)
+
+    # The month of a day is that of its mean lunation, or of the one before or after: the first crescents of these
+    # candidates (from the store, without any new moon) are searched for the last one at or before the day.
+    mean = np.floor((days - NEW_MOON_EPOCH) / MEAN_SYNODIC_MONTH).astype(np.int64)
+    candidates = np.unique(np.concatenate([mean.ravel() - 1, mean.ravel(), mean.ravel() + 1]))
+    starts = first_crescents(candidates, location)
+    index = np.searchsorted(starts, days, side="right") - 1
+
+    return candidates[index], starts[index]
+
+
+def set_crescent_store(path: str = DEFAULT_CRESCENT_STORE) -> None:
+    """
+    Selects the store of first crescents (see first_crescents), which is loaded on first use.
+    :param path: The JSON file of the store, created if it does not exist; None for a store kept in memory only.
+    """
+    global _crescent_store_path, _crescent_store
+
+    _crescent_store_path = path
+    _crescent_store = None
+# endregion
+
+
+# region Protected Auxiliary
+def _centuries(t) -> np.ndarray:
+    """
+    The Julian centuries (dynamical time) of moments.
+    :param t: Array of moments (RD, universal time).
+    :return: Array of Julian centuries since J2000.
+    """
+    t = np.asarray(t, dtype=np.float64)
+
+    return (t + times.ephemeris_corrections(t) - times.J2000) / 36525
+
+
+def _lunar_coordinates(c: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    The lunar longitudes and latitudes of Julian centuries, from the same fundamental arguments.
+    RDU 14.
+    :param c: Array of Julian centuries (dynamical time).
+    :return: Arrays of the longitudes (in [0, 360)) and latitudes, in degrees.
+    """
+    mean_moon = polyval(c, MEAN_LUNAR_LONGITUDE)
+    moon_node = polyval(c, MOON_NODE)
+    lunar_anomaly = polyval(c, LUNAR_ANOMALY)
+    arguments = np.stack([polyval(c, LUNAR_ELONGATION), polyval(c, SOLAR_ANOMALY), lunar_anomaly, moon_node], axis=-1)
+    eccentricity = polyval(c, ECCENTRICITY)[..., np.newaxis]
+
+    def periodic(terms: np.ndarray) -> np.ndarray:
+        sines = np.sin(tools.DEGREE * (arguments @ terms[:, :4].T)) * eccentricity ** np.abs(terms[:, 1])
+        return sines @ terms[:, 4] / 1000000
+
+    venus = tools.DEGREE * (119.75 + 131.849 * c)
+    jupiter = tools.DEGREE * (53.09 + 479264.29 * c)
+    extra = tools.DEGREE * (313.45 + 481266.484 * c)
+
+    longitude = mean_moon + periodic(LONGITUDE_TERMS) + 0.003958 * np.sin(venus) + 0.000318 * np.sin(jupiter) + \
+        0.001962 * np.sin(tools.DEGREE * (mean_moon - moon_node)) + times._nutations(c)
+
+    latitude = periodic(LATITUDE_TERMS) + \
+        0.000175 * (np.sin(venus - tools.DEGREE * moon_node) + np.sin(venus + tools.DEGREE * moon_node)) - \
+        0.002235 * np.sin(tools.DEGREE * mean_moon) + 0.000127 * np.sin(tools.DEGREE * (mean_moon - lunar_anomaly)) - \
+        0.000115 * np.sin(tools.DEGREE * (mean_moon + lunar_anomaly)) + 0.000382 * np.sin(extra)
+
+    return np.mod(longitude, 360), latitude
+
+
+def _search_first_crescents(numbers: np.ndarray, location: Location) -> np.ndarray:
+    """
+    Searches the first days of visibility of the crescents of lunations, day after day from the days of the new
+    moons, for all the lunations at once.
+    :param numbers: Array of lunation numbers.
+    :param location: The location of the observation.
+    :return: Array of RD days (int64).
+    :exception ValueError: Raised if the crescent of a lunation is not visible at the location.
+    """
+    result = np.floor(new_moons(numbers)).astype(np.int64)
+    pending = np.ones(result.shape, dtype=bool)
+
+    # Crescents are seen 1 to 3 days after the new moons: the days are tried by steps of 4.
+    for first in range(0, MAX_CRESCENT_DELAY + 1, 4):
+        days = result[pending, np.newaxis] + np.arange(first, first + 4)
+        visible = visible_crescents(days, location)
+        found = visible.any(axis=1)
+
+        index = np.flatnonzero(pending)
+        result[index[found]] = days[found, np.argmax(visible[found], axis=1)]
+        pending[index[found]] = False
+
+        if not pending.any():
+            return result
+
+    raise ValueError(f"The crescent of lunation {numbers[pending][0]} is not visible at {location}")
+
+
+def _location_key(location: Location) -> str:
+    """
+    The key of a location in the store of first crescents: its coordinates (not its name).
+    """
+    return f"{location.latitude!r},{location.longitude!r},{location.elevation!r},{location.zone!r}"
+
+
+def _load_crescent_store() -> dict:
+    """
+    The store of first crescents, loaded from its file on first use: {location key: {lunation: RD day}}.
+    """
+    global _crescent_store
+
+    if _crescent_store is None:
+        _crescent_store = {} if _crescent_store_path is None else _read_crescent_store(_crescent_store_path)
+
+    return _crescent_store
+
+
+def _save_crescent_store() -> None:
+    """
+    Writes the store of first crescents to its file (if any), replacing it atomically. Several processes may share
+    the file (e.g. the workers of conversion.convert_parallel): under a lock, the file is read again and merged
+    with the store, so that the crescents added by the others are kept, and written through a unique temporary file.
+    """
+    if _crescent_store_path is None:
+        return
+
+    directory = os.path.dirname(os.path.abspath(_crescent_store_path))
+
+    with _crescent_store_lock(_crescent_store_path):
+        for key, crescents in _read_crescent_store(_crescent_store_path).items():
+            _crescent_store.setdefault(key, {}).update(crescents)
+
+        handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=directory)
+
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as file:
+                json.dump(_crescent_store, file)
+
+            os.replace(temporary, _crescent_store_path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+
+def _read_crescent_store(path: str) -> dict:
+    """
+    Reads a file of first crescents: {location key: {lunation: RD day}}, empty if the file does not exist.
+    """
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, encoding="utf-8") as file:
+        return {key: {int(n): day for n, day in crescents.items()} for key, crescents in json.load(file).items()}
+
+
+@contextlib.contextmanager
+def _crescent_store_lock(path: str):
+    """
+    Holds an exclusive lock on the store of first crescents (on a lock file next to it), waiting for it if needed.
+    """
+    with open(path + ".lock", "a+b") as file:
+        if fcntl is not None:
+            fcntl.flock(file, fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+# endregion
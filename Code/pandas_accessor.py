@@ -0,0 +1,121 @@
+"""
+pandas support: the .diebus accessor of Series holding dates, either as RD values (integer or float columns)
+or as datetime64 values, backed by the calendars' bulk conversion instead of from_rd in Series.apply.
+
+pandas is an optional dependency: no other module imports this one, and importing it registers the accessor.
+    import pandas_accessor
+
+    s.diebus.rd                       # Series of RD days
+    s.diebus.to("hebrew")             # DataFrame with the columns year, month, day
+    s.diebus.field("month", "hebrew") # or s.diebus.field("hebrew.month")
+
+Missing values (NaN, NaT) stay missing: the result columns then have pandas' nullable dtypes (Int64, boolean).
+"""
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError as error:
+    raise ImportError("pandas_accessor requires pandas, which is not installed") from error
+
+import tools
+from conversion import calendar_class, calendar_name
+
+DEFAULT_CALENDAR = "gregorian"
+
+
+@pd.api.extensions.register_series_accessor("diebus")
+class DiebusAccessor:
+    """
+    Calendar conversion of a Series of RD values or datetime64 values (s.diebus).
+    datetime64 values are taken by their calendar day (local day for time zone aware values).
+    """
+    def __init__(self, series: pd.Series):
+        """
+        Initialization.
+        :param series: The Series the accessor is used on.
+        :exception AttributeError: Raised if the Series holds neither numbers nor datetime64 values.
+        """
+        if not (pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_datetime64_any_dtype(series.dtype)) \
+                or pd.api.types.is_bool_dtype(series.dtype):
+            raise AttributeError("The .diebus accessor needs a Series of RD values or of datetime64 values")
+
+        self._series = series
+
+    @property
+    def rd(self) -> pd.Series:
+        """
+        The RD days of the Series' values.
+        :return: Series of RD days (int64, or Int64 if values are missing).
+        """
+        t, valid = self._moments()
+
+        return self._to_series(t, valid, self._series.name)
+
+    def to(self, calendar) -> pd.DataFrame:
+        """
+        Converts the values to dates of a calendar.
+        :param calendar: The name of the calendar, or its class.
+        :return: DataFrame with the index of the Series and one column per data field of the calendar.
+        """
+        cls = calendar_class(calendar)
+        t, valid = self._moments()
+
+        columns = {field: self._to_series(values, valid, field)
+                   for field, values in zip(cls.field_names(), cls.from_moments(t))}
+
+        return pd.DataFrame(columns, index=self._series.index)
+
+    def field(self, name: str, calendar=DEFAULT_CALENDAR) -> pd.Series:
+        """
+        A single data field of the values converted to a calendar.
+        :param name: The name of the field, e.g. "month", or "<calendar>.<field>", e.g. "hebrew.month".
+        :param calendar: The name of the calendar, or its class (ignored if name includes the calendar).
+        :return: Series of the field's values, named "<calendar>.<field>".
+        :exception ValueError: Raised if the calendar has no such field.
+        """
+        if "." in name:
+            calendar, name = name.split(".", 1)
+
+        cls = calendar_class(calendar)
+        fields = cls.field_names()
+        if name not in fields:
+            raise ValueError(f"{cls.__name__} has no field '{name}'. Fields: {', '.join(fields)}")
+
+        t, valid = self._moments()
+        values = cls.from_moments(t)[fields.index(name)]
+
+        return self._to_series(values, valid, f"{calendar_name(cls)}.{name}")
+
+    # region Protected Auxiliary
+    def _moments(self) -> (np.ndarray, np.ndarray):
+        """
+        The RD days of the valid (not missing) values.
+        :return: Array of RD days (int64) of the valid values, and the boolean mask of the valid values.
+        """
+        series = self._series
+        valid = series.notna().to_numpy()
+
+        if pd.api.types.is_datetime64_any_dtype(series.dtype) and series.dt.tz is not None:
+            series = series.dt.tz_localize(None)
+
+        return tools.to_rata_die_array(series.to_numpy()[valid]), valid
+
+    def _to_series(self, values: np.ndarray, valid: np.ndarray, name: str) -> pd.Series:
+        """
+        Builds a result Series from the values computed for the valid entries.
+        :param values: The values of the valid entries.
+        :param valid: The boolean mask of the valid entries.
+        :param name: The name of the Series.
+        :return: Series with the index of the accessed Series; missing where the input is missing.
+        """
+        if valid.all():
+            return pd.Series(values, index=self._series.index, name=name)
+
+        dtype = "boolean" if values.dtype == bool else "Int64"
+        result = pd.array(np.zeros(len(valid), dtype=values.dtype), dtype=dtype)
+        result[valid] = values
+        result[~valid] = pd.NA
+
+        return pd.Series(result, index=self._series.index, name=name)
+    # endregion
@@ -0,0 +1,90 @@
+"""
+Islamic prayer times: Fajr, sunrise, Dhuhr, Asr, Maghrib and Isha, for arrays of days and locations at once.
+
+Fajr and Isha are the moments at which the sun is at given depression angles below the horizon (which depend
+on the convention), sunrise and Maghrib those of sunrise and sunset, Dhuhr the apparent noon, and Asr the moment
+at which the shadow of an object is its noon shadow plus one (or two, Hanafi) times its length.
+All are solved by astro's vectorized moment of depression, from the solar state computed once per day.
+No high latitude rule is applied: the times are NaN on days when the sun does not reach the angles.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+import astro
+import tools
+from location import Location, location_arrays
+
+
+@dataclass(frozen=True)
+class PrayerConvention:
+    """
+    The angles of a convention of calculation of the prayer times.
+    """
+    name: str
+    fajr_angle: float               # Depression of the sun at Fajr, degrees.
+    isha_angle: float = None        # Depression of the sun at Isha, degrees (None if given by isha_minutes).
+    isha_minutes: float = 0         # Isha this many minutes after Maghrib, if there is no isha_angle.
+    asr_shadow: int = 1             # Shadow length factor at Asr: 1 (Shafi'i, Maliki, Hanbali) or 2 (Hanafi).
+
+
+# region Conventions
+MUSLIM_WORLD_LEAGUE = PrayerConvention("Muslim World League", 18, 17)
+ISNA = PrayerConvention("Islamic Society of North America", 15, 15)
+EGYPTIAN = PrayerConvention("Egyptian General Authority of Survey", 19.5, 17.5)
+UMM_AL_QURA = PrayerConvention("Umm al-Qura University, Makkah", 18.5, None, 90)
+KARACHI = PrayerConvention("University of Islamic Sciences, Karachi", 18, 18)
+# endregion
+
+# The columns of the prayer times, after the RD day.
+PRAYERS = ["fajr", "sunrise", "dhuhr", "asr", "maghrib", "isha"]
+
+
+def prayer_times(days, locations, convention: PrayerConvention = MUSLIM_WORLD_LEAGUE,
+                 iterations: int = 1) -> np.ndarray:
+    """
+    Calculates the prayer times of days at locations.
+    :param days: Array of RD days.
+    :param locations: A location, or a sequence (or array) of locations.
+    :param convention: The angles to use.
+    :param iterations: The number of refinements of the moments: 1 gives them within half a minute
+    (the precision of published timetables), 2 within a second.
+    :return: Structured array, with a row per location (none for a single location) and a column per day:
+    the RD day ("rd") and the standard times of the prayers (columns PRAYERS), NaN if undefined that day.
+    """
+    days = np.asarray(days, dtype=np.int64)
+    latitude, longitude, elevation, zone = (coordinate[..., np.newaxis] for coordinate in location_arrays(locations))
+
+    shape = np.broadcast(days, latitude).shape
+    result = np.empty(shape, dtype=[("rd", np.int64)] + [(name, np.float64) for name in PRAYERS])
+    result["rd"] = days
+
+    if not days.size or not result.size:
+        return result
+
+    noons, state = astro.daily_solar_state(days)
+
+    # Dhuhr: apparent noon.
+    noon = days + 0.5
+    result["dhuhr"] = noon - astro.interpolate_daily(noon, noons, state.equation_of_time) - \
+        longitude / 360 + zone / 24
+
+    # Asr: the altitude at which the shadow is asr_shadow + tan|latitude - declination| times the length.
+    declination = astro.interpolate_daily(noon - longitude / 360, noons, state.declination)
+    asr_altitude = np.arctan(1 / (convention.asr_shadow + np.tan(tools.DEGREE * np.abs(latitude - declination))))
+
+    sunrise = astro.sunrise_depression(0, Location(elevation=elevation))
+    isha = sunrise if convention.isha_angle is None else convention.isha_angle
+
+    alpha = np.stack([np.broadcast_to(angle, shape) for angle in
+                      [convention.fajr_angle, sunrise, -asr_altitude / tools.DEGREE, sunrise, isha]])
+    early = np.array([True, True, False, False, False]).reshape((5,) + (1,) * len(shape))
+
+    fajr, sunrise, asr, maghrib, isha = astro.depression_moments(days, latitude, longitude, zone, alpha, early,
+                                                                 noons, state, iterations)
+
+    result["fajr"], result["sunrise"], result["asr"], result["maghrib"] = fajr, sunrise, asr, maghrib
+    result["isha"] = maghrib + convention.isha_minutes / 1440 if convention.isha_angle is None else isha
+
+    return result
+
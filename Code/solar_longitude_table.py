@@ -0,0 +1,138 @@
+"""
+Piecewise Chebyshev approximation of the solar longitude, an optional backend of times.solar_longitudes
+(see times.set_solar_longitude_backend).
+
+The series of RDM (12.25) is a smooth function of dynamical time; it is fitted on consecutive segments
+of SEGMENT_DAYS days by Chebyshev polynomials of degree DEGREE, over the Gregorian years FIRST_YEAR to LAST_YEAR.
+The coefficients are saved as a .npy file and loaded on later runs.
+Evaluating the table costs a Clenshaw recurrence of DEGREE steps instead of the 49 sines of the series
+(about 9 times faster, see benchmarks/bench_solar_longitude.py). The maximum error versus the series,
+measured on 2,000,000 random moments of the whole range, is 7.5e-9 degrees (less than a millisecond of time);
+the table takes 6.6 MB.
+
+Generate (or regenerate) the table from the Code directory: python -m solar_longitude_table [path]
+"""
+import os
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+
+import times
+import tools
+
+FIRST_YEAR = -3000
+LAST_YEAR = 3000
+SEGMENT_DAYS = 32
+DEGREE = 11
+
+# The default table file, next to this module (not versioned: generated on first use).
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "solar_longitude_chebyshev.npy")
+
+
+@dataclass(frozen=True)
+class SolarLongitudeTable:
+    """
+    Chebyshev coefficients of the (not reduced) solar longitude on consecutive segments of dynamical time.
+    """
+    start: float                # Dynamical moment (RD) at which the first segment starts.
+    segment_days: float         # The length of the segments, in days.
+    coefficients: np.ndarray    # Chebyshev coefficients, one row per segment.
+
+    @classmethod
+    def build(cls, first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR,
+              segment_days: int = SEGMENT_DAYS, degree: int = DEGREE) -> "SolarLongitudeTable":
+        """
+        Fits the series on the segments covering the Gregorian years first_year to last_year:
+        the coefficients are interpolated at the Chebyshev nodes of each segment.
+        :param first_year: The first Gregorian year.
+        :param last_year: The last Gregorian year.
+        :param segment_days: The length of the segments, in days.
+        :param degree: The degree of the polynomials.
+        :return: The table.
+        """
+        start = int(tools.gregorian_new_years(np.array([first_year]))[0])
+        end = int(tools.gregorian_new_years(np.array([last_year + 1]))[0])
+        count = -(-(end - start) // segment_days)
+
+        n = degree + 1
+        angles = np.pi * (np.arange(n) + 0.5) / n
+        nodes = np.cos(angles)
+
+        t = start + segment_days * (np.arange(count)[:, np.newaxis] + (nodes + 1) / 2)
+        values = times.solar_longitudes_at_centuries((t - times.J2000) / 36525)
+
+        # Discrete Chebyshev transform: c_j = 2/n sum f(x_k) T_j(x_k), halved for j = 0.
+        transform = 2 / n * np.cos(np.outer(angles, np.arange(n)))
+        transform[:, 0] /= 2
+
+        return cls(float(start), float(segment_days), values @ transform)
+
+    @classmethod
+    def load(cls, path: str) -> "SolarLongitudeTable":
+        """
+        Loads a table saved by save.
+        :param path: The .npy file.
+        :return: The table.
+        """
+        data = np.load(path)
+
+        return cls(float(data[0, 0]), float(data[0, 1]), data[1:])
+
+    def save(self, path: str) -> None:
+        """
+        Saves the table as a single .npy array: a header row (start, segment_days) followed by the coefficients.
+        :param path: The .npy file.
+        """
+        header = np.zeros((1, self.coefficients.shape[1]))
+        header[0, :2] = self.start, self.segment_days
+
+        np.save(path, np.concatenate([header, self.coefficients]))
+
+    def evaluate(self, t_dynamic) -> np.ndarray:
+        """
+        The solar longitude (not reduced modulo 360) at dynamical moments; moments outside the table
+        are evaluated by the series.
+        :param t_dynamic: Array of moments (RD, dynamical time).
+        :return: Array of solar longitudes, in degrees.
+        """
+        t_dynamic = np.asarray(t_dynamic, dtype=np.float64)
+        position = (t_dynamic - self.start) / self.segment_days
+        segment = np.floor(position).astype(np.int64)
+        inside = (0 <= segment) & (segment < len(self.coefficients))
+
+        segment = np.where(inside, segment, 0)
+        x = 2 * (position - segment) - 1
+        coefficients = self.coefficients[segment]
+
+        # Clenshaw recurrence.
+        b1 = np.zeros(t_dynamic.shape)
+        b2 = np.zeros(t_dynamic.shape)
+
+        for j in range(coefficients.shape[-1] - 1, 0, -1):
+            b1, b2 = coefficients[..., j] + 2 * x * b1 - b2, b1
+
+        result = coefficients[..., 0] + x * b1 - b2
+
+        if not np.all(inside):
+            result[~inside] = times.solar_longitudes_at_centuries((t_dynamic[~inside] - times.J2000) / 36525)
+
+        return result
+
+
+def load_or_build(path: str = DEFAULT_PATH) -> SolarLongitudeTable:
+    """
+    Loads the table from a file, building and saving it first if the file does not exist.
+    :param path: The .npy file.
+    :return: The table.
+    """
+    if not os.path.exists(path):
+        SolarLongitudeTable.build().save(path)
+
+    return SolarLongitudeTable.load(path)
+
+
+if __name__ == '__main__':
+    table_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    SolarLongitudeTable.build().save(table_path)
+    print(f"Saved {table_path}")
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from calendars.arithmetic_persian import ArithmeticPersianDate
 
 class TestArithmeticPersianDate(unittest.TestCase):
@@ -19,14 +21,35 @@ class TestArithmeticPersianDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            persian = ArithmeticPersianDate()
-            persian.from_moment(rd)
+            persian = ArithmeticPersianDate.from_rd(rd)
 
             # print(persian, data[rd])
             self.assertEqual(persian.year, data[rd].year)
             self.assertEqual(persian.month, data[rd].month)
             self.assertEqual(persian.day, data[rd].day)
 
+    def test_arithmetic_persian_dates_to_moments(self):
+        data = self.prepare_data()
+
+        rds = np.array(list(data.keys()))
+        years = [data[rd].year for rd in data]
+        months = [data[rd].month for rd in data]
+        days = [data[rd].day for rd in data]
+
+        np.testing.assert_array_equal(ArithmeticPersianDate.to_moments(years, months, days), rds)
+
+    def test_moments_to_arithmetic_persian_dates(self):
+        rng = np.random.default_rng(2820)
+        rds = np.concatenate([rng.integers(-3000000, 3000000, 20000), np.arange(-2000, 2000)])
+        years, months, days = ArithmeticPersianDate.from_moments(rds)
+
+        for i in range(len(rds)):
+            persian = ArithmeticPersianDate.from_rd(int(rds[i]))
+
+            self.assertEqual((persian.year, persian.month, persian.day), (years[i], months[i], days[i]))
+
+        np.testing.assert_array_equal(ArithmeticPersianDate.to_moments(years, months, days), rds)
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
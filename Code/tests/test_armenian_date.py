@@ -21,8 +21,7 @@ class TestArmenianDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            armenian = ArmenianDate()
-            armenian.from_moment(rd)
+            armenian = ArmenianDate.from_rd(rd)
 
             self.assertEqual(armenian.year, data[rd].year)
             self.assertEqual(armenian.month, data[rd].month)
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+import astro
+import location
+from calendars.gregorian_date import GregorianDate
+from location import Location
+
+TROMSO = Location("Tromsø", 69.6496, 18.9560, 0, 1)
+
+
+class TestAstro(unittest.TestCase):
+    """
+    Tests for sunset and the daily almanac.
+    """
+    def test_sunset(self):
+        t = GregorianDate(1945, 11, 12).to_moment()
+
+        # RDM: sunset in Urbana on November 12, 1945 is at 4:42 pm.
+        self.assertAlmostEqual((astro.sunset(t, location.URBANA) - t) * 24 * 60, 16 * 60 + 42, delta=1)
+
+    def test_refraction(self):
+        # The elevations of several locations at once, as for the prayer times: the same angles as one by one.
+        locations = [location.URBANA, location.MECCA, TROMSO, Location("Everest", 27.988, 86.925, 8849, 5.75)]
+        elevations = np.array([locale.elevation for locale in locations])
+        depressions = astro.sunrise_depression(0, Location(elevation=elevations))
+
+        for locale, depression in zip(locations, depressions):
+            self.assertEqual(depression, astro.refraction(0, locale) + astro.SUN_SEMI_DIAMETER)
+
+    def test_almanac(self):
+        start = GregorianDate(2024, 1, 1).to_moment()
+        days = np.arange(start, start + 366)
+        locations = [location.URBANA, location.MECCA, location.PARIS]
+
+        tables = astro.almanac(days, locations)
+        self.assertEqual(len(tables), len(locations))
+
+        for locale, table in zip(locations, tables):
+            np.testing.assert_array_equal(table["rd"], days)
+
+            for i in range(0, len(days), 15):
+                self.assertAlmostEqual(table["sunset"][i], astro.sunset(int(days[i]), locale), delta=2 / 86400)
+
+            # At these latitudes, every event occurs (but astronomical twilight in Paris in summer), in order.
+            events = np.column_stack([table[name] for name, _, _ in astro.ALMANAC_EVENTS])
+            complete = ~np.any(np.isnan(events), axis=1)
+            self.assertTrue(np.all(np.diff(events[complete], axis=1) > 0))
+            self.assertGreater(complete.sum(), 300)
+
+    def test_almanac_before_epoch(self):
+        # Days on both sides of RD 0: the daily solar state is indexed from its first (negative) noon.
+        days = np.arange(-5, 5)
+        table = astro.almanac(days, location.MECCA)
+
+        for i, day in enumerate(days.tolist()):
+            self.assertAlmostEqual(table["sunset"][i], astro.sunset(day, location.MECCA), delta=2 / 86400)
+            self.assertAlmostEqual(table["civil_dusk"][i], astro.dusk(day, location.MECCA, astro.CIVIL_TWILIGHT),
+                                   delta=2 / 86400)
+
+    def test_almanac_polar(self):
+        start = GregorianDate(2024, 1, 1).to_moment()
+        table = astro.almanac(np.arange(start, start + 366), TROMSO)
+
+        # Polar night in December and midnight sun in June: no sunrise.
+        december, june = table[350], table[172]
+        self.assertTrue(np.isnan(december["sunrise"]) and not np.isnan(december["civil_dawn"]))
+        self.assertTrue(np.isnan(june["sunrise"]) and np.isnan(june["civil_dusk"]))
+        self.assertFalse(np.isnan(table[80]["sunrise"]))
@@ -13,8 +13,7 @@ class TestBalineseDate(unittest.TestCase):
 
         for rd in data:
             print(rd)
-            balinese = BalineseDate()
-            balinese.from_moment(rd)
+            balinese = BalineseDate.from_rd(rd)
 
             self.assertEqual(balinese.luang, data[rd].luang)
             self.assertEqual(balinese.dwiwara, data[rd].dwiwara)
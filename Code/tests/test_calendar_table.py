@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from calendar_table import CalendarTable, build_table
+from calendars.gregorian_date import GregorianDate
+from calendars.hebrew_date import HebrewDate
+from calendars.old_hindu_lunar_date import OldHinduLunarDate
+from conversion import CALENDARS, EXPENSIVE_CALENDARS
+
+TABLE_CALENDARS = ["gregorian", "hebrew", "iso", "mayan_long_count", "old_hindu_lunar", "roman"]
+
+
+class TestCalendarTable(unittest.TestCase):
+    """
+    Tests for the precomputed table of calendar fields.
+    """
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "table.npy")
+        build_table(self.file_name, 700000, 703000, TABLE_CALENDARS, chunk_size=1000)
+        self.table = CalendarTable(self.file_name)
+
+    def tearDown(self):
+        del self.table
+        self.directory.cleanup()
+
+    def test_table_layout(self):
+        self.assertIsInstance(self.table.table, np.memmap)
+        self.assertEqual((self.table.first_rd, self.table.last_rd), (700000, 703000))
+        self.assertEqual(list(self.table.fields), TABLE_CALENDARS)
+        self.assertEqual(self.table.table.dtype["gregorian.day"], np.int8)
+        self.assertEqual(self.table.table.dtype["old_hindu_lunar.is_leap_month"], np.bool_)
+
+    def test_table_from_rd(self):
+        for t in range(699990, 703010, 7):
+            for cls in [GregorianDate, HebrewDate, OldHinduLunarDate]:
+                date = self.table.from_rd(cls, t)
+
+                self.assertEqual(date, cls.from_rd(t))
+                self.assertIs(type(date.year), int)
+
+    def test_table_from_moments(self):
+        t = np.arange(699000, 704000, 3)
+
+        for name in TABLE_CALENDARS + ["coptic"]:
+            expected = CALENDARS[name].from_moments(t)
+            result = self.table.from_moments(name, t)
+
+            for values, expected_values in zip(result, expected):
+                np.testing.assert_array_equal(values, expected_values)
+
+    def test_default_calendars(self):
+        file_name = os.path.join(self.directory.name, "default.npy")
+        build_table(file_name, 700000, 700010)
+        table = CalendarTable(file_name)
+
+        self.assertIn("gregorian", table.fields)
+        self.assertFalse(set(EXPENSIVE_CALENDARS) & set(table.fields))
+        del table
@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+
+from calendars.gregorian_date import GregorianDate
+from calendars.old_hindu_lunar_date import OldHinduLunarDate
+from conversion import calendar_class, calendar_name, convert_parallel
+
+
+class TestConversion(unittest.TestCase):
+    """
+    Tests for the calendar registry and the parallel bulk conversion.
+    """
+    def test_calendar_registry(self):
+        self.assertIs(calendar_class("gregorian"), GregorianDate)
+        self.assertIs(calendar_class(GregorianDate), GregorianDate)
+        self.assertEqual(calendar_name(OldHinduLunarDate), "old_hindu_lunar")
+
+        with self.assertRaises(ValueError):
+            calendar_class("lunisolar")
+
+    def test_convert_parallel(self):
+        t = np.arange(-50000, 50000, 25).reshape(2, -1)
+
+        for calendar in ["gregorian", "hebrew", OldHinduLunarDate]:
+            expected = calendar_class(calendar).from_moments(t)
+            result = convert_parallel(t, calendar, workers=2)
+
+            for values, expected_values in zip(result, expected):
+                self.assertEqual(values.shape, t.shape)
+                np.testing.assert_array_equal(values, expected_values)
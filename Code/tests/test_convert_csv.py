@@ -0,0 +1,70 @@
+import csv
+import io
+import subprocess
+import sys
+import unittest
+
+from convert_csv import convert_csv
+
+
+class TestConvertCsv(unittest.TestCase):
+    """
+    Tests for the streaming CSV conversion.
+    """
+    def test_convert_csv(self):
+        gregorian = self.read_data("gregorian")
+        roman = self.read_data("roman")
+
+        with open("../data/roman.csv", "r", newline="") as input_file:
+            output_file = io.StringIO()
+            count = convert_csv(input_file, output_file, "roman", ["Year", "Month", "Event", "Count", "Leap"],
+                                ["rd", "gregorian", "roman"], chunk_size=7)
+
+        rows = list(csv.reader(io.StringIO(output_file.getvalue())))
+
+        self.assertEqual(count, len(roman))
+        self.assertEqual(rows[0][6:], ["rd", "gregorian.year", "gregorian.month", "gregorian.day",
+                                       "roman.year", "roman.month", "roman.event", "roman.count", "roman.is_leap_day"])
+
+        for row, gregorian_row in zip(rows[1:], gregorian):
+            self.assertEqual(row[6], row[0])
+            self.assertEqual(row[6:10], gregorian_row)
+            self.assertEqual(row[10:], row[1:6])
+
+    def test_convert_csv_errors(self):
+        with self.assertRaises(ValueError):
+            convert_csv(io.StringIO("Rd\n1\n"), io.StringIO(), "rd", ["Day"], ["gregorian"])
+
+        with self.assertRaises(ValueError):
+            convert_csv(io.StringIO("Y,M\n1,1\n"), io.StringIO(), "gregorian", ["Y", "M"], ["rd"])
+
+        with self.assertRaisesRegex(ValueError, "Line 3"):
+            convert_csv(io.StringIO("Rd\n1\nx\n"), io.StringIO(), "rd", ["Rd"], ["gregorian"])
+
+        with self.assertRaisesRegex(ValueError, "no RD value"):
+            convert_csv(io.StringIO("M,D\n1,1\n"), io.StringIO(), "mayan_haab", ["M", "D"], ["gregorian"])
+
+    def test_command_line(self):
+        def run(*arguments: str) -> subprocess.CompletedProcess:
+            return subprocess.run([sys.executable, "convert_csv.py", "-", "-", *arguments, "--progress"], cwd="..",
+                                  input="Rd\n710347\n", capture_output=True, text=True)
+
+        # Standard output stays open: the progress report follows the conversion.
+        result = run("--source", "rd", "--columns", "Rd", "--to", "gregorian")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.split(),
+                         ["Rd,gregorian.year,gregorian.month,gregorian.day", "710347,1945,11,12"])
+        self.assertIn("1 rows", result.stderr)
+
+        result = run("--source", "mayan_tzolkin", "--columns", "Rd", "--to", "gregorian")
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("no RD value", result.stderr)
+
+    def read_data(self, name: str) -> list[list[str]]:
+        """
+        Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
+        :param name: The name of the calendar's data file.
+        :return: The rows of the file, without the header.
+        """
+        with open(f"../data/{name}.csv", "r", newline="") as file:
+            return list(csv.reader(file))[1:]
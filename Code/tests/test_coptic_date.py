@@ -21,8 +21,7 @@ class TestCopticDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            greg = CopticDate()
-            greg.from_moment(rd)
+            greg = CopticDate.from_rd(rd)
 
             self.assertEqual(greg.year, data[rd].year)
             self.assertEqual(greg.month, data[rd].month)
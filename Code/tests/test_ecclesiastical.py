@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+import ecclesiastical
+from calendars.gregorian_date import GregorianDate
+from calendars.julian_date import JulianDate
+
+# Gregorian dates of Easter: (Gregorian, Orthodox).
+EASTERS = {2000: ((2000, 4, 23), (2000, 4, 30)),
+           2019: ((2019, 4, 21), (2019, 4, 28)),
+           2024: ((2024, 3, 31), (2024, 5, 5)),
+           2025: ((2025, 4, 20), (2025, 4, 20)),
+           2038: ((2038, 4, 25), (2038, 4, 25))}
+
+
+class TestEcclesiastical(unittest.TestCase):
+    """
+    Tests for Easter and the movable feasts.
+    """
+    def test_easters(self):
+        years = np.array(list(EASTERS))
+        gregorian = [GregorianDate(*dates[0]).to_moment() for dates in EASTERS.values()]
+        orthodox = [GregorianDate(*dates[1]).to_moment() for dates in EASTERS.values()]
+
+        np.testing.assert_array_equal(ecclesiastical.easters(years), gregorian)
+        np.testing.assert_array_equal(ecclesiastical.orthodox_easters(years), orthodox)
+
+    def test_computus(self):
+        """
+        The epacts of RDM agree with the algorithms of Meeus (chapter 8), for 10,000 years.
+        """
+        years = np.arange(1583, 11583)
+        a, b, c = years % 19, years // 100, years % 100
+        h = (19 * a + b - b // 4 - (b - (b + 8) // 25 + 1) // 3 + 15) % 30
+        i, k = c // 4, c % 4
+        ell = (32 + 2 * (b % 4) + 2 * i - h - k) % 7
+        m = (a + 11 * h + 22 * ell) // 451
+        month, day = np.divmod(h + ell - 7 * m + 114, 31)
+
+        np.testing.assert_array_equal(ecclesiastical.easters(years), GregorianDate.to_moments(years, month, day + 1))
+
+        julian_years = np.arange(1, 10001)
+        e = (2 * (julian_years % 4) + 4 * (julian_years % 7) - (19 * (julian_years % 19) + 15) % 30 + 34) % 7
+        month, day = np.divmod((19 * (julian_years % 19) + 15) % 30 + e + 114, 31)
+        easters = ecclesiastical.orthodox_easters(julian_years)
+
+        np.testing.assert_array_equal(easters, JulianDate.to_moments(julian_years, month, day + 1))
+        np.testing.assert_array_equal(GregorianDate.from_moments(easters)[0], julian_years)
+
+    def test_movable_feasts(self):
+        feasts = ecclesiastical.movable_feasts(np.arange(-5000, 5000))
+
+        self.assertEqual(feasts.shape, (10000,))
+        np.testing.assert_array_equal(feasts["easter"] % 7, 0)
+        np.testing.assert_array_equal(feasts["ash_wednesday"] % 7, 3)
+        np.testing.assert_array_equal(feasts["pentecost"] - feasts["easter"], 49)
+
+        row = feasts[feasts["year"] == 2024][0]
+        self.assertEqual(row["ash_wednesday"], GregorianDate(2024, 2, 14).to_moment())
+        self.assertEqual(row["pentecost"], GregorianDate(2024, 5, 19).to_moment())
+
+        orthodox = ecclesiastical.movable_feasts([2024], orthodox=True)
+        self.assertEqual(orthodox["pentecost"][0], GregorianDate(2024, 6, 23).to_moment())
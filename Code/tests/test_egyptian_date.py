@@ -21,8 +21,7 @@ class TestEgyptianDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            egyptian = EgyptianDate()
-            egyptian.from_moment(rd)
+            egyptian = EgyptianDate.from_rd(rd)
 
             self.assertEqual(egyptian.year, data[rd].year)
             self.assertEqual(egyptian.month, data[rd].month)
@@ -1,6 +1,10 @@
 import math
 import unittest
 
+import numpy as np
+
+import location
+import times
 from calendars.gregorian_date import GregorianDate
 from times import equation_of_time
 
@@ -36,3 +40,29 @@ class TestEquationOfTime(unittest.TestCase):
 
             error = math.fabs(et - et_expected) * 60
             print(f"et = {et}\t expected = {et_expected}, \terror={error} s")
+
+    def test_equations_of_time(self):
+        data = np.loadtxt("../data/equation_of_time.csv", delimiter=",", skiprows=1)
+        t = np.array([GregorianDate(int(year), int(month), int(day)).to_moment() for year, month, day in data[:, :3]])
+
+        et = times.equations_of_time(t)
+
+        np.testing.assert_allclose(et * 24 * 60, data[:, 3], rtol=0, atol=0.05 / 60)
+        np.testing.assert_allclose(et, [equation_of_time(moment) for moment in t], rtol=0, atol=1e-15)
+        np.testing.assert_allclose(times.local_to_apparent_times(t) - times.apparent_to_local_times(t), 2 * et,
+                                   rtol=0, atol=1e-9)
+
+    def test_middays_and_midnights(self):
+        t = np.arange(738521, 738886, 5.0)
+        locations = [location.URBANA, location.MECCA, location.PARIS]
+
+        middays = times.middays(t[:, np.newaxis], locations)
+        midnights = times.midnights(t[:, np.newaxis], locations)
+        self.assertEqual(middays.shape, (len(t), len(locations)))
+
+        for i, moment in enumerate(t):
+            for j, place in enumerate(locations):
+                self.assertAlmostEqual(middays[i, j], times.midday(moment, place), places=12)
+                self.assertAlmostEqual(midnights[i, j], times.midnight(moment, place), places=12)
+
+        self.assertEqual(times.middays(t[0], location.MECCA), times.midday(t[0], location.MECCA))
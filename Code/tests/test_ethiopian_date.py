@@ -21,8 +21,7 @@ class TestEthiopicDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            greg = EthiopicDate()
-            greg.from_moment(rd)
+            greg = EthiopicDate.from_rd(rd)
 
             self.assertEqual(greg.year, data[rd].year)
             self.assertEqual(greg.month, data[rd].month)
@@ -0,0 +1,80 @@
+import math
+import unittest
+
+import numpy as np
+
+import location
+import times
+from calendars.arithmetic_french_revolutionary import ArithmeticFrenchRevolutionaryDate
+from calendars.french_revolutionary_date import FrenchRevolutionaryDate
+from calendars.gregorian_date import GregorianDate
+
+# Gregorian dates of 1 Vendémiaire of the years I to XIV, as the calendar was used until 1805.
+HISTORICAL_NEW_YEARS = [(1792, 9, 22), (1793, 9, 22), (1794, 9, 22), (1795, 9, 23), (1796, 9, 22),
+                        (1797, 9, 22), (1798, 9, 22), (1799, 9, 23), (1800, 9, 23), (1801, 9, 23),
+                        (1802, 9, 23), (1803, 9, 24), (1804, 9, 23), (1805, 9, 23)]
+
+
+class TestFrenchRevolutionaryDate(unittest.TestCase):
+    """
+    Tests for the astronomical and arithmetic French Revolutionary calendars.
+    """
+    def test_historical_new_years(self):
+        for year, (g_year, g_month, g_day) in enumerate(HISTORICAL_NEW_YEARS, start=1):
+            rd = GregorianDate(g_year, g_month, g_day).to_moment()
+
+            self.assertEqual(FrenchRevolutionaryDate.new_year(year), rd)
+            self.assertEqual(FrenchRevolutionaryDate.from_rd(rd), FrenchRevolutionaryDate(year, 1, 1))
+            self.assertEqual(FrenchRevolutionaryDate.from_rd(rd - 1).month, 13)
+
+    def test_new_year_table(self):
+        """
+        The table agrees with the day-by-day search of RDM (16.3).
+        """
+        for year in range(-1000, 3000, 37):
+            self.assertEqual(FrenchRevolutionaryDate.new_year(year), self.new_year_on_or_before(
+                math.floor(FrenchRevolutionaryDate.EPOCH + 180 + times.MEAN_TROPICAL_YEAR * (year - 1))))
+
+    def test_french_revolutionary_bulk_conversion(self):
+        for calendar in [FrenchRevolutionaryDate, ArithmeticFrenchRevolutionaryDate]:
+            rds = np.arange(300000, 1300000, 11)
+            years, months, days = calendar.from_moments(rds)
+
+            np.testing.assert_array_equal(calendar.to_moments(years, months, days), rds)
+            self.assertTrue(np.all((1 <= days) & (days <= 30) & (1 <= months) & (months <= 13)))
+
+            for i in range(0, len(rds), 1009):
+                date = calendar.from_rd(int(rds[i]))
+
+                self.assertEqual((date.year, date.month, date.day), (years[i], months[i], days[i]))
+                self.assertEqual(date.to_moment(), rds[i])
+
+    def test_arithmetic_leap_years(self):
+        years = np.arange(-4000, 8000)
+        lengths = ArithmeticFrenchRevolutionaryDate.to_moments(years + 1, 1, 1) - \
+            ArithmeticFrenchRevolutionaryDate.to_moments(years, 1, 1)
+
+        for year, length in zip(years, lengths):
+            self.assertEqual(length == 366, ArithmeticFrenchRevolutionaryDate.is_leap_year(year))
+
+        self.assertFalse(ArithmeticFrenchRevolutionaryDate.is_leap_year(4000))
+        self.assertEqual(ArithmeticFrenchRevolutionaryDate.from_rd(FrenchRevolutionaryDate.EPOCH),
+                         ArithmeticFrenchRevolutionaryDate(1, 1, 1))
+
+    @staticmethod
+    def new_year_on_or_before(t: int) -> int:
+        """
+        RDM (16.3), with the scalar solar longitude.
+        :param t: The RD day.
+        :return: The RD day of the French Revolutionary new year on or before it.
+        """
+        def midnight_in_paris(day: int) -> float:
+            return times.standard_to_universal(times.midnight(day + 1, location.PARIS), location.PARIS)
+
+        approx = times.estimate_prior_solar_longitude(midnight_in_paris(t), times.AUTUMN)
+        day = math.floor(approx) - 1
+
+        while times.solar_longitude(midnight_in_paris(day)) < times.AUTUMN:
+            day += 1
+
+        return day
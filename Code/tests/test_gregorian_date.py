@@ -1,6 +1,10 @@
+import dataclasses
 import unittest
 
+import numpy as np
+
 from calendars.gregorian_date import GregorianDate
+from calendars.julian_date import JulianDate
 
 
 class TestGregorianDate(unittest.TestCase):
@@ -21,13 +25,23 @@ class TestGregorianDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            greg = GregorianDate()
-            greg.from_moment(rd)
+            greg = GregorianDate.from_rd(rd)
 
             self.assertEqual(greg.year, data[rd].year)
             self.assertEqual(greg.month, data[rd].month)
             self.assertEqual(greg.day, data[rd].day)
 
+    def test_gregorian_bulk_conversion(self):
+        data = self.prepare_data()
+        rds = np.array(list(data))
+        years, months, days = GregorianDate.from_moments(rds)
+
+        self.assertEqual(list(zip(years, months, days)), [(date.year, date.month, date.day) for date in data.values()])
+        np.testing.assert_array_equal(GregorianDate.to_moments(years, months, days), rds)
+
+        rds = np.arange(-200000, 900000, 3)
+        np.testing.assert_array_equal(GregorianDate.to_moments(*GregorianDate.from_moments(rds)), rds)
+
     def test_gregorian_date_from_day_number(self):
         data = self.prepare_data()
 
@@ -40,6 +54,40 @@ class TestGregorianDate(unittest.TestCase):
             self.assertEqual(gregorian.month, gregorian_calculated.month)
             self.assertEqual(gregorian.day, gregorian_calculated.day)
 
+    def test_gregorian_date_is_value(self):
+        data = self.prepare_data()
+        dates = {data[rd]: rd for rd in data}
+
+        for rd in data:
+            self.assertEqual(dates[GregorianDate.from_rd(rd)], rd)
+
+        date = GregorianDate(2000, 1, 1)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            date.day = 2
+        self.assertFalse(hasattr(date, "__dict__"))
+
+    def test_gregorian_date_ordering(self):
+        data = self.prepare_data()
+        dates = sorted(data.values())
+
+        self.assertEqual([date.to_moment() for date in dates], sorted(data))
+        self.assertLess(GregorianDate(2000, 12, 31), GregorianDate(2001, 1, 1))
+        self.assertLess(GregorianDate(2000, 1, 1), JulianDate(2000, 1, 1))
+        self.assertGreaterEqual(JulianDate.from_rd(730120), GregorianDate.from_rd(730120))
+
+    def test_gregorian_date_arithmetic(self):
+        date = GregorianDate(2024, 1, 1)
+
+        self.assertEqual(date + 366, GregorianDate(2025, 1, 1))
+        self.assertEqual((date - 1.0).rd, date.rd - 1)
+        self.assertEqual(GregorianDate(2025, 1, 1) - date, 366)
+
+        # A date has no time of day: it is shifted by whole days only.
+        with self.assertRaises(ValueError):
+            date.add_days(0.5)
+        with self.assertRaises(ValueError):
+            date - 0.5
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
@@ -1,4 +1,6 @@
+import random
 import unittest
+from unittest import mock
 
 from calendars.hebrew_date import HebrewDate
 
@@ -22,13 +24,32 @@ class TestHebrewDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            hebrew = HebrewDate()
-            hebrew.from_moment(rd)
+            hebrew = HebrewDate.from_rd(rd)
 
             self.assertEqual(hebrew.year, data[rd].year)
             self.assertEqual(hebrew.month, data[rd].month)
             self.assertEqual(hebrew.day, data[rd].day)
 
+    def test_sort_hebrew_dates(self):
+        rds = random.Random(0).sample(range(600000, 800000), 500)
+        dates = [HebrewDate.from_rd(rd) for rd in rds]
+
+        with mock.patch.object(HebrewDate, "to_moment", autospec=True,
+                               side_effect=HebrewDate.to_moment) as to_moment:
+            result = sorted(dates)
+            self.assertEqual(to_moment.call_count, len(dates))
+
+        self.assertEqual([date.rd for date in result], sorted(rds))
+
+    def test_hebrew_date_arithmetic(self):
+        data = self.prepare_data()
+        rds = sorted(data)
+
+        for rd0, rd1 in zip(rds, rds[1:]):
+            self.assertEqual(data[rd1] - data[rd0], rd1 - rd0)
+            self.assertEqual(data[rd0].add_days(rd1 - rd0), data[rd1])
+            self.assertEqual(data[rd1] - (rd1 - rd0), data[rd0])
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
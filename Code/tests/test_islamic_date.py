@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from calendars.islamic_date import IslamicDate
 
 
@@ -20,13 +22,42 @@ class TestCopticDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            islamic = IslamicDate()
-            islamic.from_moment(rd)
+            islamic = IslamicDate.from_rd(rd)
 
             self.assertEqual(islamic.year, data[rd].year)
             self.assertEqual(islamic.month, data[rd].month)
             self.assertEqual(islamic.day, data[rd].day)
 
+    def test_islamic_dates_to_moments(self):
+        data = self.prepare_data()
+
+        rds = np.array(list(data.keys()))
+        years = [data[rd].year for rd in data]
+        months = [data[rd].month for rd in data]
+        days = [data[rd].day for rd in data]
+
+        np.testing.assert_array_equal(IslamicDate.to_moments(years, months, days), rds)
+
+    def test_moments_to_islamic_dates(self):
+        rds = np.arange(-1000000, 1000000, 11)
+        years, months, days = IslamicDate.from_moments(rds)
+
+        for i in range(0, len(rds), 13):
+            islamic = IslamicDate.from_rd(int(rds[i]))
+
+            self.assertEqual((islamic.year, islamic.month, islamic.day), (years[i], months[i], days[i]))
+
+        np.testing.assert_array_equal(IslamicDate.to_moments(years, months, days), rds)
+
+    def test_islamic_month_ranges(self):
+        years, months, starts, ends = IslamicDate.month_ranges(1440, 1450)
+
+        self.assertEqual(len(starts), 11 * 12)
+        np.testing.assert_array_equal(starts[1:], ends[:-1] + 1)
+        np.testing.assert_array_equal(IslamicDate.from_moments(starts), (years, months, np.ones_like(starts)))
+        self.assertTrue(np.all(np.isin(ends - starts + 1, [29, 30])))
+        self.assertEqual(ends[-1], IslamicDate(1451, 1, 1).to_moment() - 1)
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from calendars.iso_date import IsoDate
 
 
@@ -17,13 +19,43 @@ class TestIsoDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            iso = IsoDate()
-            iso.from_moment(rd)
+            iso = IsoDate.from_rd(rd)
 
             self.assertEqual(iso.year, data[rd].year)
             self.assertEqual(iso.week, data[rd].week)
             self.assertEqual(iso.day, data[rd].day)
 
+    def test_iso_dates_to_moments(self):
+        data = self.prepare_data()
+
+        rds = np.array(list(data.keys()))
+        years = [data[rd].year for rd in data]
+        weeks = [data[rd].week for rd in data]
+        days = [data[rd].day for rd in data]
+
+        np.testing.assert_array_equal(IsoDate.to_moments(years, weeks, days), rds)
+
+    def test_moments_to_iso_dates(self):
+        rds = np.arange(-800000, 800000, 37)
+        years, weeks, days = IsoDate.from_moments(rds)
+
+        for i in range(0, len(rds), 97):
+            iso = IsoDate.from_rd(int(rds[i]))
+
+            self.assertEqual((iso.year, iso.week, iso.day), (years[i], weeks[i], days[i]))
+
+        np.testing.assert_array_equal(IsoDate.to_moments(years, weeks, days), rds)
+
+    def test_iso_week_ranges(self):
+        years, weeks, starts, ends = IsoDate.week_ranges(1990, 2030)
+
+        self.assertEqual(starts[0], IsoDate(1990, 1, 1).to_moment())
+        self.assertEqual(ends[-1], IsoDate(2031, 1, 1).to_moment() - 1)
+        np.testing.assert_array_equal(starts[1:], ends[:-1] + 1)
+        np.testing.assert_array_equal(IsoDate.to_moments(years, weeks, 1), starts)
+        self.assertEqual(weeks[years == 2020].max(), 53)
+        self.assertEqual(weeks[years == 2021].max(), 52)
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
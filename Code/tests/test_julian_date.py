@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from calendars.julian_date import JulianDate
 
 
@@ -22,13 +24,25 @@ class TestJulianDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            greg = JulianDate()
-            greg.from_moment(rd)
+            greg = JulianDate.from_rd(rd)
 
             self.assertEqual(greg.year, data[rd].year)
             self.assertEqual(greg.month, data[rd].month)
             self.assertEqual(greg.day, data[rd].day)
 
+    def test_julian_bulk_conversion(self):
+        data = self.prepare_data()
+        rds = np.array(list(data))
+        years, months, days = JulianDate.from_moments(rds)
+
+        self.assertEqual(list(zip(years, months, days)), [(date.year, date.month, date.day) for date in data.values()])
+        np.testing.assert_array_equal(JulianDate.to_moments(years, months, days), rds)
+
+        # Around the year 1 (there is no year 0).
+        rds = np.arange(-1000, 1000)
+        np.testing.assert_array_equal(JulianDate.to_moments(*JulianDate.from_moments(rds)), rds)
+        self.assertEqual(set(JulianDate.from_moments(rds)[0].tolist()), {-3, -2, -1, 1, 2, 3})
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
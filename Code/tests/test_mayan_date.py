@@ -0,0 +1,40 @@
+import unittest
+
+import numpy as np
+
+from calendars.mayan_date import MayanDate
+
+
+class TestMayanDate(unittest.TestCase):
+    """
+    Tests for composite Mayan dates.
+    """
+    def test_moments_to_mayan_dates(self):
+        rds = np.arange(-1000000, 1000000, 17)
+        records = MayanDate.from_moments(rds)
+
+        np.testing.assert_array_equal(records["rd"], rds)
+
+        for record in records[::101]:
+            mayan = MayanDate.from_rd(int(record["rd"]))
+
+            self.assertEqual((mayan.long_count.baktun, mayan.long_count.katun, mayan.long_count.tun,
+                              mayan.long_count.uinal, mayan.long_count.kin),
+                             (record["baktun"], record["katun"], record["tun"], record["uinal"], record["kin"]))
+            self.assertEqual((mayan.haab.month, mayan.haab.day), (record["haab_month"], record["haab_day"]))
+            self.assertEqual((mayan.tzolkin.number, mayan.tzolkin.name),
+                             (record["tzolkin_number"], record["tzolkin_name"]))
+            self.assertEqual(mayan.to_moment(), record["rd"])
+
+    def test_calendar_round_repeats(self):
+        """
+        A calendar round (Haab and Tzolkin) repeats every 18980 days.
+        """
+        records = MayanDate.from_moments(np.arange(0, 100000))
+        first = records[0]
+
+        matches = records[(records["haab_month"] == first["haab_month"]) & (records["haab_day"] == first["haab_day"]) &
+                          (records["tzolkin_number"] == first["tzolkin_number"]) &
+                          (records["tzolkin_name"] == first["tzolkin_name"])]
+
+        np.testing.assert_array_equal(np.diff(matches["rd"]), 18980)
@@ -1,6 +1,8 @@
 import unittest
 
+from calendars.gregorian_date import GregorianDate
 from calendars.mayan_haab_date import MayanHaabDate
+from calendars.mayan_tzolkin_date import MayanTzolkinDate
 
 
 class TestMayanHaabDate(unittest.TestCase):
@@ -13,12 +15,36 @@ class TestMayanHaabDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            mayan = MayanHaabDate()
-            mayan.from_moment(rd)
+            mayan = MayanHaabDate.from_rd(rd)
 
             self.assertEqual(mayan.month, data[rd].month)
             self.assertEqual(mayan.day, data[rd].day)
 
+    def test_calendar_round_dates_have_no_rd(self):
+        haab = MayanHaabDate.from_rd(710347)
+        tzolkin = MayanTzolkinDate.from_rd(710347)
+
+        for date in [haab, tzolkin]:
+            with self.assertRaisesRegex(TypeError, "no RD value"):
+                date.add_days(1)
+            with self.assertRaisesRegex(TypeError, "no RD value"):
+                date - GregorianDate(2000, 1, 1)
+            with self.assertRaises(TypeError):
+                date < GregorianDate(2000, 1, 1)
+            with self.assertRaises(TypeError):
+                GregorianDate(2000, 1, 1) >= date
+
+        with self.assertRaises(TypeError):
+            sorted([haab, MayanHaabDate.from_rd(710348)])
+
+    def test_moments_to_mayan_haab_dates(self):
+        data = self.prepare_data()
+
+        months, days = MayanHaabDate.from_moments(list(data.keys()))
+
+        for i, rd in enumerate(data):
+            self.assertEqual((data[rd].month, data[rd].day), (months[i], days[i]))
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from calendars.mayan_long_count import MayanLongCountDate
 
 
@@ -20,8 +22,7 @@ class TestMayanLongCountDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            mayan = MayanLongCountDate()
-            mayan.from_moment(rd)
+            mayan = MayanLongCountDate.from_rd(rd)
 
             self.assertEqual(mayan.baktun, data[rd].baktun)
             self.assertEqual(mayan.katun, data[rd].katun)
@@ -29,6 +30,27 @@ class TestMayanLongCountDate(unittest.TestCase):
             self.assertEqual(mayan.uinal, data[rd].uinal)
             self.assertEqual(mayan.kin, data[rd].kin)
 
+    def test_mayan_long_count_dates_to_moments(self):
+        data = self.prepare_data()
+
+        rds = np.array(list(data.keys()))
+        places = [[getattr(data[rd], place) for rd in data] for place in ["baktun", "katun", "tun", "uinal", "kin"]]
+
+        np.testing.assert_array_equal(MayanLongCountDate.to_moments(*places), rds)
+
+    def test_moments_to_mayan_long_count_dates(self):
+        data = self.prepare_data()
+
+        rds = np.array(list(data.keys()))
+        baktun, katun, tun, uinal, kin = MayanLongCountDate.from_moments(rds)
+
+        for i, rd in enumerate(data):
+            self.assertEqual((data[rd].baktun, data[rd].katun, data[rd].tun, data[rd].uinal, data[rd].kin),
+                             (baktun[i], katun[i], tun[i], uinal[i], kin[i]))
+
+        rds = np.arange(-3000000, 3000000, 7)
+        np.testing.assert_array_equal(MayanLongCountDate.to_moments(*MayanLongCountDate.from_moments(rds)), rds)
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
@@ -12,12 +12,19 @@ class TestMayanHaabDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            mayan = MayanTzolkinDate()
-            mayan.from_moment(rd)
+            mayan = MayanTzolkinDate.from_rd(rd)
 
             self.assertEqual(mayan.number, data[rd].number)
             self.assertEqual(mayan.name, data[rd].name)
 
+    def test_moments_to_mayan_tzolkin_dates(self):
+        data = self.prepare_data()
+
+        numbers, names = MayanTzolkinDate.from_moments(list(data.keys()))
+
+        for i, rd in enumerate(data):
+            self.assertEqual((data[rd].number, data[rd].name), (numbers[i], names[i]))
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import location
+import moon
+import times
+
+
+class TestMoon(unittest.TestCase):
+    """
+    Tests for the positions of the moon, new moons and the store of first crescents.
+    """
+    def test_lunar_position(self):
+        """
+        Meeus example 47.a: 1992-04-12 at 0h dynamical time.
+        """
+        t = 727300.0 - times.ephemeris_corrections(727300.0)
+
+        self.assertAlmostEqual(float(moon.lunar_longitudes(t)), 133.167265, 3)
+        self.assertAlmostEqual(float(moon.lunar_latitudes(t)), -3.229126, 5)
+
+    def test_new_moons(self):
+        # Meeus example 49.a: the new moon of 1977-02-18 at 3:37:42 dynamical time.
+        t = 2443192.65118 - 1721424.5
+        n = moon.lunations(t)
+        new_moon = moon.new_moons(n)
+
+        self.assertLess(abs(new_moon + times.ephemeris_corrections(new_moon) - t) * 86400, 30)
+
+        # Consecutive lunations.
+        moments = moon.new_moons(np.arange(-20000, 20000, 37))
+        np.testing.assert_allclose(np.mod(moon.lunar_phases(moments) + 180, 360) - 180, 0, atol=1e-4)
+        np.testing.assert_array_equal(moon.lunations(moments + 0.01), np.arange(-20000, 20000, 37))
+
+    def test_first_crescents(self):
+        moon.set_crescent_store(None)
+
+        try:
+            lunations = np.arange(-30, 30)
+            starts = moon.first_crescents(lunations, location.CAIRO)
+            new_moons = moon.new_moons(lunations)
+
+            self.assertTrue(np.all(moon.visible_crescents(starts, location.CAIRO)))
+            self.assertFalse(np.any(moon.visible_crescents(starts - 1, location.CAIRO)))
+            self.assertTrue(np.all((new_moons < starts) & (starts < new_moons + 5)))
+
+            n, first_day = moon.lunar_months(np.arange(starts[0], starts[-1]), location.CAIRO)
+            np.testing.assert_array_equal(np.unique(n), lunations[:-1])
+            np.testing.assert_array_equal(np.unique(first_day), starts[:-1])
+        finally:
+            moon.set_crescent_store()
+
+    def test_crescent_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "crescents.json")
+
+            try:
+                moon.set_crescent_store(path)
+                starts = moon.first_crescents(np.arange(100, 110), location.HAIFA)
+
+                with open(path, encoding="utf-8") as file:
+                    self.assertEqual(sum(len(crescents) for crescents in json.load(file).values()), 10)
+
+                # Another process reads the store: no visibility is computed again.
+                moon.set_crescent_store(path)
+                visible_crescents, moon.visible_crescents = moon.visible_crescents, None
+
+                try:
+                    np.testing.assert_array_equal(moon.first_crescents(np.arange(109, 99, -1), location.HAIFA),
+                                                  starts[::-1])
+                finally:
+                    moon.visible_crescents = visible_crescents
+            finally:
+                moon.set_crescent_store()
+
+    def test_shared_crescent_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "crescents.json")
+
+            try:
+                moon.set_crescent_store(path)
+                moon.first_crescents(np.arange(100, 105), location.HAIFA)
+
+                # Another process adds crescents to the file after this one loaded it: they are kept.
+                with open(path, encoding="utf-8") as file:
+                    other = json.load(file)
+
+                other["other"] = {"1": 730000}
+
+                with open(path, "w", encoding="utf-8") as file:
+                    json.dump(other, file)
+
+                moon.first_crescents(np.arange(105, 110), location.HAIFA)
+
+                with open(path, encoding="utf-8") as file:
+                    crescents = json.load(file)
+
+                self.assertEqual(crescents["other"], {"1": 730000})
+                self.assertEqual(sum(len(days) for key, days in crescents.items() if key != "other"), 10)
+                self.assertEqual(sorted(os.listdir(directory)), ["crescents.json", "crescents.json.lock"])
+            finally:
+                moon.set_crescent_store()
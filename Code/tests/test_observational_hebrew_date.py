@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+
+import moon
+import times
+import tools
+from calendars.gregorian_date import GregorianDate
+from calendars.observational_hebrew_date import ObservationalHebrewDate
+
+
+class TestObservationalHebrewDate(unittest.TestCase):
+    """
+    Tests for the observational Hebrew calendar.
+    """
+    @classmethod
+    def setUpClass(cls):
+        moon.set_crescent_store(None)
+
+    @classmethod
+    def tearDownClass(cls):
+        moon.set_crescent_store()
+
+    def test_nisan(self):
+        """
+        The 15th of Nisan is the first 15th of a month on or after the day of the vernal equinox (or the day before,
+        for an equinox after sunset).
+        """
+        g_years = np.arange(1990, 2030)
+        new_years = tools.gregorian_new_years(g_years)
+        equinoxes = np.floor(times.solar_longitude_after(times.SPRING, new_years + 68, new_years + 89))
+        passovers = ObservationalHebrewDate.to_moments(g_years + 3760, 1, 15)
+
+        self.assertTrue(np.all((equinoxes - 1 <= passovers) & (passovers < equinoxes + 30)))
+
+        # In 2024, a month before the arithmetic calendar, which intercalated Adar II.
+        self.assertEqual(ObservationalHebrewDate.from_rd(GregorianDate(2024, 3, 12).to_moment()),
+                         ObservationalHebrewDate(5784, 1, 1))
+
+    def test_observational_hebrew_bulk_conversion(self):
+        rds = np.arange(GregorianDate(1950, 1, 1).to_moment(), GregorianDate(2050, 1, 1).to_moment())
+        years, months, days = ObservationalHebrewDate.from_moments(rds)
+
+        np.testing.assert_array_equal(ObservationalHebrewDate.to_moments(years, months, days), rds)
+        self.assertTrue(np.all((1 <= months) & (months <= 13)))
+
+        # The years change on the 1st of Tishri.
+        changes = np.flatnonzero(np.diff(years)) + 1
+        self.assertTrue(np.all((months[changes] == 7) & (days[changes] == 1)))
+
+        for i in range(0, len(rds), 1009):
+            date = ObservationalHebrewDate.from_rd(int(rds[i]))
+
+            self.assertEqual((date.year, date.month, date.day), (years[i], months[i], days[i]))
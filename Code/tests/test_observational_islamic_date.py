@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+import moon
+from calendars.gregorian_date import GregorianDate
+from calendars.islamic_date import IslamicDate
+from calendars.observational_islamic_date import ObservationalIslamicDate
+
+# Months whose crescent was widely seen on the evening before their first day (Gregorian).
+MONTH_STARTS = [((1444, 9), (2023, 3, 23)), ((1445, 10), (2024, 4, 10))]
+
+
+class TestObservationalIslamicDate(unittest.TestCase):
+    """
+    Tests for the observational Islamic calendar.
+    """
+    @classmethod
+    def setUpClass(cls):
+        moon.set_crescent_store(None)
+
+    @classmethod
+    def tearDownClass(cls):
+        moon.set_crescent_store()
+
+    def test_month_starts(self):
+        for (year, month), gregorian in MONTH_STARTS:
+            rd = GregorianDate(*gregorian).to_moment()
+
+            self.assertEqual(ObservationalIslamicDate(year, month, 1).to_moment(), rd)
+            self.assertEqual(ObservationalIslamicDate.from_rd(rd), ObservationalIslamicDate(year, month, 1))
+            self.assertEqual(ObservationalIslamicDate.from_rd(rd - 1).month, month - 1)
+
+    def test_observational_islamic_bulk_conversion(self):
+        rds = np.arange(GregorianDate(1950, 1, 1).to_moment(), GregorianDate(2050, 1, 1).to_moment())
+        years, months, days = ObservationalIslamicDate.from_moments(rds)
+
+        np.testing.assert_array_equal(ObservationalIslamicDate.to_moments(years, months, days), rds)
+
+        # Months of 29 or 30 days (rarely 31, when the crescent is missed on the 30th evening),
+        # within two days of the arithmetic calendar.
+        lengths = np.diff(rds[days == 1])
+        self.assertTrue(np.all((29 <= lengths) & (lengths <= 31)))
+        self.assertLessEqual(np.max(np.abs(IslamicDate.to_moments(years, months, days) - rds)), 2)
+
+        for i in range(0, len(rds), 1009):
+            date = ObservationalIslamicDate.from_rd(int(rds[i]))
+
+            self.assertEqual((date.year, date.month, date.day), (years[i], months[i], days[i]))
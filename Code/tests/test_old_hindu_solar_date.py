@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from calendars.old_hindu_solar_date import OldHinduSolarDate
 
 
@@ -20,13 +22,38 @@ class TestOldHinduSolarDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            hindu = OldHinduSolarDate()
-            hindu.from_moment(rd)
+            hindu = OldHinduSolarDate.from_rd(rd)
 
             self.assertEqual(hindu.year, data[rd].year)
             self.assertEqual(hindu.month, data[rd].month)
             self.assertEqual(hindu.day, data[rd].day)
 
+    def test_old_hindu_solar_dates_to_moments(self):
+        data = self.prepare_data()
+
+        rds = np.array(list(data.keys()))
+        years = [data[rd].year for rd in data]
+        months = [data[rd].month for rd in data]
+        days = [data[rd].day for rd in data]
+
+        np.testing.assert_array_equal(OldHinduSolarDate.to_moments(years, months, days), rds)
+
+    def test_moments_to_old_hindu_solar_dates(self):
+        """
+        Randomized cross-check of the exact bulk conversion against the scalar implementation.
+        """
+        rng = np.random.default_rng(9)
+        rds = np.concatenate([rng.integers(-2000000, 2000000, 5000), rng.integers(-10 ** 8, 10 ** 8, 5000)])
+        years, months, days = OldHinduSolarDate.from_moments(rds)
+
+        for i in range(len(rds)):
+            hindu = OldHinduSolarDate.from_rd(int(rds[i]))
+
+            self.assertEqual((hindu.year, hindu.month, hindu.day), (years[i], months[i], days[i]))
+            self.assertEqual(OldHinduSolarDate(hindu.year, hindu.month, hindu.day).to_moment(), rds[i])
+
+        np.testing.assert_array_equal(OldHinduSolarDate.to_moments(years, months, days), rds)
+
     def prepare_data(self):
         """
         Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
@@ -0,0 +1,67 @@
+import importlib.util
+import unittest
+
+import numpy as np
+
+import tools
+from calendars.hebrew_date import HebrewDate
+from calendars.old_hindu_lunar_date import OldHinduLunarDate
+
+PANDAS = importlib.util.find_spec("pandas") is not None
+
+if PANDAS:
+    import pandas as pd
+    import pandas_accessor  # noqa: F401 (registers the accessor)
+
+
+@unittest.skipUnless(PANDAS, "pandas is not installed")
+class TestPandasAccessor(unittest.TestCase):
+    """
+    Tests for the .diebus accessor of pandas Series.
+    """
+    def setUp(self):
+        self.data = pd.read_csv("../data/gregorian.csv")
+
+    def test_rd_series_to_calendar(self):
+        rds = self.data["Rd"]
+        hebrew = rds.diebus.to("hebrew")
+
+        self.assertEqual(list(hebrew.columns), ["year", "month", "day"])
+        for rd, row in zip(rds, hebrew.itertuples(index=False)):
+            self.assertEqual(HebrewDate(*row), HebrewDate.from_rd(rd))
+
+        gregorian = rds.diebus.to("gregorian")
+        np.testing.assert_array_equal(gregorian.to_numpy(), self.data[["Year", "Month", "Day"]].to_numpy())
+
+    def test_datetime_series(self):
+        data = self.data[self.data["Year"] > 1700]
+        dates = pd.to_datetime(data[["Year", "Month", "Day"]].set_axis(["year", "month", "day"], axis=1))
+        dates += pd.Timedelta(hours=23)
+
+        np.testing.assert_array_equal(dates.diebus.rd, data["Rd"])
+        np.testing.assert_array_equal(dates.dt.tz_localize("America/New_York").diebus.rd, data["Rd"])
+        np.testing.assert_array_equal(dates.diebus.field("month"), data["Month"])
+
+    def test_aware_datetimes(self):
+        # The accessor and tools.datetime_to_moment agree on the day of an aware instant: its local day.
+        dates = pd.Series(pd.to_datetime(["2000-01-01 18:00", "2024-02-28 23:30"])).dt.tz_localize("America/Chicago")
+        moments = [tools.datetime_to_moment(value.to_pydatetime()) for value in dates]
+
+        np.testing.assert_array_equal(dates.diebus.rd, np.floor(moments))
+        np.testing.assert_array_equal(dates.diebus.rd, [730120, 738944])
+
+    def test_field_and_missing_values(self):
+        rds = pd.Series([710000.5, np.nan, 720000.0])
+        leap = rds.diebus.field("old_hindu_lunar.is_leap_month")
+
+        self.assertEqual(leap.name, "old_hindu_lunar.is_leap_month")
+        self.assertEqual(leap.dtype, "boolean")
+        self.assertTrue(pd.isna(leap[1]))
+        self.assertEqual(leap[0], OldHinduLunarDate.from_rd(710000).is_leap_month)
+        self.assertEqual(list(rds.diebus.rd.dropna()), [710000, 720000])
+
+        with self.assertRaises(ValueError):
+            rds.diebus.field("weekday", "hebrew")
+
+        with self.assertRaises(AttributeError):
+            pd.Series(["a"]).diebus
@@ -0,0 +1,59 @@
+import dataclasses
+import unittest
+
+import numpy as np
+
+import astro
+import location
+import prayer_times
+import times
+from calendars.gregorian_date import GregorianDate
+from location import Location
+
+# Makkah in Saudi Arabia standard time (UTC+3).
+MAKKAH = Location("Makkah", 21.42664, 39.82563, 0, 3)
+
+# Umm al-Qura timetable of Makkah for 2024-06-21, in minutes after midnight.
+MAKKAH_TIMETABLE = {"fajr": 4 * 60 + 11, "sunrise": 5 * 60 + 39, "dhuhr": 12 * 60 + 22, "asr": 15 * 60 + 42,
+                    "maghrib": 19 * 60 + 6, "isha": 20 * 60 + 36}
+
+
+class TestPrayerTimes(unittest.TestCase):
+    """
+    Tests for the prayer times.
+    """
+    def test_makkah(self):
+        rd = GregorianDate(2024, 6, 21).to_moment()
+        row = prayer_times.prayer_times([rd], MAKKAH, prayer_times.UMM_AL_QURA)[0]
+
+        for prayer, minutes in MAKKAH_TIMETABLE.items():
+            self.assertAlmostEqual((row[prayer] - rd) * 24 * 60, minutes, delta=1, msg=prayer)
+
+    def test_prayer_times(self):
+        start = GregorianDate(2024, 1, 1).to_moment()
+        days = np.arange(start, start + 366)
+        locations = [location.URBANA, location.MECCA, location.PARIS]
+
+        table = prayer_times.prayer_times(days, locations, prayer_times.ISNA, iterations=2)
+        self.assertEqual(table.shape, (len(locations), len(days)))
+
+        for j, place in enumerate(locations):
+            np.testing.assert_array_equal(table["rd"][j], days)
+
+            for i in range(0, len(days), 30):
+                self.assertAlmostEqual(table["maghrib"][j, i], astro.sunset(int(days[i]), place), delta=2 / 86400)
+                self.assertAlmostEqual(table["dhuhr"][j, i], times.midday(int(days[i]), place), delta=1 / 86400)
+
+            columns = np.column_stack([table[prayer][j] for prayer in prayer_times.PRAYERS])
+            self.assertTrue(np.all(np.diff(columns, axis=1) > 0))
+
+        hanafi = prayer_times.prayer_times(days, locations, dataclasses.replace(prayer_times.ISNA, asr_shadow=2))
+        self.assertTrue(np.all(hanafi["asr"] > table["asr"]))
+
+    def test_high_latitude(self):
+        start = GregorianDate(2024, 6, 1).to_moment()
+        table = prayer_times.prayer_times(np.arange(start, start + 30), Location("Oslo", 59.91, 10.75, 0, 1))
+
+        # In June, the sun does not go 18 degrees below the horizon in Oslo: no Fajr nor Isha.
+        self.assertTrue(np.all(np.isnan(table["fajr"])) and np.all(np.isnan(table["isha"])))
+        self.assertFalse(np.any(np.isnan(table["maghrib"])))
@@ -20,8 +20,7 @@ class TestRomanDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            roman = RomanDate()
-            roman.from_moment(rd)
+            roman = RomanDate.from_rd(rd)
 
             print(roman, data[rd])
             self.assertEqual(roman.year, data[rd].year)
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import times
+from solar_longitude_table import SolarLongitudeTable
+
+
+class TestSolarLongitudeTable(unittest.TestCase):
+    """
+    Tests for the Chebyshev backend of the solar longitude.
+    """
+    def test_table_error(self):
+        table = SolarLongitudeTable.build(1900, 2100)
+        t = np.random.default_rng(0).uniform(table.start, table.start + 200 * 365, 100000)
+
+        np.testing.assert_allclose(table.evaluate(t), times.solar_longitudes_at_centuries((t - times.J2000) / 36525),
+                                   rtol=0, atol=1e-8)
+
+        # Outside the table, the series.
+        outside = np.array([table.start - 1000.5, table.start + 1e6])
+        np.testing.assert_array_equal(table.evaluate(outside),
+                                      times.solar_longitudes_at_centuries((outside - times.J2000) / 36525))
+
+    def test_backend(self):
+        t = np.linspace(693596, 766645, 5000)
+        series = times.solar_longitudes(t)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.npy")
+            SolarLongitudeTable.build(1900, 2100).save(path)
+
+            try:
+                times.set_solar_longitude_backend("chebyshev", path)
+                table = times.solar_longitudes(t)
+                equinox = times.solar_longitude_after(times.SPRING, [738965.0], [738975.0])
+            finally:
+                times.set_solar_longitude_backend("series")
+
+        np.testing.assert_allclose(np.mod(table - series + 180, 360) - 180, 0, rtol=0, atol=1e-8)
+        np.testing.assert_allclose(equinox, times.solar_longitude_after(times.SPRING, [738965.0], [738975.0]),
+                                   rtol=0, atol=1e-6)
+
+        with self.assertRaises(ValueError):
+            times.set_solar_longitude_backend("tables")
@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from calendars.armenian_date import ArmenianDate
+from calendars.coptic_date import CopticDate
+from calendars.egyptian_date import EgyptianDate
+from calendars.ethiopic_date import EthiopicDate
+from calendars.zoroastrian_date import ZoroastrianDate
+
+CALENDARS = {
+    "armenian": ArmenianDate,
+    "coptic": CopticDate,
+    "egyptian": EgyptianDate,
+    "ethiopic": EthiopicDate,
+    "zoroastrian": ZoroastrianDate
+}
+
+
+class TestThirtyDayMonthDate(unittest.TestCase):
+    """
+    Tests for the bulk conversion of the calendars sharing the 30-day month engine.
+    """
+    def test_thirty_day_month_dates_to_moments(self):
+        for name in ["armenian", "coptic", "egyptian", "ethiopic"]:
+            rds, years, months, days = self.prepare_data(name)
+
+            np.testing.assert_array_equal(CALENDARS[name].to_moments(years, months, days), rds)
+
+    def test_moments_to_thirty_day_month_dates(self):
+        rds = np.arange(-1000000, 1000000, 7)
+
+        for calendar in CALENDARS.values():
+            years, months, days = calendar.from_moments(rds)
+
+            for i in range(0, len(rds), 101):
+                date = calendar.from_rd(int(rds[i]))
+
+                self.assertEqual((date.year, date.month, date.day), (years[i], months[i], days[i]))
+
+            np.testing.assert_array_equal(calendar.to_moments(years, months, days), rds)
+
+    def prepare_data(self, name: str):
+        """
+        Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
+        :param name: The name of the calendar's data file.
+        :return: Arrays of the sample RD values and the corresponding years, months and days.
+        """
+        file_name = f"../data/{name}.csv"
+        with open(file_name, "r") as file:
+            lines = file.read().split()
+
+        data = np.array([[int(cell) for cell in line.split(',')] for line in lines[1:]])
+
+        return data[:, 0], data[:, 1], data[:, 2], data[:, 3]
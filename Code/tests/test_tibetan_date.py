@@ -0,0 +1,75 @@
+import unittest
+
+import numpy as np
+
+from calendars.gregorian_date import GregorianDate
+from calendars.tibetan_date import TibetanDate
+
+# Gregorian dates of Losar (the Tibetan new year, 1st day of the 1st month) in the Phugpa calendar.
+LOSARS = [(2020, 2, 24), (2021, 2, 12), (2022, 3, 3), (2023, 2, 21), (2024, 2, 10)]
+
+
+class TestTibetanDate(unittest.TestCase):
+    """
+    Tests for the Tibetan calendar.
+    """
+    def test_losar(self):
+        for g_year, g_month, g_day in LOSARS:
+            rd = GregorianDate(g_year, g_month, g_day).to_moment()
+            date = TibetanDate(g_year + 127, 1, False, 1, False)
+
+            self.assertFalse(TibetanDate.is_leap_month(g_year + 127, 1))
+            self.assertEqual(date.to_moment(), rd)
+            self.assertEqual(TibetanDate.from_rd(rd), date)
+
+    def test_tibetan_bulk_conversion(self):
+        """
+        The table lookups agree with the searches of RDU (21.5), leap and skipped days included.
+        """
+        rds = np.arange(-200000, 900000, 7)
+        fields = TibetanDate.from_moments(rds)
+
+        np.testing.assert_array_equal(TibetanDate.to_moments(*fields), rds)
+
+        for i in range(0, len(rds), 211):
+            date = TibetanDate.from_rd(int(rds[i]))
+
+            self.assertEqual((date.year, date.month, date.leap_month, date.day, date.leap_day),
+                             tuple(field[i] for field in fields))
+            self.assertEqual(date.to_moment(), rds[i])
+
+        years, months, leap_months, days, leap_days = TibetanDate.from_moments(np.arange(700000, 701000))
+
+        self.assertTrue(np.any(leap_days))
+        self.assertTrue(np.any(np.diff(days) == 2))
+
+    def test_tibetan_far_conversion(self):
+        """
+        Far-apart days are converted around each of them, without a table covering the lunar days between them.
+        """
+        rds = np.concatenate([np.arange(-10 ** 9, -10 ** 9 + 40), np.arange(738000, 738040),
+                              np.arange(10 ** 9, 10 ** 9 + 40)])
+        fields = TibetanDate.from_moments(rds)
+
+        np.testing.assert_array_equal(TibetanDate.to_moments(*fields), rds)
+        self.assertLessEqual(len(TibetanDate._table), TibetanDate.TABLE_TITHIS[1] - TibetanDate.TABLE_TITHIS[0])
+
+        for i in range(0, len(rds), 7):
+            date = TibetanDate.from_rd(int(rds[i]))
+
+            self.assertEqual((date.year, date.month, date.leap_month, date.day, date.leap_day),
+                             tuple(field[i] for field in fields))
+
+    def test_leap_months(self):
+        years = np.repeat(np.arange(1800, 2300), 12)
+        months = np.tile(np.arange(1, 13), 500)
+        leap = TibetanDate.is_leap_month(years, months)
+
+        # 7 leap months in 19 years, at most one a year.
+        self.assertTrue(np.all(np.add.reduceat(leap, np.arange(0, len(leap), 12)) <= 1))
+        self.assertAlmostEqual(leap.sum() / 500, 7 / 19, 2)
+
+        for year, month in zip(years[leap], months[leap]):
+            date = TibetanDate.from_rd(TibetanDate(int(year), int(month), True, 15, False).to_moment())
+            self.assertTrue(date.leap_month)
+            self.assertEqual((date.year, date.month), (year, month))
@@ -0,0 +1,93 @@
+import unittest
+
+import numpy as np
+
+import location
+import times
+
+
+class TestTimes(unittest.TestCase):
+    """
+    Tests for the vectorized calculations of times.
+    """
+    def test_ephemeris_corrections(self):
+        t = np.random.default_rng(0).uniform(-1000000, 1000000, 2000)
+
+        np.testing.assert_array_equal(times.ephemeris_corrections(t), [times.ephemeris_correction(x) for x in t])
+        np.testing.assert_array_equal(times.ephemeris_corrections(t[:10].reshape(2, 5)),
+                                      times.ephemeris_corrections(t[:10]).reshape(2, 5))
+
+        # Moments which are not finite, and far outside the years of the table.
+        t = np.array([730000.0, np.nan, np.inf, -np.inf, 1e12, -1e12, 1e15])
+        corrections = times.ephemeris_corrections(t)
+
+        np.testing.assert_array_equal(np.isnan(corrections), [False, True, True, True, False, False, False])
+        np.testing.assert_array_equal(corrections[[0, 4, 5, 6]],
+                                      [times.ephemeris_correction(x) for x in t[[0, 4, 5, 6]]])
+        self.assertTrue(np.isnan(times.solar_longitudes(np.array([730000.0, np.nan]))[1]))
+
+    def test_sidereal_times(self):
+        # Every minute of a night, at three sites.
+        t = 738900.8 + np.arange(12 * 60) / 1440
+        longitudes = location.location_arrays([location.URBANA, location.MECCA, location.PARIS])[1]
+
+        sidereal = times.sidereal_times(t)
+        local = times.local_sidereal_times(t[:, np.newaxis], longitudes)
+        self.assertEqual(local.shape, (len(t), 3))
+
+        for i in range(0, len(t), 37):
+            self.assertAlmostEqual(sidereal[i], times.solar_to_sidereal(t[i]), places=8)
+
+            for j, longitude in enumerate(longitudes):
+                difference = np.mod(local[i, j] - times.solar_to_sidereal(t[i]) - longitude + 180, 360) - 180
+                self.assertAlmostEqual(difference, 0, places=8)
+
+        # Meeus, Astronomical Algorithms, example 12.a: 1987-04-10 0h UT, 13h 10m 46.3668s.
+        self.assertAlmostEqual(times.sidereal_times([725471.0])[0], 197.693195, places=6)
+
+        # A sidereal day is shorter than a solar day by about 3 min 56 s.
+        self.assertAlmostEqual(np.mod(times.sidereal_times(t[0] + 1) - sidereal[0], 360) / 360 * 86400, 236.6, 0)
+
+    def test_solar_state(self):
+        t = np.linspace(600000.25, 800000.25, 101)
+        state = times.SolarState.at(t)
+
+        for i in range(0, len(t), 10):
+            moment = t[i]
+            self.assertAlmostEqual(state.c[i], times.julian_centuries(moment), places=14)
+            self.assertAlmostEqual(state.longitude[i], times.solar_longitude(moment), places=9)
+            self.assertAlmostEqual(state.obliquity[i], times.obliquity(moment), places=12)
+            self.assertAlmostEqual(state.nutation[i], times.nutation(moment), places=12)
+            self.assertAlmostEqual(state.aberration[i], times.aberration(moment), places=12)
+            self.assertAlmostEqual(state.equation_of_time[i], times.equation_of_time(moment), places=12)
+
+        # Scalars for a scalar moment; the sun is on the equator at the equinoxes, at the tropics at the solstices.
+        equinox = float(times.solar_longitude_after(times.SPRING, [738965.0], [738975.0])[0])
+        self.assertAlmostEqual(times.SolarState.at(equinox).declination, 0, places=6)
+        self.assertIsInstance(times.SolarState.at(equinox).longitude, float)
+
+        solstice = float(times.solar_longitude_after(times.SUMMER, [739050.0], [739065.0])[0])
+        state = times.SolarState.at(solstice)
+        self.assertAlmostEqual(state.declination, state.obliquity, places=6)
+
+    def test_declinations_and_right_ascensions(self):
+        t = np.linspace(700000.5, 760000.5, 41)
+        beta = np.array([-60.0, -5.0, 0.0, 10.0, 45.0])
+        lambda1 = np.array([0.0, 100.0, 200.0, 275.0, 359.0])
+
+        declinations = times.declinations(t[:, np.newaxis], beta, lambda1)
+        right_ascensions = times.right_ascensions(t[:, np.newaxis], beta, lambda1)
+        self.assertEqual(declinations.shape, (len(t), len(beta)))
+
+        for i in range(len(t)):
+            for j in range(len(beta)):
+                self.assertAlmostEqual(declinations[i, j], times.declination(t[i], beta[j], lambda1[j]), places=10)
+                self.assertAlmostEqual(right_ascensions[i, j], times.right_ascension(t[i], beta[j], lambda1[j]),
+                                       places=10)
+
+        # On the ecliptic, at the solstice points: the declination is the obliquity, the right ascension 90°.
+        obliquity = times.obliquities(t)
+        np.testing.assert_allclose(times.declinations(t, 0, 90), obliquity, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(times.right_ascensions(t, 0, 90), 90, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(times.SolarState.at(t).right_ascension,
+                                   times.right_ascensions(t, 0, times.solar_longitudes(t)), rtol=0, atol=1e-12)
@@ -0,0 +1,97 @@
+import datetime
+import unittest
+
+import numpy as np
+
+import tools
+from calendars.hebrew_date import HebrewDate
+
+
+class TestTools(unittest.TestCase):
+    """
+    Tests for the datetime interop helpers of tools.
+    """
+    def test_datetime64_to_moments(self):
+        rds, years, months, days = self.prepare_data()
+        dates = np.array([f"{y:04d}-{m:02d}-{d:02d}" for y, m, d in zip(years, months, days) if y > 0],
+                         dtype="datetime64[D]")
+        rds = rds[years > 0]
+
+        for unit, offset in [("D", 0), ("s", 0.75), ("ms", 0.125), ("ns", 0.5)]:
+            # datetime64[ns] holds the years 1678 to 2261 only.
+            in_range = (dates >= np.datetime64("1700-01-01")) if unit == "ns" else np.full(dates.shape, True)
+            values = dates[in_range].astype(f"datetime64[{unit}]") + np.timedelta64(int(offset * 86400), "s")
+            expected = rds[in_range] + offset
+
+            np.testing.assert_array_equal(tools.datetime64_to_moments(values), expected)
+            np.testing.assert_array_equal(tools.moments_to_datetime64(expected, unit), values)
+            np.testing.assert_array_equal(tools.to_rata_die_array(values), np.floor(expected))
+
+        self.assertTrue(np.isnan(tools.datetime64_to_moments(np.array(["NaT"], dtype="datetime64[s]"))[0]))
+        self.assertTrue(np.isnat(tools.moments_to_datetime64([np.nan])[0]))
+
+    def test_bulk_conversion_of_datetime64(self):
+        values = np.array(["1945-09-01T22:00", "2024-02-29T00:00"], dtype="datetime64[s]")
+        years, months, days = HebrewDate.from_moments(values)
+
+        for i, value in enumerate(values):
+            date = HebrewDate.from_rd(tools.datetime_to_moment(value.item()))
+            self.assertEqual((date.year, date.month, date.day), (years[i], months[i], days[i]))
+
+    def test_datetime_to_moment(self):
+        rds, years, months, days = self.prepare_data()
+
+        for rd, year, month, day in zip(rds, years, months, days):
+            if year > 0:
+                self.assertEqual(tools.datetime_to_moment(datetime.date(year, month, day)), rd)
+                self.assertEqual(tools.moment_to_datetime(rd + 0.25), datetime.datetime(year, month, day, 6))
+
+        moment = tools.datetime_to_moment(datetime.datetime(2000, 1, 1, 18, tzinfo=datetime.timezone(
+            datetime.timedelta(hours=-6))))
+        self.assertEqual(moment, tools.datetime_data_to_moment([2000, 1, 1, 18, 0, 0]))
+
+    def test_julian_day_numbers(self):
+        data = np.loadtxt("../data/rd.csv", delimiter="\t", skiprows=1)
+        rds, jds, mjds = data[:, 0], data[:, 1], data[:, 2]
+
+        for rd, jd, mjd in zip(rds, jds, mjds):
+            self.assertEqual(tools.moment_from_jd(jd), rd)
+            self.assertEqual(tools.jd_from_moment(rd), jd)
+            self.assertEqual(tools.moment_from_mjd(mjd), rd)
+            self.assertEqual(tools.mjd_from_moment(rd), mjd)
+
+        np.testing.assert_array_equal(tools.moment_from_jd(jds), rds)
+        np.testing.assert_array_equal(tools.mjd_from_moment(rds), mjds)
+
+    def test_two_part_julian_day_numbers(self):
+        data = np.loadtxt("../data/rd.csv", delimiter="\t", skiprows=1)
+        rds, jds, mjds = data[:, 0].astype(np.int64), data[:, 1], data[:, 2]
+
+        # A microsecond after midnight: lost in a single float JD, kept in the two-part form.
+        microsecond = 1 / 86400000000
+        days, fractions = tools.rd_pair_from_jd(jds, microsecond)
+        np.testing.assert_array_equal(days, rds)
+        np.testing.assert_allclose(fractions, microsecond, rtol=0, atol=1e-15)
+        self.assertNotEqual(tools.moment_from_jd(jds[-1] + microsecond) - rds[-1], microsecond)
+
+        days, fractions = tools.rd_pair_from_jd(jds - 0.5, 0.25)
+        np.testing.assert_array_equal(days, rds - 1)
+        np.testing.assert_array_equal(fractions, 0.75)
+
+        days, fractions = tools.rd_pair_from_mjd(mjds, 0.25)
+        np.testing.assert_array_equal(days, rds)
+        np.testing.assert_array_equal(fractions, 0.25)
+
+        for (part1, part2), expected in [(tools.jd_from_rd_pair(rds, 0.25), jds),
+                                         (tools.mjd_from_rd_pair(rds, 0.25), mjds)]:
+            np.testing.assert_array_equal(part1, expected)
+            np.testing.assert_array_equal(part2, np.full(rds.shape, 0.25))
+
+    def prepare_data(self):
+        """
+        Test data correspond to Sample Data in Appendix C of RDM (p. 396-400).
+        :return: Arrays of the sample RD values and the corresponding Gregorian years, months and days.
+        """
+        data = np.loadtxt("../data/gregorian.csv", delimiter=",", skiprows=1, dtype=np.int64)
+
+        return data[:, 0], data[:, 1], data[:, 2], data[:, 3]
@@ -17,8 +17,7 @@ class TestWesternBahaiDate(unittest.TestCase):
         data = self.prepare_data()
 
         for rd in data:
-            wbd = WesternBahaiDate()
-            wbd.from_moment(rd)
+            wbd = WesternBahaiDate.from_rd(rd)
 
             self.assertEqual(wbd.major, data[rd].major)
             self.assertEqual(wbd.cycle, data[rd].cycle)
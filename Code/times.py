@@ -1,11 +1,12 @@
 import math
+from dataclasses import dataclass
 
 import numpy as np
 
 import tools
 from calendars.gregorian_date import GregorianDate
-from location import Location
-from numpy.polynomial.polynomial import Polynomial
+from location import Location, location_arrays
+from numpy.polynomial.polynomial import Polynomial, polyval
 from tools import sind, cosd
 
 J2000 = 730120.5    # Noon on 2000-01-01 (Gregorian): RDU (14.18)
@@ -32,7 +33,7 @@ OBLIQUITY = [23.43929111111111, -0.013004167, -1.638e-07, 5.03611e-07]
 ET_LONGITUDE = [280.46645, 36000.76983, 0.0003032]
 ET_ANOMALY = [357.52910, 35999.05030, -0.0001559, -0.00000048]
 ET_ECCENTRICITY = [0.016708617, -0.000042037, -0.0000001236]
-SIDEREAL = [280.46061837, 1308572.97170280125, 0.000387933, -2.5833118057349522087315939033841e-8]
+SIDEREAL = [280.46061837, 36525 * 360.98564736629, 0.000387933, -2.5833118057349522087315939033841e-8]
 
 MEAN_TROPICAL_YEAR = 365.242189
 
@@ -235,9 +236,34 @@ def obliquity(t: float) -> float:
     c = julian_centuries(t)
     return Polynomial(OBLIQUITY)(c)
 
-def declination(t: float, beta:float, lambda1: float):
+def declination(t: float, beta: float, lambda1: float) -> float:
+    """
+    Declination of a point of celestial latitude beta and longitude lambda1: its angular distance
+    from the celestial equator.
+    RDM (12.24).
+    :param t: The moment (RD).
+    :param beta: The celestial latitude, in degrees.
+    :param lambda1: The celestial longitude, in degrees.
+    :return: The declination, in degrees.
+    """
+    epsilon = obliquity(t)
+
+    return math.asin(sind(beta) * cosd(epsilon) + cosd(beta) * sind(epsilon) * sind(lambda1)) / tools.DEGREE
+
+
+def right_ascension(t: float, beta: float, lambda1: float) -> float:
+    """
+    Right ascension of a point of celestial latitude beta and longitude lambda1: its angle along the celestial
+    equator from the vernal equinox (the equatorial counterpart of the longitude, as the declination is of the latitude).
+    :param t: The moment (RD).
+    :param beta: The celestial latitude, in degrees.
+    :param lambda1: The celestial longitude, in degrees.
+    :return: The right ascension, in degrees, in [0, 360).
+    """
     epsilon = obliquity(t)
-    return math.asin(math.sin(beta) * math.cos(epsilon) + math.cos(beta) * math.sin(epsilon) * math.sin(lambda1))
+    alpha = math.atan2(sind(lambda1) * cosd(epsilon) - tools.tand(beta) * sind(epsilon), cosd(lambda1))
+
+    return tools.fmod(alpha / tools.DEGREE, 360)
 
 
 def equation_of_time(t: float) -> float:
@@ -308,11 +334,11 @@ def midday(t_apparent: float, location: Location) -> float:
 def solar_to_sidereal(t: float) -> float:
     """
     Conversion of mean solar time to mean sidereal time.
-    RDM (12.22).
+    RDM (12.22): sidereal time follows the rotation of the Earth, hence universal time, without ephemeris correction.
     :param t: Mean solar time.
     :return: Mean sidereal time, in degrees.
     """
-    c = julian_centuries(t)
+    c = (t - J2000) / 36525
 
     result = Polynomial(SIDEREAL)(c)
 
@@ -378,6 +404,385 @@ def estimate_prior_solar_longitude(t: float, solar_longitude_value: float) -> fl
     return np.minimum(t, tau - rate * delta)
 
 
+# region Bulk (vectorized) calculations
+# The table evaluated by solar_longitudes instead of the series, if any (see set_solar_longitude_backend).
+_solar_longitude_table = None
+
+# The ephemeris corrections of the years _ephemeris_table_first_year, _ephemeris_table_first_year + 1, ...
+_ephemeris_table_first_year = 2000
+_ephemeris_table = np.empty(0)
+
+# The table covers at most the Gregorian years EPHEMERIS_TABLE_YEARS (inclusive).
+EPHEMERIS_TABLE_YEARS = (-100000, 100000)
+
+
+def ephemeris_corrections(t) -> np.ndarray:
+    """
+    Vectorized ephemeris_correction. The correction depends on the Gregorian year only: it is calculated once
+    per year and kept in a table (extended as needed, within EPHEMERIS_TABLE_YEARS) for the lifetime of the process,
+    so repeated calls (e.g. the iterations of a root finding) only index it. Moments outside the years of the table
+    get the scalar ephemeris_correction, and moments which are not finite NaN.
+    :param t: Array of moments (RD).
+    :return: Array of ephemeris corrections, in days.
+    """
+    global _ephemeris_table, _ephemeris_table_first_year
+
+    t = np.asarray(t, dtype=np.float64)
+    result = np.full(t.shape, np.nan)
+
+    first_rd, end_rd = tools.gregorian_new_years(np.array([EPHEMERIS_TABLE_YEARS[0], EPHEMERIS_TABLE_YEARS[1] + 1]))
+    inside = (first_rd <= t) & (t < end_rd)
+    outside = np.isfinite(t) & ~inside
+
+    years = tools.gregorian_years_from_rata_die(np.floor(t[inside]).astype(np.int64))
+
+    if years.size:
+        first_year = min(int(years.min()), _ephemeris_table_first_year)
+        last_year = max(int(years.max()), _ephemeris_table_first_year + len(_ephemeris_table) - 1)
+
+        if first_year < _ephemeris_table_first_year or len(_ephemeris_table) < last_year - first_year + 1:
+            table_years = np.arange(first_year, last_year + 1)
+            known = (_ephemeris_table_first_year <= table_years) & \
+                (table_years < _ephemeris_table_first_year + len(_ephemeris_table))
+
+            table = np.empty(len(table_years))
+            table[known] = _ephemeris_table
+            table[~known] = [ephemeris_correction(new_year) for new_year in
+                             tools.gregorian_new_years(table_years[~known]).tolist()]
+
+            _ephemeris_table, _ephemeris_table_first_year = table, first_year
+
+        result[inside] = _ephemeris_table[years - _ephemeris_table_first_year]
+
+    if np.any(outside):
+        moments, inverse = np.unique(t[outside], return_inverse=True)
+        result[outside] = np.array([ephemeris_correction(moment) for moment in moments.tolist()])[inverse]
+
+    return result
+
+
+def solar_longitudes(t) -> np.ndarray:
+    """
+    Vectorized solar_longitude.
+    RDM (12.25), or the Chebyshev table selected by set_solar_longitude_backend.
+    :param t: Array of moments (RD, universal time).
+    :return: Array of solar longitudes, in degrees.
+    """
+    t = np.asarray(t, dtype=np.float64)
+
+    return _solar_longitudes_dynamic(t + ephemeris_corrections(t))
+
+
+def solar_longitudes_at_centuries(c) -> np.ndarray:
+    """
+    The series of RDM (12.25) as a function of dynamical time, not reduced modulo 360: a smooth function,
+    from which the Chebyshev table of solar_longitude_table is fitted.
+    :param c: Array of Julian centuries (dynamical time) since J2000.
+    :return: Array of solar longitudes, in degrees, increasing by 360 every tropical year.
+    """
+    c = np.asarray(c, dtype=np.float64)
+
+    arguments = tools.DEGREE * (np.multiply.outer(c, SOLAR_LONGITUDE_Y) + SOLAR_LONGITUDE_Z)
+    s = np.sin(arguments) @ np.array(SOLAR_LONGITUDE_X, dtype=np.float64)
+
+    return 282.7771834 + 36000.76953744 * c + 0.000005729577951308232 * s + _aberrations(c) + _nutations(c)
+
+
+def set_solar_longitude_backend(backend: str = "series", path: str = None) -> None:
+    """
+    Selects how solar_longitudes (and the root finding built on it) evaluates the solar longitude.
+    :param backend: "series" for the 49-term series of RDM (12.25), the reference;
+    "chebyshev" for the piecewise Chebyshev table of solar_longitude_table (years -3000 to 3000, maximum error
+    below 1e-8 degrees versus the series), loaded from path or built and saved there on first use.
+    Moments outside the table are evaluated by the series.
+    :param path: The table file (by default solar_longitude_table.DEFAULT_PATH).
+    :exception ValueError: Raised for an unknown backend.
+    """
+    global _solar_longitude_table
+
+    if backend == "series":
+        _solar_longitude_table = None
+    elif backend == "chebyshev":
+        import solar_longitude_table
+        _solar_longitude_table = solar_longitude_table.load_or_build(path or solar_longitude_table.DEFAULT_PATH)
+    else:
+        raise ValueError(f"Unknown solar longitude backend '{backend}': 'series' or 'chebyshev'")
+
+
+def equations_of_time(t) -> np.ndarray:
+    """
+    Vectorized equation_of_time: the coefficient polynomials are evaluated with polyval on the whole array,
+    and the ephemeris correction once per distinct year.
+    :param t: Array of moments (RD).
+    :return: Array of the equations of time, in days.
+    """
+    t = np.asarray(t, dtype=np.float64)
+
+    return _equations_of_time((t + ephemeris_corrections(t) - J2000) / 36525)
+
+
+def local_to_apparent_times(t_local) -> np.ndarray:
+    """
+    Vectorized local_to_apparent.
+    RDM (12.18).
+    :param t_local: Array of local times, days.
+    :return: Array of apparent times, days.
+    """
+    t_local = np.asarray(t_local, dtype=np.float64)
+
+    return t_local + equations_of_time(t_local)
+
+
+def apparent_to_local_times(t_apparent) -> np.ndarray:
+    """
+    Vectorized apparent_to_local.
+    RDM (12.19).
+    :param t_apparent: Array of apparent times, days.
+    :return: Array of local times, days.
+    """
+    t_apparent = np.asarray(t_apparent, dtype=np.float64)
+
+    return t_apparent - equations_of_time(t_apparent)
+
+
+def midnights(t_apparent, locations) -> np.ndarray:
+    """
+    Vectorized midnight, broadcasting the moments against the locations: e.g. t[:, np.newaxis] for one row per day
+    and one column per location. The equation of time is calculated once per moment, not per location.
+    RDM (12.20).
+    :param t_apparent: Array of apparent times.
+    :param locations: A location, or a sequence (or array) of locations.
+    :return: Array of the standard times of the midnights.
+    """
+    _, longitude, _, zone = location_arrays(locations)
+
+    return apparent_to_local_times(t_apparent) - longitude / 360 + zone / 24
+
+
+def middays(t_apparent, locations) -> np.ndarray:
+    """
+    Vectorized midday, broadcasting the moments against the locations (see midnights).
+    RDM (12.21).
+    :param t_apparent: Array of apparent times.
+    :param locations: A location, or a sequence (or array) of locations.
+    :return: Array of the standard times of the middays.
+    """
+    _, longitude, _, zone = location_arrays(locations)
+
+    return apparent_to_local_times(np.asarray(t_apparent, dtype=np.float64) + 0.5) - longitude / 360 + zone / 24
+
+
+def sidereal_times(t) -> np.ndarray:
+    """
+    Vectorized solar_to_sidereal: mean sidereal time at Greenwich.
+    RDM (12.22).
+    :param t: Array of moments (RD, universal time).
+    :return: Array of mean sidereal times, in degrees.
+    """
+    c = (np.asarray(t, dtype=np.float64) - J2000) / 36525
+
+    return np.mod(polyval(c, SIDEREAL), 360)
+
+
+def local_sidereal_times(t, longitude) -> np.ndarray:
+    """
+    Mean sidereal time at given longitudes, broadcasting the moments against the longitudes: e.g. t[:, np.newaxis]
+    for one row per moment and one column per site (the longitudes of locations are given by location_arrays).
+    :param t: Array of moments (RD, universal time).
+    :param longitude: Array of longitudes, in degrees (east positive).
+    :return: Array of local mean sidereal times, in degrees.
+    """
+    return np.mod(sidereal_times(t) + np.asarray(longitude, dtype=np.float64), 360)
+
+
+def declinations(t, beta, lambda1) -> np.ndarray:
+    """
+    Vectorized declination, broadcasting the moments against the coordinates; the obliquity is evaluated
+    once per moment.
+    RDM (12.24).
+    :param t: Array of moments (RD).
+    :param beta: Array of celestial latitudes, in degrees.
+    :param lambda1: Array of celestial longitudes, in degrees.
+    :return: Array of declinations, in degrees.
+    """
+    return _equatorial_coordinates(obliquities(t), beta, lambda1)[0]
+
+
+def right_ascensions(t, beta, lambda1) -> np.ndarray:
+    """
+    Vectorized right_ascension, broadcasting the moments against the coordinates; the obliquity is evaluated
+    once per moment.
+    :param t: Array of moments (RD).
+    :param beta: Array of celestial latitudes, in degrees.
+    :param lambda1: Array of celestial longitudes, in degrees.
+    :return: Array of right ascensions, in degrees, in [0, 360).
+    """
+    return _equatorial_coordinates(obliquities(t), beta, lambda1)[1]
+
+
+def obliquities(t) -> np.ndarray:
+    """
+    Vectorized obliquity.
+    RDM (12.23).
+    :param t: Array of moments (RD).
+    :return: Array of obliquities of the ecliptic, in degrees.
+    """
+    t = np.asarray(t, dtype=np.float64)
+
+    return _obliquities((t + ephemeris_corrections(t) - J2000) / 36525)
+
+
+def solar_longitude_after(longitude: float, start, end, precision: float = 1e-8) -> np.ndarray:
+    """
+    Batched root finding: the moments at which the sun reaches a longitude, one per interval, found by a bisection
+    run on all intervals at once. Each interval must contain exactly one such moment and span less than half a year.
+    :param longitude: The solar longitude, in degrees (e.g. AUTUMN).
+    :param start: Array of the starts of the intervals (RD, universal time).
+    :param end: Array of the ends of the intervals.
+    :param precision: The precision of the result, in days.
+    :return: Array of the moments (RD, universal time).
+    :exception ValueError: Raised if an interval does not contain the moment.
+    """
+    def signed_distance(t: np.ndarray) -> np.ndarray:
+        return np.mod(solar_longitudes(t) - longitude + 180, 360) - 180
+
+    low = np.array(start, dtype=np.float64)
+    high = np.array(end, dtype=np.float64)
+
+    if np.any(signed_distance(low) > 0) or np.any(signed_distance(high) < 0):
+        raise ValueError(f"An interval does not contain the moment of solar longitude {longitude}")
+
+    while np.max(high - low) > precision:
+        middle = (low + high) / 2
+        before = signed_distance(middle) < 0
+        low = np.where(before, middle, low)
+        high = np.where(before, high, middle)
+
+    return (low + high) / 2
+
+
+class SolarState:
+    """
+    Preliminary declaration.
+    """
+    pass
+
+
+@dataclass(frozen=True)
+class SolarState:
+    """
+    The solar quantities of moments, computed together from a single evaluation of the Julian centuries
+    (and so of the ephemeris correction). Scalars for a scalar moment, arrays for an array of moments.
+    """
+    c: np.ndarray                   # Julian centuries (dynamical time) since J2000.
+    longitude: np.ndarray           # Solar longitude, degrees: RDM (12.25).
+    obliquity: np.ndarray           # Obliquity of the ecliptic, degrees: RDM (12.23).
+    declination: np.ndarray         # Declination of the sun, degrees: RDM (12.24) with latitude 0.
+    right_ascension: np.ndarray     # Right ascension of the sun, degrees.
+    nutation: np.ndarray            # Nutation, degrees: RDM (12.26).
+    aberration: np.ndarray          # Aberration, degrees: RDM (12.27).
+    equation_of_time: np.ndarray    # Equation of time, days.
+
+    @classmethod
+    def at(cls, t) -> SolarState:
+        """
+        Computes the solar state of a moment or an array of moments.
+        :param t: The moment(s) (RD, universal time).
+        :return: The solar state.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        t_dynamic = t + ephemeris_corrections(t)
+        c = (t_dynamic - J2000) / 36525
+
+        longitude = _solar_longitudes_dynamic(t_dynamic)
+        obliquity = _obliquities(c)
+        declination, right_ascension = _equatorial_coordinates(obliquity, 0, longitude)
+
+        # 0-d arrays are returned as scalars.
+        return cls(c[()], longitude[()], obliquity[()], declination[()], right_ascension[()], _nutations(c)[()],
+                   _aberrations(c)[()], _equations_of_time(c)[()])
+
+
+def _solar_longitudes_dynamic(t_dynamic: np.ndarray) -> np.ndarray:
+    """
+    Solar longitudes at dynamical moments, by the selected backend (see set_solar_longitude_backend).
+    :param t_dynamic: Array of moments (RD, dynamical time).
+    :return: Array of solar longitudes, in degrees.
+    """
+    if _solar_longitude_table is not None:
+        return np.mod(_solar_longitude_table.evaluate(t_dynamic), 360)
+
+    return np.mod(solar_longitudes_at_centuries((t_dynamic - J2000) / 36525), 360)
+
+
+def _obliquities(c: np.ndarray) -> np.ndarray:
+    """
+    Vectorized obliquity, of Julian centuries.
+    RDM (12.23).
+    """
+    return polyval(c, OBLIQUITY)
+
+
+def _equatorial_coordinates(obliquity, beta, lambda1) -> (np.ndarray, np.ndarray):
+    """
+    Declinations and right ascensions of ecliptic coordinates, for given obliquities.
+    RDM (12.24).
+    :param obliquity: Array of obliquities of the ecliptic, in degrees.
+    :param beta: Array of celestial latitudes, in degrees.
+    :param lambda1: Array of celestial longitudes, in degrees.
+    :return: Arrays of declinations and right ascensions, in degrees.
+    """
+    epsilon = tools.DEGREE * np.asarray(obliquity, dtype=np.float64)
+    beta = tools.DEGREE * np.asarray(beta, dtype=np.float64)
+    lambda1 = tools.DEGREE * np.asarray(lambda1, dtype=np.float64)
+
+    sin_epsilon, cos_epsilon = np.sin(epsilon), np.cos(epsilon)
+    sin_lambda = np.sin(lambda1)
+
+    delta = np.arcsin(np.sin(beta) * cos_epsilon + np.cos(beta) * sin_epsilon * sin_lambda)
+    alpha = np.arctan2(sin_lambda * cos_epsilon - np.tan(beta) * sin_epsilon, np.cos(lambda1))
+
+    return delta / tools.DEGREE, np.mod(alpha / tools.DEGREE, 360)
+
+
+def _aberrations(c: np.ndarray) -> np.ndarray:
+    """
+    Vectorized aberration, of Julian centuries.
+    RDM (12.27).
+    """
+    return 0.0000974 * np.cos(tools.DEGREE * (177.63 + 35999.01848 * c)) - 0.005575
+
+
+def _nutations(c: np.ndarray) -> np.ndarray:
+    """
+    Vectorized nutation, of Julian centuries.
+    RDM (12.26).
+    """
+    a = 124.90 + c * (-1934.134 + 0.002063 * c)
+    b = 201.11 + c * (72001.5377 + 0.00057 * c)
+
+    return -0.004778 * np.sin(a * tools.DEGREE) - 0.0003667 * np.sin(b * tools.DEGREE)
+
+
+def _equations_of_time(c: np.ndarray) -> np.ndarray:
+    """
+    Vectorized equation_of_time, of Julian centuries.
+    """
+    longitude = polyval(c, ET_LONGITUDE)
+    anomaly = polyval(c, ET_ANOMALY)
+    eccentricity = polyval(c, ET_ECCENTRICITY)
+    y = np.tan(tools.DEGREE * 0.5 * _obliquities(c)) ** 2
+
+    sin_anomaly = np.sin(tools.DEGREE * anomaly)
+
+    et = y * np.sin(tools.DEGREE * 2 * longitude) - 2.0 * eccentricity * sin_anomaly + \
+        4 * eccentricity * y * sin_anomaly * np.cos(tools.DEGREE * 2 * longitude) - \
+        0.5 * y ** 2 * np.sin(tools.DEGREE * 4 * longitude) - 1.25 * eccentricity ** 2 * np.sin(tools.DEGREE * 2 * anomaly)
+
+    return et / (2 * math.pi)
+# endregion
+
+
 if __name__ == '__main__':
 
     year = 2023
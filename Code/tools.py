@@ -1,3 +1,4 @@
+import datetime
 import math
 from typing import Callable
 
@@ -30,6 +31,7 @@ MAYAN_HAAB_EPOCH = -1137490
 MODIFIED_JULIAN_DAY_EPOCH = 678576
 PERSIAN_EPOCH = 226896
 TIBETAN_EPOCH = -46410
+UNIX_EPOCH = 719163
 WESTERN_BAHAI_EPOCH = 673222
 ZOROASTRIAN_EPOCH = 230638
 
@@ -219,6 +221,53 @@ def gregorian_year_from_rata_die(t: float) -> float:
     return year
 
 
+def to_rata_die_array(t) -> np.ndarray:
+    """
+    Converts RD values (a scalar, a list, or an array, possibly of fractional moments) to an array of whole RD days.
+    datetime64 arrays are accepted as well and converted to the RD days of their dates.
+    :param t: The RD values, or datetime64 values.
+    :return: Array of int64 RD days (the fractional part, if any, is floored away).
+    """
+    t = np.asarray(t)
+
+    if np.issubdtype(t.dtype, np.datetime64):
+        return t.astype("datetime64[D]").astype(np.int64) + UNIX_EPOCH
+
+    if np.issubdtype(t.dtype, np.floating):
+        t = np.floor(t)
+
+    return t.astype(np.int64)
+
+
+def gregorian_years_from_rata_die(t: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of gregorian_year_from_rata_die for arrays of whole RD days.
+    RDM (2.18).
+    :param t: Array of RD days (int64).
+    :return: Array of Gregorian years (int64).
+    """
+    d0 = t - 1
+    n400, d1 = np.divmod(d0, 146097)
+    n100, d2 = np.divmod(d1, 36524)
+    n4, d3 = np.divmod(d2, 1461)
+    n1 = d3 // 365
+
+    year = 400 * n400 + 100 * n100 + 4 * n4 + n1
+
+    return year + ((n100 != 4) & (n1 != 4))
+
+
+def gregorian_new_years(years: np.ndarray) -> np.ndarray:
+    """
+    RD days of January 1st of an array of Gregorian years.
+    RDM (2.17) with month = day = 1.
+    :param years: Array of Gregorian years (int64).
+    :return: Array of RD days (int64).
+    """
+    y = np.asarray(years, dtype=np.int64) - 1
+    return GREGORIAN_EPOCH + 365 * y + y // 4 - y // 100 + y // 400
+
+
 # region Leap years
 def is_gregorian_leap_year(gregorian_year: int) -> bool:
     """
@@ -313,6 +362,191 @@ def n_th_k_day(n: int, k: int, t: float):
 
 # endregion
 
+# region datetime interop
+def datetime64_to_moments(t) -> np.ndarray:
+    """
+    Converts numpy datetime64 values (of any unit: D, s, ms, us, ns, ...) to RD moments.
+    The days and the time of day are separated in integer arithmetic before the conversion to float,
+    so the moments keep the precision of float64 around the RD value (about 10 microseconds).
+    datetime64 values carry no time zone: the moments are in whatever time the values are (usually UTC).
+    :param t: The datetime64 values (array or scalar).
+    :return: Array of RD moments (float64); NaT gives NaN.
+    """
+    t = np.asarray(t)
+    unit, count = np.datetime_data(t.dtype)
+
+    if unit in ["Y", "M", "W"]:
+        t = t.astype("datetime64[D]")
+        unit, count = "D", 1
+
+    units_per_day = np.timedelta64(1, "D") // np.timedelta64(count, unit)
+    days, units = np.divmod(t.view(np.int64), units_per_day)
+
+    result = (days + UNIX_EPOCH) + units / units_per_day
+
+    return np.where(np.isnat(t), np.nan, result)
+
+
+def moments_to_datetime64(t, unit: str = "ns") -> np.ndarray:
+    """
+    Converts RD moments to numpy datetime64 values, rounded to the unit.
+    Mind the range of the unit: datetime64[ns] holds the years 1678 to 2261 only.
+    :param t: The RD moments (array or scalar).
+    :param unit: The datetime64 unit of the result, e.g. "D", "s", "ms", "us", "ns".
+    :return: Array of datetime64[unit] values; NaN gives NaT.
+    """
+    t = np.asarray(t, dtype=np.float64)
+    missing = np.isnan(t)
+    t = np.where(missing, UNIX_EPOCH, t)
+
+    units_per_day = np.timedelta64(1, "D") // np.timedelta64(1, unit)
+    days = np.floor(t)
+
+    units = (days.astype(np.int64) - UNIX_EPOCH) * units_per_day + \
+        np.round((t - days) * units_per_day).astype(np.int64)
+
+    result = units.view(f"datetime64[{unit}]")
+    result[missing] = np.datetime64("NaT")
+
+    return result
+
+
+def datetime_to_moment(value: datetime.date) -> float:
+    """
+    Converts a Python datetime (or date) to an RD moment.
+    Datetimes are taken by their local time: the time zone of aware ones is dropped, as by the .diebus accessor
+    of pandas Series, so that a date falls on the calendar day of the place it is given for.
+    :param value: The datetime or date.
+    :return: The RD moment.
+    """
+    if isinstance(value, datetime.datetime):
+        seconds = 3600 * value.hour + 60 * value.minute + value.second + value.microsecond / 1000000
+
+        return value.toordinal() + seconds / 86400
+
+    # Python's proleptic Gregorian ordinals are RD values (January 1st of year 1 is 1 in both).
+    return value.toordinal()
+
+
+def moment_to_datetime(t: float) -> datetime.datetime:
+    """
+    Converts an RD moment to a naive Python datetime, rounded to the microsecond.
+    :param t: The RD moment (of the years 1 to 9999, the range of datetime).
+    :return: The datetime.
+    """
+    day = math.floor(t)
+
+    return datetime.datetime.fromordinal(day) + datetime.timedelta(microseconds=round((t - day) * 86400000000))
+# endregion
+
+# region Julian day numbers
+# JD and MJD values work with scalars as well as with NumPy arrays.
+def moment_from_jd(jd):
+    """
+    Converts a Julian day number (JD) to an RD moment.
+    RDM (1.3).
+    :param jd: The JD value(s).
+    :return: The RD moment(s).
+    """
+    return jd + JULIAN_DAY_EPOCH
+
+
+def jd_from_moment(t):
+    """
+    Converts an RD moment to a Julian day number (JD).
+    RDM (1.4).
+    :param t: The RD moment(s).
+    :return: The JD value(s).
+    """
+    return t - JULIAN_DAY_EPOCH
+
+
+def moment_from_mjd(mjd):
+    """
+    Converts a Modified Julian day number (MJD) to an RD moment.
+    RDM (1.5).
+    :param mjd: The MJD value(s).
+    :return: The RD moment(s).
+    """
+    return mjd + MODIFIED_JULIAN_DAY_EPOCH
+
+
+def mjd_from_moment(t):
+    """
+    Converts an RD moment to a Modified Julian day number (MJD).
+    RDM (1.6).
+    :param t: The RD moment(s).
+    :return: The MJD value(s).
+    """
+    return t - MODIFIED_JULIAN_DAY_EPOCH
+
+
+def rd_pair_from_jd(jd1, jd2=0.0) -> (np.ndarray, np.ndarray):
+    """
+    Converts a two-part Julian day number (jd1 + jd2, as in astronomical software) to an RD day and a time of day.
+    A single float JD near 2.5 million resolves only about 40 microseconds; in the two-part form the day comes out
+    as an exact integer, and the fraction keeps the precision of jd2.
+    :param jd1: The JD values, or their larger part (e.g. the integer or half-integer part).
+    :param jd2: The smaller part of the JD values (e.g. the fractions of the day).
+    :return: Arrays of RD days (int64) and of the fractions of the day in [0, 1) (float64).
+    """
+    return _split_day(jd1, jd2, JULIAN_DAY_EPOCH)
+
+
+def jd_from_rd_pair(day, fraction=0.0) -> (np.ndarray, np.ndarray):
+    """
+    Converts an RD day and a time of day to a two-part Julian day number.
+    :param day: The RD days.
+    :param fraction: The fractions of the day.
+    :return: Arrays of the larger (whole and half days, exact) and the smaller part of the JD values.
+    """
+    day, fraction = np.broadcast_arrays(np.asarray(day, dtype=np.float64), np.asarray(fraction, dtype=np.float64))
+
+    return day - JULIAN_DAY_EPOCH, fraction.copy()
+
+
+def rd_pair_from_mjd(mjd1, mjd2=0.0) -> (np.ndarray, np.ndarray):
+    """
+    Converts a two-part Modified Julian day number (mjd1 + mjd2) to an RD day and a time of day.
+    :param mjd1: The MJD values, or their larger part.
+    :param mjd2: The smaller part of the MJD values.
+    :return: Arrays of RD days (int64) and of the fractions of the day in [0, 1) (float64).
+    """
+    return _split_day(mjd1, mjd2, MODIFIED_JULIAN_DAY_EPOCH)
+
+
+def mjd_from_rd_pair(day, fraction=0.0) -> (np.ndarray, np.ndarray):
+    """
+    Converts an RD day and a time of day to a two-part Modified Julian day number.
+    :param day: The RD days.
+    :param fraction: The fractions of the day.
+    :return: Arrays of the whole days and of the fractions of the MJD values.
+    """
+    day, fraction = np.broadcast_arrays(np.asarray(day, dtype=np.float64), np.asarray(fraction, dtype=np.float64))
+
+    return day - MODIFIED_JULIAN_DAY_EPOCH, fraction.copy()
+
+
+def _split_day(value1, value2, epoch: float) -> (np.ndarray, np.ndarray):
+    """
+    Splits a two-part day count with the given RD epoch into RD days and fractions of the day.
+    Only exact operations are applied to the large parts: taking the integer part, and adding small integers.
+    :param value1: The larger parts of the day counts.
+    :param value2: The smaller parts of the day counts.
+    :param epoch: The RD moment of day count 0.
+    :return: Arrays of RD days (int64) and of the fractions of the day in [0, 1) (float64).
+    """
+    value1 = np.asarray(value1, dtype=np.float64)
+    whole1 = np.floor(value1)
+    whole_epoch = math.floor(epoch)
+
+    # Everything below one day (plus the fractional part of the epoch) is summed separately.
+    fraction = (value1 - whole1) + np.asarray(value2, dtype=np.float64) + (epoch - whole_epoch)
+    days = np.floor(fraction)
+
+    return whole1.astype(np.int64) + whole_epoch + days.astype(np.int64), fraction - days
+# endregion
+
 # region Miscellaneous Helpers
 def datetime_data_to_moment(ymdhmsm: list[int]) -> float:
     """